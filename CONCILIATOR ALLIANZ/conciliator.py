@@ -4,11 +4,21 @@ Sistema de conciliación entre archivos Celer y Allianz
 Identifica pólizas que requieren conciliación
 """
 
+import importlib
+import importlib.machinery
+import multiprocessing
+import os
 import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import numpy as np
 import pandas as pd
+from pandas.io.parsers import TextParser
 import logging
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Tuple
 
 # Configure logging
@@ -19,6 +29,227 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Parsed inputs are cached with the transformer's parse cache when available
+_TRANSFORMER_DIR = Path(__file__).parent.parent / "TRANSFORMER CELER"
+
+
+@lru_cache(maxsize=None)
+def transformer_adapter(name: str):
+    """
+    Import a module of the transformer's adapters package on first use
+    
+    The transformer directory is appended to sys.path, not prepended, and
+    only when an adapter is needed, so importing the conciliator never
+    shadows other packages named adapters, schemas or services.
+    
+    Args:
+        name: Module name ('parse_cache', 'progress')
+        
+    Returns:
+        The module, or None if the transformer is not available
+    """
+    if str(_TRANSFORMER_DIR) not in sys.path:
+        sys.path.append(str(_TRANSFORMER_DIR))
+    try:
+        return importlib.import_module(f"adapters.{name}")
+    except ImportError:
+        return None
+
+
+def _read_with_cache(file_path: Path, reader: str, parse, options: Optional[dict] = None,
+                     use_cache: bool = True) -> pd.DataFrame:
+    """
+    Parse a file through the shared parse cache (parse directly if unavailable)
+    
+    Args:
+        file_path: Input file
+        reader: Reader name and version used in the cache key
+        parse: Callable returning the parsed DataFrame
+        options: Reader options used in the cache key
+        use_cache: Set to False to bypass the cache
+        
+    Returns:
+        Parsed DataFrame
+    """
+    parse_cache = transformer_adapter('parse_cache')
+    if parse_cache is None:
+        return parse()
+    return parse_cache.get_parse_cache().get_or_parse(file_path, reader, parse, options=options, use_cache=use_cache)
+
+
+# Repetitive text columns of the transformed Celer file, read as category
+CELER_CATEGORY_COLUMNS = ['Tipo_Doc', 'Aseguradora', 'Ramo', 'Ejecutivo', 'Unidad']
+
+# Columnar copies the transformer can write next to its workbook, in preference order
+CELER_SIDECAR_SUFFIXES = ('.parquet', '.feather')
+
+
+def find_celer_sidecar(celer_file: Path) -> Optional[Path]:
+    """
+    Columnar copy (Parquet/Feather) of a transformed Celer workbook
+    
+    Args:
+        celer_file: Transformed Celer workbook
+        
+    Returns:
+        Sidecar path, or None if there is none at least as recent as the workbook
+    """
+    workbook_mtime = celer_file.stat().st_mtime
+    for suffix in CELER_SIDECAR_SUFFIXES:
+        sidecar = celer_file.with_suffix(suffix)
+        if sidecar.exists() and sidecar.stat().st_mtime >= workbook_mtime:
+            return sidecar
+    return None
+
+
+def read_celer_sidecar(sidecar: Path) -> Optional[pd.DataFrame]:
+    """
+    Read a Celer sidecar written by the transformer
+    
+    Args:
+        sidecar: Parquet or Feather file
+        
+    Returns:
+        DataFrame with the transformed Celer data, or None if it cannot be read
+        (pyarrow missing, damaged file), in which case the workbook is used
+    """
+    try:
+        if sidecar.suffix == '.parquet':
+            df = pd.read_parquet(sidecar)
+        else:
+            df = pd.read_feather(sidecar)
+    except Exception as e:
+        logger.warning(f"Could not read sidecar {sidecar.name}, reading the Excel file: {e}")
+        return None
+    return with_celer_categories(df)
+
+
+def with_celer_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store the repetitive Celer text columns as category, as the Excel read does
+    
+    Args:
+        df: Transformed Celer data
+        
+    Returns:
+        The same DataFrame
+    """
+    for column in CELER_CATEGORY_COLUMNS:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype('category')
+    return df
+
+
+# Day 0 of Excel serial dates (not 1900-01-01 due to the Excel leap year bug)
+EXCEL_EPOCH = '1899-12-30'
+
+
+def excel_serial_to_datetime(column: pd.Series) -> pd.Series:
+    """
+    Convert an Excel serial date column (days since 1899-12-30) to datetime64
+    
+    Used for the Allianz date columns (F.INI VIG, F.FIN VIG, F. Límite Pago).
+    Serial numbers keep whole days only, as int() of the serial. Cells
+    already read as dates are kept, and text is read as a serial number
+    when numeric and as a date otherwise. Anything else, including dates
+    out of range, becomes NaT.
+    
+    Args:
+        column: Date column (numeric, datetime or object)
+        
+    Returns:
+        datetime64 Series aligned with column
+    """
+    if pd.api.types.is_datetime64_any_dtype(column):
+        return column
+    
+    serials = pd.to_numeric(column, errors='coerce').astype('float64')
+    # Cells that are not numbers: dates, or date text
+    others = serials.isna() & column.notna()
+    
+    serials = serials.where(np.isfinite(serials))
+    dates = pd.to_datetime(np.trunc(serials), unit='D', origin=EXCEL_EPOCH, errors='coerce')
+    if others.any():
+        dates[others] = pd.to_datetime(column[others], errors='coerce', format='mixed')
+    return dates
+
+
+def contains_allianz(column: pd.Series) -> pd.Series:
+    """
+    Mask of rows whose insurer name contains 'ALLIANZ' (case-insensitive)
+    
+    For category columns the text match runs once per distinct value
+    instead of once per row.
+    
+    Args:
+        column: Insurer column (object or category)
+        
+    Returns:
+        Boolean Series aligned with column (empty values are False)
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        categories = column.cat.categories.astype(str)
+        matches = categories.str.upper().str.contains('ALLIANZ', na=False)
+        return column.cat.codes.isin([code for code, match in enumerate(matches) if match])
+    return column.str.upper().str.contains('ALLIANZ', na=False)
+
+
+class _ColumnBuffer:
+    """
+    Values of one projected column, in the narrowest buffer that holds them
+    
+    Numbers are kept in an int64 array, widened to float64 when a decimal
+    value shows up; anything else turns the buffer into a list of objects.
+    Empty cells are recorded by position so the column can be typed the way
+    pd.read_excel types it.
+    """
+    
+    def __init__(self):
+        self.values = array('q')
+        self.missing = array('q')
+        self.length = 0
+    
+    def append(self, value) -> None:
+        # Whole numbers are ints, as pd.read_excel converts them (pyxlsb reads floats)
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        if value is None or value == '':
+            self.missing.append(self.length)
+            value = 0 if self.is_numeric else ''
+        elif self.is_numeric:
+            if isinstance(value, bool) or not isinstance(value, (int, float)) \
+                    or (isinstance(value, int) and not -2**63 <= value < 2**63):
+                self._to_objects()
+            elif isinstance(value, float) and self.values.typecode == 'q':
+                self.values = array('d', self.values)
+        self.values.append(value)
+        self.length += 1
+    
+    def _to_objects(self) -> None:
+        # Whole floats in a float64 buffer were read as ints
+        self.values = [int(value) if value.is_integer() else value for value in self.values.tolist()] \
+            if self.values.typecode == 'd' else self.values.tolist()
+        for position in self.missing:
+            self.values[position] = ''
+    
+    @property
+    def is_numeric(self) -> bool:
+        return isinstance(self.values, array)
+    
+    def to_numpy(self) -> np.ndarray:
+        """Numeric values, float64 with NaN if any cell is empty"""
+        if not self.missing:
+            return np.array(self.values, dtype=self.values.typecode)
+        values = np.array(self.values, dtype=np.float64)
+        values[np.array(self.missing, dtype=np.int64)] = np.nan
+        return values
+    
+    def to_list(self) -> list:
+        """Values as read, with '' for empty cells"""
+        if self.is_numeric:
+            self._to_objects()
+        return self.values
+
 
 class AllianzExcelReader:
     """
@@ -35,47 +266,122 @@ class AllianzExcelReader:
         "F. Límite Pago", "Comisión Vencida", "Proporción Vencida", "Cartera Total"
     ]
     
-    def __init__(self, file_path: Path):
+    # Columns AllianzConciliator reads from the reports
+    CONCILIATION_COLUMNS = ["Póliza", "Recibo", "F.INI VIG", "Cliente - Tomador", "Cartera Total"]
+    
+    # Distinctive header names, a row with at least 2 of them is the header row
+    HEADER_KEY_COLUMNS = ["Cliente - Tomador", "Póliza", "Nombre Macroramo"]
+    
+    # Bump when read_excel_with_auto_detection changes its output (parse cache key)
+    READER_VERSION = 2
+    
+    # Bump when read_projected_columns changes its output (parse cache key)
+    PROJECTED_READER_VERSION = 1
+    
+    def __init__(self, file_path: Path, progress=None, usecols: Optional[list] = None):
         """
         Initialize the Excel reader
         
         Args:
             file_path: Path to the Excel file (.xlsb or .xlsx)
+            progress: Progress callback (done, total) in bytes read (optional)
+            usecols: Names of the columns to keep (default: all)
         """
         self.file_path = file_path
+        self.progress = progress
+        self.usecols = usecols
         self.df: Optional[pd.DataFrame] = None
         self.sheet_name: Optional[str] = None
         self.header_row: Optional[int] = None
         
-    def detect_sheet_name(self) -> str:
+    def _progress_reporter(self):
+        """ProgressReporter counting the bytes read from the file (None without a callback)"""
+        progress = transformer_adapter('progress')
+        if self.progress is None or progress is None:
+            return None
+        return progress.ProgressReporter(self.progress, Path(self.file_path).stat().st_size)
+    
+    @contextmanager
+    def _open_workbook(self, reporter):
+        """
+        Open the workbook with pyxlsb, counting the bytes read when reporting progress
+        
+        Args:
+            reporter: ProgressReporter, or None
+            
+        Yields:
+            Open ExcelFile, closed on exit
+        """
+        if reporter is None:
+            with pd.ExcelFile(self.file_path, engine='pyxlsb') as workbook:
+                yield workbook
+            return
+        with transformer_adapter('progress').ProgressFile(self.file_path, reporter) as source, \
+                pd.ExcelFile(source, engine='pyxlsb') as workbook:
+            yield workbook
+        
+    def detect_sheet_name(self, workbook: Optional[pd.ExcelFile] = None) -> str:
         """
         Detect the correct sheet name to read
         Priority: 'Detalle' > first sheet
         
+        Args:
+            workbook: Open workbook (default: open the file just for its sheet names)
+        
         Returns:
             Sheet name to read
         """
         try:
             # Read all sheet names
-            xl_file = pd.ExcelFile(self.file_path, engine='pyxlsb')
-            sheet_names = xl_file.sheet_names
-            
-            logger.info(f"Available sheets: {sheet_names}")
-            
-            # Look for 'Detalle' sheet (case-insensitive)
-            for sheet in sheet_names:
-                if sheet.lower() == 'detalle':
-                    logger.info(f"Found 'Detalle' sheet: {sheet}")
-                    return sheet
+            if workbook is None:
+                with pd.ExcelFile(self.file_path, engine='pyxlsb') as xl_file:
+                    sheet_names = xl_file.sheet_names
+            else:
+                sheet_names = workbook.sheet_names
             
-            # If 'Detalle' not found, use first sheet
-            logger.warning(f"'Detalle' sheet not found, using first sheet: {sheet_names[0]}")
-            return sheet_names[0]
+            return self.pick_sheet_name(sheet_names)
             
         except Exception as e:
             logger.error(f"Error detecting sheet name: {e}")
             raise
     
+    @staticmethod
+    def pick_sheet_name(sheet_names: list) -> str:
+        """
+        Pick the sheet to read from the workbook's sheet names
+        Priority: 'Detalle' > first sheet
+        
+        Args:
+            sheet_names: Sheet names in workbook order
+            
+        Returns:
+            Sheet name to read
+        """
+        logger.info(f"Available sheets: {sheet_names}")
+        
+        # Look for 'Detalle' sheet (case-insensitive)
+        for sheet in sheet_names:
+            if sheet.lower() == 'detalle':
+                logger.info(f"Found 'Detalle' sheet: {sheet}")
+                return sheet
+        
+        # If 'Detalle' not found, use first sheet
+        logger.warning(f"'Detalle' sheet not found, using first sheet: {sheet_names[0]}")
+        return sheet_names[0]
+    
+    @classmethod
+    def is_header_row(cls, row_values: list) -> bool:
+        """
+        Check whether a row holds the column headers
+        
+        Args:
+            row_values: Cell values of the row, as strings
+            
+        Returns:
+            True if at least 2 key columns are present
+        """
+        return sum(1 for key in cls.HEADER_KEY_COLUMNS if key in row_values) >= 2
+    
     def detect_header_row(self, df: pd.DataFrame, max_search_rows: int = 20) -> int:
         """
         Auto-detect which row contains the column headers
@@ -88,17 +394,12 @@ class AllianzExcelReader:
         Returns:
             Row index where headers are found (0-indexed)
         """
-        # Key columns to look for (most distinctive)
-        key_columns = ["Cliente - Tomador", "Póliza", "Nombre Macroramo"]
-        
         # Search in the first max_search_rows
         for row_idx in range(min(max_search_rows, len(df))):
             row_values = df.iloc[row_idx].astype(str).tolist()
             
-            # Check how many key columns are present in this row
-            matches = sum(1 for key in key_columns if key in row_values)
-            
-            if matches >= 2:  # At least 2 key columns found
+            # At least 2 key columns found
+            if self.is_header_row(row_values):
                 logger.info(f"Header row detected at index {row_idx} (row {row_idx + 1} in Excel)")
                 return row_idx
         
@@ -106,6 +407,29 @@ class AllianzExcelReader:
         logger.warning("Could not detect header row clearly, assuming row 0")
         return 0
     
+    @staticmethod
+    def promote_header_row(df_raw: pd.DataFrame, header_row: int) -> pd.DataFrame:
+        """
+        Build the data frame from a raw sheet read with header=None, dtype=object
+        
+        The rows from header_row on go through the same parser as
+        pd.read_excel(header=header_row), so column names (including
+        'Unnamed: N' and duplicates) and dtypes are the same as re-reading
+        the sheet with that header.
+        
+        Args:
+            df_raw: Sheet cells, untyped
+            header_row: Row index of the headers (0-indexed)
+            
+        Returns:
+            DataFrame with the header row as columns
+        """
+        rows = df_raw.iloc[header_row:].to_numpy(dtype=object).tolist()
+        # Cells read as empty are NaN here, where read_excel hands '' to the parser
+        rows = [['' if cell is None or cell != cell else cell for cell in row] for row in rows]
+        with TextParser(rows, header=0) as parser:
+            return parser.read()
+    
     def read_excel_with_auto_detection(self) -> pd.DataFrame:
         """
         Read Excel file with automatic detection of:
@@ -117,31 +441,26 @@ class AllianzExcelReader:
             Cleaned DataFrame with proper headers
         """
         try:
-            # Step 1: Detect sheet name
-            self.sheet_name = self.detect_sheet_name()
+            reporter = self._progress_reporter()
             
-            # Step 2: Read sheet without assuming header location
-            logger.info(f"Reading sheet '{self.sheet_name}' to detect headers...")
-            df_raw = pd.read_excel(
-                self.file_path,
-                sheet_name=self.sheet_name,
-                header=None,  # Don't assume header location
-                engine='pyxlsb'
-            )
+            # One open workbook and one parse of the sheet: cells are kept
+            # as read (dtype=object) until the header row is known
+            with self._open_workbook(reporter) as workbook:
+                # Step 1: Detect sheet name
+                self.sheet_name = self.detect_sheet_name(workbook)
+                
+                # Step 2: Read sheet without assuming header location
+                logger.info(f"Reading sheet '{self.sheet_name}' to detect headers...")
+                df_raw = workbook.parse(sheet_name=self.sheet_name, header=None, dtype=object)
             
             logger.info(f"Raw data shape: {df_raw.shape}")
             
             # Step 3: Detect header row
             self.header_row = self.detect_header_row(df_raw)
             
-            # Step 4: Re-read with correct header
-            logger.info(f"Re-reading with header at row {self.header_row}...")
-            self.df = pd.read_excel(
-                self.file_path,
-                sheet_name=self.sheet_name,
-                header=self.header_row,
-                engine='pyxlsb'
-            )
+            # Step 4: Promote the header row and type the data rows below it
+            logger.info(f"Using header at row {self.header_row}...")
+            self.df = self.promote_header_row(df_raw, self.header_row)
             
             # Step 5: Clean column names (strip whitespace)
             self.df.columns = self.df.columns.str.strip()
@@ -154,6 +473,9 @@ class AllianzExcelReader:
             if removed_rows > 0:
                 logger.info(f"Removed {removed_rows} empty rows")
             
+            if reporter is not None:
+                reporter.finish()
+            
             logger.info(f"Final data shape: {self.df.shape}")
             logger.info(f"Columns: {list(self.df.columns)}")
             
@@ -163,6 +485,134 @@ class AllianzExcelReader:
             logger.error(f"Error reading Excel file: {e}")
             raise
     
+    def read_projected_columns(self, max_search_rows: int = 20) -> pd.DataFrame:
+        """
+        Read only the usecols columns, streaming the sheet rows from pyxlsb
+        
+        The header search stops at the first row with 2 key columns, and
+        the cells of the other columns are dropped as each row is read, so
+        memory follows the projected columns instead of the whole sheet.
+        The result is the same as read_excel_with_auto_detection() restricted
+        to those columns. Names missing from the file are ignored, so callers
+        can validate them afterwards.
+        
+        Args:
+            max_search_rows: Maximum number of rows to search for the headers
+            
+        Returns:
+            DataFrame with the projected columns, in file order
+        """
+        if self.usecols is None:
+            raise ValueError("No columns to project. Pass usecols to the reader.")
+        
+        if Path(self.file_path).suffix.lower() != '.xlsb':
+            # Only pyxlsb streams rows, read the whole sheet and project it
+            df = self.read_excel_with_auto_detection()
+            self.df = df[[column for column in df.columns if column in self.usecols]]
+            return self.df
+        
+        from pyxlsb import open_workbook
+        
+        try:
+            reporter = self._progress_reporter()
+            
+            source = transformer_adapter('progress').ProgressFile(self.file_path, reporter) \
+                if reporter is not None else nullcontext(self.file_path)
+            with source as source, open_workbook(source) as workbook:
+                self.sheet_name = self.pick_sheet_name(workbook.sheets)
+                
+                logger.info(f"Streaming sheet '{self.sheet_name}' columns {list(self.usecols)}...")
+                with workbook.get_sheet(self.sheet_name) as sheet:
+                    rows = sheet.rows(sparse=True)
+                    
+                    # Rows read while looking for the header, data if it is not found
+                    searched = []
+                    header = None
+                    for row in rows:
+                        if row[0].r >= max_search_rows:
+                            searched.append(row)
+                            break
+                        if self.is_header_row(['nan' if cell.v is None else str(cell.v) for cell in row]):
+                            header = row
+                            break
+                        searched.append(row)
+                    
+                    if header is None:
+                        logger.warning("Could not detect header row clearly, assuming row 0")
+                        header = searched.pop(0) if searched and searched[0][0].r == 0 else []
+                        self.header_row = 0
+                        data_rows = searched
+                    else:
+                        self.header_row = header[0].r
+                        logger.info(f"Header row detected at index {self.header_row} (row {self.header_row + 1} in Excel)")
+                        data_rows = []
+                    
+                    # First column with each requested name
+                    positions = {}
+                    for cell in header:
+                        if isinstance(cell.v, str) and cell.v.strip() in self.usecols:
+                            positions.setdefault(cell.v.strip(), cell.c)
+                    columns = list(positions)
+                    buffers = {column: _ColumnBuffer() for column in columns}
+                    projection = [(buffers[column], positions[column]) for column in columns]
+                    
+                    # Row labels as in the full read: rows below the header, empty rows dropped
+                    index = array('q')
+                    first_data_row = self.header_row + 1
+                    for stream in (data_rows, rows):
+                        for row in stream:
+                            if all(cell.v is None or cell.v == '' for cell in row):
+                                continue
+                            index.append(row[0].r - first_data_row)
+                            for buffer, position in projection:
+                                buffer.append(row[position].v if position < len(row) else None)
+            
+            self.df = self._build_projected_frame(buffers, index)
+            
+            if reporter is not None:
+                reporter.finish()
+            
+            logger.info(f"Final data shape: {self.df.shape}")
+            logger.info(f"Columns: {list(self.df.columns)}")
+            
+            return self.df
+            
+        except Exception as e:
+            logger.error(f"Error reading Excel file: {e}")
+            raise
+    
+    @staticmethod
+    def _build_projected_frame(buffers: dict, index: array) -> pd.DataFrame:
+        """
+        Type the column buffers the way pd.read_excel types the full sheet
+        
+        Numeric buffers become int64/float64 arrays directly, the other
+        columns go through the same parser as pd.read_excel.
+        
+        Args:
+            buffers: Column name -> _ColumnBuffer, in file order
+            index: Row labels
+            
+        Returns:
+            DataFrame with the buffered columns
+        """
+        data = {column: buffer.to_numpy() for column, buffer in buffers.items() if buffer.is_numeric}
+        
+        parsed_columns = [column for column, buffer in buffers.items() if not buffer.is_numeric]
+        if parsed_columns:
+            rows = [parsed_columns] + [list(row) for row in zip(*(buffers[column].to_list() for column in parsed_columns))]
+            # A row of empty cells is a data row here, even with a single column
+            with TextParser(rows, header=0, skip_blank_lines=False) as parser:
+                parsed = parser.read()
+            for column in parsed_columns:
+                data[column] = parsed[column].to_numpy()
+        
+        return pd.DataFrame(
+            {column: data[column] for column in buffers},
+            index=pd.Index(np.array(index, dtype=np.int64)),
+            columns=pd.Index(list(buffers), dtype=object)
+        )
+    
     def validate_columns(self) -> Tuple[bool, list]:
         """
         Validate that expected columns are present
@@ -174,7 +624,7 @@ class AllianzExcelReader:
             raise ValueError("DataFrame not loaded. Call read_excel_with_auto_detection() first.")
         
         actual_columns = set(self.df.columns)
-        expected_columns = set(self.EXPECTED_COLUMNS)
+        expected_columns = set(self.EXPECTED_COLUMNS if self.usecols is None else self.usecols)
         
         missing_columns = expected_columns - actual_columns
         
@@ -211,12 +661,17 @@ class AllianzExcelReader:
         return summary
 
 
-def read_allianz_file(file_path: str) -> pd.DataFrame:
+def read_allianz_file(file_path: str, use_cache: bool = True, progress=None,
+                      usecols: Optional[list] = None) -> pd.DataFrame:
     """
     Main function to read an Allianz Excel file
     
     Args:
         file_path: Path to the Excel file (string or Path)
+        use_cache: Reuse a previous parse of the same content (default: True)
+        progress: Progress callback (done, total) of the read (optional)
+        usecols: Names of the columns to keep (default: all). Only these
+            columns are read from the sheet.
         
     Returns:
         Cleaned DataFrame with validated data
@@ -236,8 +691,26 @@ def read_allianz_file(file_path: str) -> pd.DataFrame:
         logger.info(f"File size: {path.stat().st_size / 1024:.2f} KB")
         
         # Create reader and load data
-        reader = AllianzExcelReader(path)
-        df = reader.read_excel_with_auto_detection()
+        reader = AllianzExcelReader(path, progress=progress, usecols=usecols)
+        if usecols is None:
+            df = _read_with_cache(
+                path,
+                f"allianz_xlsb/{AllianzExcelReader.READER_VERSION}",
+                reader.read_excel_with_auto_detection,
+                use_cache=use_cache
+            )
+        else:
+            df = _read_with_cache(
+                path,
+                f"allianz_xlsb_projected/{AllianzExcelReader.PROJECTED_READER_VERSION}",
+                reader.read_projected_columns,
+                options={"usecols": sorted(usecols)},
+                use_cache=use_cache
+            )
+        reader.df = df
+        if progress is not None:
+            # A cache hit reads nothing, report the read as done
+            progress(1, 1)
         
         # Validate columns
         is_valid, missing_cols = reader.validate_columns()
@@ -263,6 +736,77 @@ def read_allianz_file(file_path: str) -> pd.DataFrame:
         raise
 
 
+def read_softseguros_file(file_path: Path, use_cache: bool = True) -> pd.DataFrame:
+    """
+    Read the Softseguros production workbook
+    
+    Args:
+        file_path: Softseguros .xlsx file
+        use_cache: Reuse a previous parse of the same content (default: True)
+        
+    Returns:
+        DataFrame with every column of the workbook
+    """
+    return _read_with_cache(
+        file_path,
+        "softseguros_xlsx",
+        lambda: pd.read_excel(file_path),
+        use_cache=use_cache
+    )
+
+
+def read_celer_file(file_path: Path, use_cache: bool = True) -> pd.DataFrame:
+    """
+    Read a transformed Celer workbook, from its columnar sidecar when there is one
+    
+    Args:
+        file_path: Transformed Celer .xlsx file
+        use_cache: Reuse a previous parse of the same content (default: True)
+        
+    Returns:
+        DataFrame with the transformed Celer data
+    """
+    # The transformer's columnar sidecar skips the Excel read altogether
+    sidecar = find_celer_sidecar(file_path)
+    if sidecar is not None:
+        df = read_celer_sidecar(sidecar)
+        if df is not None:
+            logger.info(f"✓ Celer read from sidecar {sidecar.name}")
+            return df
+    return _read_with_cache(
+        file_path,
+        "celer_transformed_xlsx",
+        lambda: pd.read_excel(
+            file_path,
+            dtype={column: 'category' for column in CELER_CATEGORY_COLUMNS}
+        ),
+        options={'category_columns': CELER_CATEGORY_COLUMNS},
+        use_cache=use_cache
+    )
+
+
+def importable_in_workers(function, start_method: Optional[str] = None) -> bool:
+    """
+    Check whether worker processes can import a function to run it
+    
+    Forked workers inherit every loaded module. Spawned workers import the
+    function's module by name from sys.path, which fails for a module loaded
+    from its path under another name (spec_from_file_location).
+    
+    Args:
+        function: Module-level function sent to the workers
+        start_method: Start method of the workers (default: multiprocessing's)
+        
+    Returns:
+        True if the workers can import it
+    """
+    module_name = function.__module__
+    start_method = start_method or multiprocessing.get_start_method()
+    if start_method == 'fork' or module_name == '__main__':
+        return True
+    return importlib.machinery.PathFinder.find_spec(module_name.partition('.')[0]) is not None
+
+
 def select_file_from_folder(folder_path, extension, description):
     """
     List files in folder and let user select one
@@ -314,6 +858,10 @@ def select_file_from_folder(folder_path, extension, description):
             sys.exit(0)
 
 
+# Overall progress (percent) spanned by loading the Allianz files in run()
+ALLIANZ_STAGE = (30, 80)
+
+
 class AllianzConciliator:
     """
     Sistema de conciliación entre Softseguros, Celer y Allianz
@@ -323,7 +871,8 @@ class AllianzConciliator:
     
     def __init__(self, allianz_personas_path, allianz_colectivas_path, data_source='both', 
                  data_source_type='both', softseguros_file_path=None, celer_file_path=None,
-                 output_directory=None):
+                 output_directory=None, use_cache=True, progress=None, celer_data=None,
+                 workers=None, mp_context=None):
         self.allianz_personas_file = Path(allianz_personas_path) if allianz_personas_path else None
         self.allianz_colectivas_file = Path(allianz_colectivas_path) if allianz_colectivas_path else None
         self.data_source = data_source.lower()  # 'personas', 'colectivas', or 'both'
@@ -332,6 +881,25 @@ class AllianzConciliator:
         self.softseguros_file = Path(softseguros_file_path) if softseguros_file_path else None
         self.celer_file = Path(celer_file_path) if celer_file_path else None
         
+        # Transformed Celer DataFrame handed over in memory (e.g. by the GUI,
+        # straight from the transformer); used instead of reading celer_file
+        self.celer_data = celer_data
+        
+        # Reuse parsed inputs from the on-disk parse cache (False bypasses it)
+        self.use_cache = use_cache
+        
+        # Progress callback (done, 100) over the whole run (optional)
+        self.progress = progress
+        
+        # Processes reading the input files in parallel (1 reads them one by one)
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        
+        # multiprocessing context starting them (default: multiprocessing's)
+        self.mp_context = mp_context
+        
+        # Reads started by load_data(), by input name, taken by the load_* methods
+        self._pending_reads = {}
+        
         # Output directory configuration
         if output_directory:
             self.output_dir = Path(output_directory)
@@ -353,6 +921,58 @@ class AllianzConciliator:
             'only_combined': []                 # Solo en Softseguros/Celer combinados
         }
     
+    def _report_progress(self, percent):
+        """Report overall progress in percent, if a callback was given"""
+        if self.progress is not None:
+            self.progress(percent, 100)
+    
+    def _stage_progress(self, start, end):
+        """Progress callback mapping one stage onto start..end percent (or None)"""
+        progress = transformer_adapter('progress')
+        if self.progress is None or progress is None:
+            return None
+        return progress.progress_stage(self.progress, start, end)
+    
+    def _read_input(self, name, read, *args, **kwargs):
+        """
+        Frame of one input file, from the read started by load_data() if any
+        
+        Args:
+            name: Input name ('softseguros', 'celer', 'personas', 'colectivas')
+            read: Reader function, called here when no read was started
+            *args, **kwargs: Reader arguments
+            
+        Returns:
+            DataFrame returned by the reader (its exception is raised here)
+        """
+        future = self._pending_reads.pop(name, None)
+        if future is not None:
+            return future.result()
+        return read(*args, **kwargs)
+    
+    def _input_reads(self) -> dict:
+        """
+        Reads of the selected input files that exist, by input name
+        
+        Returns:
+            Input name -> (reader function, args, kwargs)
+        """
+        reads = {}
+        if self.data_source_type in ['softseguros', 'both'] and self.softseguros_file is not None \
+                and self.softseguros_file.exists():
+            reads['softseguros'] = (read_softseguros_file, (self.softseguros_file,), {'use_cache': self.use_cache})
+        if self.data_source_type in ['celer', 'both'] and self.celer_data is None \
+                and self.celer_file is not None and self.celer_file.exists():
+            reads['celer'] = (read_celer_file, (self.celer_file,), {'use_cache': self.use_cache})
+        allianz_files = {'personas': self.allianz_personas_file, 'colectivas': self.allianz_colectivas_file}
+        for name, allianz_file in allianz_files.items():
+            if self.data_source in [name, 'both'] and allianz_file is not None and allianz_file.exists():
+                reads[name] = (read_allianz_file, (str(allianz_file),), {
+                    'use_cache': self.use_cache,
+                    'usecols': AllianzExcelReader.CONCILIATION_COLUMNS
+                })
+        return reads
+    
     def normalize_number(self, value):
         """
         Normalize policy/recibo numbers by removing leading zeros
@@ -397,7 +1017,9 @@ class AllianzConciliator:
         if not self.softseguros_file.exists():
             raise FileNotFoundError(f"Softseguros file not found: {self.softseguros_file}")
         
-        self.softseguros_df = pd.read_excel(self.softseguros_file)
+        self.softseguros_df = self._read_input(
+            'softseguros', read_softseguros_file, self.softseguros_file, use_cache=self.use_cache
+        )
         
         # Verify columns
         required_cols = ['NÚMERO PÓLIZA', 'NÚMERO ANEXO', 'FECHA INICIO', 'ASEGURADORA']
@@ -408,7 +1030,7 @@ class AllianzConciliator:
         # Filter: Only ALLIANZ
         total_before = len(self.softseguros_df)
         self.softseguros_df = self.softseguros_df[
-            self.softseguros_df['ASEGURADORA'].str.upper().str.contains('ALLIANZ', na=False)
+            contains_allianz(self.softseguros_df['ASEGURADORA'])
         ].copy()
         logger.info(f"✓ Filtered Softseguros by 'ALLIANZ': {len(self.softseguros_df)}/{total_before} records")
         
@@ -439,12 +1061,17 @@ class AllianzConciliator:
     
     def load_celer_data(self):
         """Load and prepare Celer transformed data"""
-        logger.info(f"Loading Celer file: {self.celer_file.name}")
-        
-        if not self.celer_file.exists():
-            raise FileNotFoundError(f"Celer file not found: {self.celer_file}")
-        
-        self.celer_df = pd.read_excel(self.celer_file)
+        if self.celer_data is not None:
+            # Shallow copy: the caller's DataFrame is left untouched
+            self.celer_df = with_celer_categories(self.celer_data.copy(deep=False))
+            logger.info(f"Using in-memory Celer data: {len(self.celer_df)} records")
+        else:
+            logger.info(f"Loading Celer file: {self.celer_file.name}")
+            
+            if not self.celer_file.exists():
+                raise FileNotFoundError(f"Celer file not found: {self.celer_file}")
+            
+            self.celer_df = self._read_input('celer', read_celer_file, self.celer_file, use_cache=self.use_cache)
         
         # Verify columns
         required_cols = ['Poliza', 'Documento', 'F_Inicio', 'Aseguradora']
@@ -454,15 +1081,17 @@ class AllianzConciliator:
         
         # Filter: Only ALLIANZ SEGUROS S.A
         total_before = len(self.celer_df)
-        self.celer_df = self.celer_df[
-            self.celer_df['Aseguradora'].str.upper().str.contains('ALLIANZ', na=False)
-        ].copy()
+        self.celer_df = self.celer_df[contains_allianz(self.celer_df['Aseguradora'])].copy()
         logger.info(f"✓ Filtered by Aseguradora 'ALLIANZ': {len(self.celer_df)}/{total_before} records")
         
         # Normalize and create match keys
         self.celer_df['_poliza_norm'] = self.celer_df['Poliza'].apply(self.normalize_number)
         self.celer_df['_documento_norm'] = self.celer_df['Documento'].apply(self.normalize_recibo)  # Last 9 digits
-        self.celer_df['_fecha_inicio_str'] = pd.to_datetime(self.celer_df['F_Inicio'], errors='coerce').dt.strftime('%Y-%m-%d')
+        # The transformer writes F_Inicio as real dates, parse it only if read as text
+        fecha_inicio = self.celer_df['F_Inicio']
+        if not pd.api.types.is_datetime64_any_dtype(fecha_inicio):
+            fecha_inicio = pd.to_datetime(fecha_inicio, errors='coerce')
+        self.celer_df['_fecha_inicio_str'] = fecha_inicio.dt.strftime('%Y-%m-%d')
         
         # Match keys: completo (poliza+recibo+fecha) y parcial (poliza+fecha)
         self.celer_df['_match_key_full'] = self.celer_df['_poliza_norm'] + "_" + self.celer_df['_documento_norm'] + "_" + self.celer_df['_fecha_inicio_str']
@@ -510,11 +1139,21 @@ class AllianzConciliator:
         
         dataframes = []
         
+        # Each file read takes its share of the Allianz loading stage
+        first_end = ALLIANZ_STAGE[1] if self.data_source == 'personas' else sum(ALLIANZ_STAGE) // 2
+        
         # Load PERSONAS if requested
         if self.data_source in ['personas', 'both']:
             if self.allianz_personas_file is None or not self.allianz_personas_file.exists():
                 raise FileNotFoundError(f"Allianz Personas file is required but not provided or doesn't exist")
-            personas_df = read_allianz_file(str(self.allianz_personas_file))
+            personas_df = self._read_input(
+                'personas',
+                read_allianz_file,
+                str(self.allianz_personas_file),
+                use_cache=self.use_cache,
+                usecols=AllianzExcelReader.CONCILIATION_COLUMNS,
+                progress=self._stage_progress(ALLIANZ_STAGE[0], first_end)
+            )
             personas_df['_source'] = 'PERSONAS'
             logger.info(f"✓ PERSONAS: {len(personas_df)} records")
             dataframes.append(personas_df)
@@ -523,7 +1162,15 @@ class AllianzConciliator:
         if self.data_source in ['colectivas', 'both']:
             if self.allianz_colectivas_file is None or not self.allianz_colectivas_file.exists():
                 raise FileNotFoundError(f"Allianz Colectivas file is required but not provided or doesn't exist")
-            colectivas_df = read_allianz_file(str(self.allianz_colectivas_file))
+            colectivas_start = ALLIANZ_STAGE[0] if self.data_source == 'colectivas' else first_end
+            colectivas_df = self._read_input(
+                'colectivas',
+                read_allianz_file,
+                str(self.allianz_colectivas_file),
+                use_cache=self.use_cache,
+                usecols=AllianzExcelReader.CONCILIATION_COLUMNS,
+                progress=self._stage_progress(colectivas_start, ALLIANZ_STAGE[1])
+            )
             colectivas_df['_source'] = 'COLECTIVAS'
             logger.info(f"✓ COLECTIVAS: {len(colectivas_df)} records")
             dataframes.append(colectivas_df)
@@ -539,18 +1186,9 @@ class AllianzConciliator:
         self.allianz_df['_recibo_norm'] = self.allianz_df['Recibo'].apply(self.normalize_recibo)  # Last 9 digits
         
         # Convert Excel serial dates to datetime
-        # Excel dates are stored as integers (days since 1899-12-30)
-        def convert_excel_date(serial_date):
-            if pd.isna(serial_date):
-                return 'NaT'
-            try:
-                # Excel origin is 1899-12-30 (not 1900-01-01 due to Excel bug)
-                dt = pd.to_datetime('1899-12-30') + pd.to_timedelta(int(serial_date), unit='D')
-                return dt.strftime('%Y-%m-%d')
-            except:
-                return 'NaT'
-        
-        self.allianz_df['_fecha_inicio_str'] = self.allianz_df['F.INI VIG'].apply(convert_excel_date)
+        # Excel dates are stored as integers (days since 1899-12-30); 'NaT' keys unknown dates
+        fecha_inicio = excel_serial_to_datetime(self.allianz_df['F.INI VIG'])
+        self.allianz_df['_fecha_inicio_str'] = fecha_inicio.dt.strftime('%Y-%m-%d').fillna('NaT')
         
         # Match keys: completo (poliza+recibo+fecha) y parcial (poliza+fecha)
         self.allianz_df['_match_key_full'] = self.allianz_df['_poliza_norm'] + "_" + self.allianz_df['_recibo_norm'] + "_" + self.allianz_df['_fecha_inicio_str']
@@ -559,6 +1197,62 @@ class AllianzConciliator:
         logger.info(f"✓ Allianz TOTAL: {len(self.allianz_df)} records")
         return self.allianz_df
     
+    def load_data(self):
+        """
+        Load the selected data sources (Softseguros/Celer) and the Allianz files
+        
+        The input files are independent, so with more than one worker they
+        are parsed at the same time in worker processes (Excel parsing is
+        CPU-bound and holds the GIL), while the frames are prepared here in
+        the usual order. The frames, and the first error raised, are the
+        same as when loading one file after the other. When the worker
+        processes could not import the readers (see importable_in_workers)
+        the files are read one by one.
+        
+        It can be called from any thread: with a 'spawn' context (mp_context)
+        the workers are fresh interpreters, so a caller running alongside
+        other threads (e.g. a GUI) is never forked with their locks held.
+        """
+        start_method = (self.mp_context or multiprocessing).get_start_method()
+        reads = self._input_reads() if self.workers > 1 else {}
+        if reads and not all(importable_in_workers(read, start_method) for read, _, _ in reads.values()):
+            logger.warning("Worker processes cannot import the readers, reading input files one by one")
+            reads = {}
+        executor = None
+        if len(reads) > 1:
+            workers = min(self.workers, len(reads))
+            logger.info(f"Reading {len(reads)} input files with {workers} worker processes")
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=self.mp_context)
+            self._pending_reads = {
+                name: executor.submit(read, *args, **kwargs) for name, (read, args, kwargs) in reads.items()
+            }
+        
+        try:
+            if self.data_source_type == 'softseguros':
+                self.load_softseguros_data()
+                self.combined_df = self.softseguros_df.copy()
+                self.celer_df = pd.DataFrame()  # Empty
+                
+            elif self.data_source_type == 'celer':
+                self.load_celer_data()
+                self.combined_df = self.celer_df.copy()
+                self.softseguros_df = pd.DataFrame()  # Empty
+                
+            else:  # both
+                self.load_softseguros_data()
+                self._report_progress(ALLIANZ_STAGE[0] // 2)
+                self.load_celer_data()
+                self.combine_data_sources()
+            self._report_progress(ALLIANZ_STAGE[0])
+            
+            self.load_allianz_data()
+            self._report_progress(ALLIANZ_STAGE[1])
+        finally:
+            # Reads not taken (a load failed first) are dropped
+            self._pending_reads = {}
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+    
     def perform_conciliation(self):
         """
         Perform conciliation analysis with cases:
@@ -579,11 +1273,18 @@ class AllianzConciliator:
         combined_keys_partial = set(self.combined_df['_match_key_partial'].unique())
         allianz_keys_partial = set(self.allianz_df['_match_key_partial'].unique())
         
+        # Row positions of each key, built once: every lookup below is a dict
+        # access instead of a scan of the whole frame (first position = first row)
+        combined_rows_full = self.combined_df.groupby('_match_key_full', sort=False).indices
+        allianz_rows_full = self.allianz_df.groupby('_match_key_full', sort=False).indices
+        combined_rows_partial = self.combined_df.groupby('_match_key_partial', sort=False).indices
+        allianz_rows_partial = self.allianz_df.groupby('_match_key_partial', sort=False).indices
+        
         # CASO 1: Match completo (Poliza + Recibo + Fecha) - NO HAN PAGADO
         matched_full = combined_keys_full & allianz_keys_full
         for key in matched_full:
-            combined_row = self.combined_df[self.combined_df['_match_key_full'] == key].iloc[0]
-            allianz_row = self.allianz_df[self.allianz_df['_match_key_full'] == key].iloc[0]
+            combined_row = self.combined_df.iloc[combined_rows_full[key][0]]
+            allianz_row = self.allianz_df.iloc[allianz_rows_full[key][0]]
             
             # Determine source-specific fields
             if combined_row['_source'] == 'SOFTSEGUROS':
@@ -616,13 +1317,13 @@ class AllianzConciliator:
         # CASO 2 ESPECIAL: Softseguros sin anexo (Poliza + Fecha match, pero SIN anexo)
         # Estos deben reportarse como "Actualizar recibo en Softseguros"
         for key_partial in (combined_keys_partial & allianz_keys_partial):
-            combined_rows = self.combined_df[self.combined_df['_match_key_partial'] == key_partial]
+            combined_rows = self.combined_df.iloc[combined_rows_partial[key_partial]]
             
             for _, combined_row in combined_rows.iterrows():
                 # Si es de Softseguros y NO tiene anexo
                 if combined_row['_source'] == 'SOFTSEGUROS' and not combined_row['_tiene_anexo']:
                     # Buscar el match en Allianz
-                    allianz_match = self.allianz_df[self.allianz_df['_match_key_partial'] == key_partial]
+                    allianz_match = self.allianz_df.iloc[allianz_rows_partial[key_partial]]
                     
                     if len(allianz_match) > 0:
                         allianz_row = allianz_match.iloc[0]
@@ -642,8 +1343,8 @@ class AllianzConciliator:
         # CASO 2: Match parcial (Poliza + Fecha, diferente Recibo) - ACTUALIZAR SISTEMA
         # Solo para registros CON anexo/documento
         for key_partial in (combined_keys_partial & allianz_keys_partial):
-            combined_rows = self.combined_df[self.combined_df['_match_key_partial'] == key_partial]
-            allianz_rows = self.allianz_df[self.allianz_df['_match_key_partial'] == key_partial]
+            combined_rows = self.combined_df.iloc[combined_rows_partial[key_partial]]
+            allianz_rows = self.allianz_df.iloc[allianz_rows_partial[key_partial]]
             
             for _, combined_row in combined_rows.iterrows():
                 # Skip si es Softseguros sin anexo (ya procesado arriba)
@@ -681,7 +1382,7 @@ class AllianzConciliator:
         only_allianz_count = 0
         for key in allianz_keys_full:
             if key not in combined_keys_full:
-                allianz_row = self.allianz_df[self.allianz_df['_match_key_full'] == key].iloc[0]
+                allianz_row = self.allianz_df.iloc[allianz_rows_full[key][0]]
                 # Verificar si al menos coincide parcialmente
                 if allianz_row['_match_key_partial'] not in combined_keys_partial:
                     if only_allianz_count < 3:
@@ -701,7 +1402,7 @@ class AllianzConciliator:
         only_combined_count = 0
         for key in combined_keys_full:
             if key not in allianz_keys_full:
-                combined_row = self.combined_df[self.combined_df['_match_key_full'] == key].iloc[0]
+                combined_row = self.combined_df.iloc[combined_rows_full[key][0]]
                 # Verificar si al menos coincide parcialmente
                 if combined_row['_match_key_partial'] not in allianz_keys_partial:
                     if only_combined_count < 3:
@@ -964,27 +1665,12 @@ class AllianzConciliator:
             print(f"INICIANDO CONCILIACIÓN ALLIANZ ({self.data_source_type.upper()})")
             print("=" * 80)
             
-            # Load data sources based on selection
-            if self.data_source_type == 'softseguros':
-                self.load_softseguros_data()
-                self.combined_df = self.softseguros_df.copy()
-                self.celer_df = pd.DataFrame()  # Empty
-                
-            elif self.data_source_type == 'celer':
-                self.load_celer_data()
-                self.combined_df = self.celer_df.copy()
-                self.softseguros_df = pd.DataFrame()  # Empty
-                
-            else:  # both
-                self.load_softseguros_data()
-                self.load_celer_data()
-                self.combine_data_sources()
-            
-            # Load Allianz data
-            self.load_allianz_data()
+            # Load data sources based on selection, then Allianz data
+            self.load_data()
             
             # Perform conciliation
             self.perform_conciliation()
+            self._report_progress(90)
             
             # Print report to console
             self.print_report()
@@ -992,6 +1678,7 @@ class AllianzConciliator:
             # Save report to file
             output_file = self.save_report_to_file()
             print(f"\n✅ Reporte guardado en: {output_file}")
+            self._report_progress(100)
             
             return True
             
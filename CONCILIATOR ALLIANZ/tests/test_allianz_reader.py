@@ -0,0 +1,87 @@
+"""
+Test del lector de archivos Allianz
+Verifica que la lectura en una sola pasada da el mismo resultado que releer la hoja con el encabezado,
+y que la lectura por columnas da las mismas columnas que la lectura completa
+"""
+
+import sys
+from pathlib import Path
+import pandas as pd
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from conciliator import AllianzExcelReader, _ColumnBuffer
+
+INPUT_DIR = Path(__file__).parent.parent / "INPUT"
+
+
+def write_informe(path):
+    """Informe con filas de título, encabezado en la fila 3, celdas vacías y columnas repetidas"""
+    rows = [
+        ["Informe Intermediario", None, None, None, None, None],
+        [None, None, None, None, None, None],
+        ["Cliente - Tomador", "Póliza", "Recibo", "F.INI VIG", None, "Recibo"],
+        ["AGUDELO DIEZ,GLORIA LUCIA", 23537654, "350761189", 45658, "x", 1.5],
+        ["GALLEGO ORTIZ, TATIANA", 23770244, None, 45636, None, 2],
+        [None, None, None, None, None, None],
+    ]
+    pd.DataFrame(rows).to_excel(path, header=False, index=False)
+
+
+def test_promote_header_row_matches_reread(tmp_path):
+    path = tmp_path / "informe.xlsx"
+    write_informe(path)
+
+    raw = pd.read_excel(path, header=None, dtype=object)
+    header_row = AllianzExcelReader(path).detect_header_row(raw)
+    promoted = AllianzExcelReader.promote_header_row(raw, header_row)
+
+    assert header_row == 2
+    pd.testing.assert_frame_equal(promoted, pd.read_excel(path, header=header_row))
+
+
+def test_single_pass_on_real_reports():
+    files = [f for f in INPUT_DIR.glob("*/*.xlsb") if not f.name.startswith("~$")]
+    for file_path in files:
+        reader = AllianzExcelReader(file_path)
+        df = reader.read_excel_with_auto_detection()
+
+        expected = pd.read_excel(file_path, engine='pyxlsb', sheet_name=reader.sheet_name,
+                                 header=reader.header_row)
+        expected.columns = expected.columns.str.strip()
+        pd.testing.assert_frame_equal(df, expected.dropna(how='all'))
+
+
+def test_column_buffers_type_like_read_excel():
+    columns = {
+        "enteros": [23537654.0, 23770244.0],
+        "con_vacios": [45658.0, None, 45636.0],
+        "decimales": [1.0, 1.5, ""],
+        "mixta": [350761189.0, None, 2.5, "A-12"],
+        "texto": ["AGUDELO DIEZ,GLORIA LUCIA", "NA", None],
+    }
+    for name, values in columns.items():
+        buffer = _ColumnBuffer()
+        for value in values:
+            buffer.append(value)
+        built = AllianzExcelReader._build_projected_frame({name: buffer}, list(range(len(values))))
+
+        # pd.read_excel hands whole numbers as ints and empty cells as ''
+        cells = [int(v) if isinstance(v, float) and v.is_integer() else ("" if v is None else v) for v in values]
+        sheet = pd.DataFrame([[name, "fila"]] + [[cell, i] for i, cell in enumerate(cells)])
+        expected = AllianzExcelReader.promote_header_row(sheet, 0)[[name]]
+        pd.testing.assert_frame_equal(built, expected)
+
+
+def test_projected_columns_on_real_reports():
+    files = [f for f in INPUT_DIR.glob("*/*.xlsb") if not f.name.startswith("~$")]
+    usecols = AllianzExcelReader.CONCILIATION_COLUMNS + ["Vencida", "Columna Inexistente"]
+    for file_path in files:
+        full = AllianzExcelReader(file_path).read_excel_with_auto_detection()
+        reader = AllianzExcelReader(file_path, usecols=usecols)
+        df = reader.read_projected_columns()
+
+        assert reader.header_row == 16
+        pd.testing.assert_frame_equal(df, full[[c for c in full.columns if c in usecols]])
+        assert reader.validate_columns() == (False, ["Columna Inexistente"])
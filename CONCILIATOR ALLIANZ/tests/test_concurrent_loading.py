@@ -0,0 +1,145 @@
+"""
+Test de la carga concurrente de archivos
+Verifica que leer los archivos en procesos paralelos da los mismos DataFrames y los mismos errores,
+también con procesos creados por spawn (Windows, macOS)
+"""
+
+import importlib
+import importlib.util
+import logging
+import multiprocessing
+import sys
+import threading
+from pathlib import Path
+import pandas as pd
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import conciliator
+from conciliator import AllianzConciliator, importable_in_workers
+
+INPUT_DIR = Path(__file__).parent.parent / "INPUT"
+
+
+def allianz_report(source):
+    return next(f for f in (INPUT_DIR / source).glob("*.xlsb") if not f.name.startswith("~$"))
+
+
+def write_celer(path, columns=("Poliza", "Documento", "F_Inicio", "Aseguradora")):
+    """Archivo Celer transformado con una póliza de Allianz y una de otra aseguradora"""
+    data = pd.DataFrame({
+        "Poliza": ["023537654", "5090961"],
+        "Documento": ["350761189", "1347216594"],
+        "F_Inicio": pd.to_datetime(["2025-01-01", "2024-12-10"]),
+        "Aseguradora": ["ALLIANZ SEGUROS S.A.", "SURAMERICANA S.A."],
+        "Tomador": ["AGUDELO DIEZ,GLORIA LUCIA", "GALLEGO ORTIZ, TATIANA"],
+    })
+    data[list(columns)].to_excel(path, index=False)
+    return path
+
+
+def make_conciliator(tmp_path, workers, celer_file, personas_file=None, module=conciliator, **options):
+    return module.AllianzConciliator(
+        allianz_personas_path=personas_file or allianz_report("PERSONAS"),
+        allianz_colectivas_path=allianz_report("COLECTIVAS"),
+        data_source='both',
+        data_source_type='celer',
+        celer_file_path=celer_file,
+        output_directory=tmp_path / "output",
+        use_cache=False,
+        workers=workers,
+        **options
+    )
+
+
+def test_same_frames_as_sequential_load(tmp_path):
+    celer_file = write_celer(tmp_path / "celer.xlsx")
+
+    sequential = make_conciliator(tmp_path, 1, celer_file)
+    sequential.load_data()
+    concurrent = make_conciliator(tmp_path, 2, celer_file)
+    concurrent.load_data()
+
+    pd.testing.assert_frame_equal(concurrent.combined_df, sequential.combined_df)
+    pd.testing.assert_frame_equal(concurrent.allianz_df, sequential.allianz_df)
+    assert len(concurrent.combined_df) == 1
+    assert concurrent._pending_reads == {}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_same_errors_as_sequential_load(tmp_path, workers):
+    # The first failing input in load order raises, whatever finishes first
+    celer_file = write_celer(tmp_path / "celer.xlsx", columns=("Poliza", "Documento"))
+    with pytest.raises(ValueError, match="Required columns missing"):
+        make_conciliator(tmp_path, workers, celer_file, personas_file=tmp_path / "falta.xlsb").load_data()
+
+    celer_file = write_celer(tmp_path / "celer.xlsx")
+    with pytest.raises(FileNotFoundError, match="Allianz Personas file"):
+        make_conciliator(tmp_path, workers, celer_file, personas_file=tmp_path / "falta.xlsb").load_data()
+
+
+@pytest.fixture
+def spawn():
+    """Procesos creados por spawn, como en Windows"""
+    start_method = multiprocessing.get_start_method(allow_none=True)
+    multiprocessing.set_start_method('spawn', force=True)
+    yield
+    multiprocessing.set_start_method(start_method, force=True)
+
+
+def test_spawned_workers_read_in_parallel(tmp_path, spawn):
+    celer_file = write_celer(tmp_path / "celer.xlsx")
+
+    sequential = make_conciliator(tmp_path, 1, celer_file)
+    sequential.load_data()
+    concurrent = make_conciliator(tmp_path, 2, celer_file)
+    concurrent.load_data()
+
+    pd.testing.assert_frame_equal(concurrent.combined_df, sequential.combined_df)
+    pd.testing.assert_frame_equal(concurrent.allianz_df, sequential.allianz_df)
+
+
+def test_module_loaded_from_path_reads_sequentially_under_spawn(tmp_path, spawn, monkeypatch):
+    # Como lo carga la GUI: los procesos spawn no pueden importar 'conciliator_module'
+    spec = importlib.util.spec_from_file_location("conciliator_module", Path(conciliator.__file__))
+    gui_module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "conciliator_module", gui_module)
+    spec.loader.exec_module(gui_module)
+    assert not importable_in_workers(gui_module.read_celer_file)
+    celer_file = write_celer(tmp_path / "celer.xlsx")
+
+    loaded = make_conciliator(tmp_path, 2, celer_file, module=gui_module)
+    loaded.load_data()
+
+    sequential = make_conciliator(tmp_path, 1, celer_file)
+    sequential.load_data()
+    pd.testing.assert_frame_equal(loaded.combined_df, sequential.combined_df)
+    pd.testing.assert_frame_equal(loaded.allianz_df, sequential.allianz_df)
+
+
+def test_gui_loads_in_parallel_from_a_thread(tmp_path, caplog):
+    # Como la GUI: el módulo importado por su nombre y load_data en un QThread con spawn
+    gui_module = importlib.import_module("conciliator")
+    celer_file = write_celer(tmp_path / "celer.xlsx")
+    loaded = make_conciliator(tmp_path, 2, celer_file, module=gui_module,
+                              mp_context=multiprocessing.get_context('spawn'))
+    errors = []
+    def run():
+        try:
+            loaded.load_data()
+        except Exception as error:
+            errors.append(error)
+
+    with caplog.at_level(logging.INFO):
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+
+    assert errors == []
+    assert "with 2 worker processes" in caplog.text
+    sequential = make_conciliator(tmp_path, 1, celer_file)
+    sequential.load_data()
+    pd.testing.assert_frame_equal(loaded.combined_df, sequential.combined_df)
+    pd.testing.assert_frame_equal(loaded.allianz_df, sequential.allianz_df)
@@ -229,5 +229,27 @@ def test_sample_data_with_dates():
     print("=" * 80)
 
 
+def test_excel_serial_to_datetime():
+    """
+    Conversión vectorizada de fechas seriales de Excel (F.INI VIG, F.FIN VIG, F. Límite Pago)
+    Da lo mismo que la conversión celda por celda, y acepta fechas y texto
+    """
+    from conciliator import AllianzExcelReader, excel_serial_to_datetime
+    
+    column = pd.Series([46002, 46002.75, None, '45636', '2025-01-01', datetime(2025, 1, 2), 'x', 1e12], dtype=object)
+    fechas = excel_serial_to_datetime(column).dt.strftime('%Y-%m-%d').fillna('NaT')
+    assert fechas.tolist() == ['2025-12-11', '2025-12-11', 'NaT', '2024-12-10', '2025-01-01', '2025-01-02', 'NaT', 'NaT']
+    
+    # Columnas de fecha de un informe real: seriales sin celdas vacías
+    input_dir = Path(__file__).parent.parent / "INPUT"
+    report = next(f for f in input_dir.glob("PERSONAS/*.xlsb") if not f.name.startswith("~$"))
+    df = AllianzExcelReader(report).read_excel_with_auto_detection()
+    excel_origin = pd.to_datetime('1899-12-30')
+    for date_column in ['F.INI VIG', 'F.FIN VIG', 'F. Límite Pago']:
+        expected = [excel_origin + pd.to_timedelta(int(serial), unit='D') for serial in df[date_column]]
+        assert excel_serial_to_datetime(df[date_column]).tolist() == expected
+
+
 if __name__ == "__main__":
     test_sample_data_with_dates()
+    test_excel_serial_to_datetime()
@@ -0,0 +1,56 @@
+"""
+Test de los casos de conciliación
+Verifica las búsquedas por clave con claves repetidas: se toma la primera fila de cada clave
+"""
+
+import sys
+from pathlib import Path
+import pandas as pd
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from conciliator import AllianzConciliator
+
+
+def keyed(rows):
+    df = pd.DataFrame(rows)
+    df['_match_key_full'] = df['_poliza_norm'] + "_" + df['_recibo'] + "_" + df['_fecha_inicio_str']
+    df['_match_key_partial'] = df['_poliza_norm'] + "_" + df['_fecha_inicio_str']
+    return df
+
+
+def test_lookups_take_first_row_of_each_key(tmp_path):
+    conciliator = AllianzConciliator(None, None, output_directory=tmp_path)
+    conciliator.combined_df = keyed([
+        # Celer: la misma clave completa dos veces, gana la primera fila
+        {'_source': 'CELER', '_poliza_norm': '23537654', '_recibo': '347252144', '_documento_norm': '347252144',
+         '_fecha_inicio_str': '2025-12-11', 'Poliza': '023537654', 'Documento': '347252144', 'Tomador': 'PRIMERA', 'Saldo': 10, '_tiene_anexo': True},
+        {'_source': 'CELER', '_poliza_norm': '23537654', '_recibo': '347252144', '_documento_norm': '347252144',
+         '_fecha_inicio_str': '2025-12-11', 'Poliza': '023537654', 'Documento': '347252144', 'Tomador': 'SEGUNDA', 'Saldo': 20, '_tiene_anexo': True},
+        # Softseguros sin anexo: misma póliza y fecha que un recibo de Allianz
+        {'_source': 'SOFTSEGUROS', '_poliza_norm': '23770244', '_recibo': 'nan', '_anexo_norm': 'nan',
+         '_fecha_inicio_str': '2024-12-10', 'NÚMERO PÓLIZA': '23770244', 'NÚMERO ANEXO': None, 'TOTAL': 5, '_tiene_anexo': False},
+        # Solo en Softseguros
+        {'_source': 'SOFTSEGUROS', '_poliza_norm': '11111111', '_recibo': '1', '_anexo_norm': '1',
+         '_fecha_inicio_str': '2024-01-01', 'NÚMERO PÓLIZA': '11111111', 'NÚMERO ANEXO': '1', 'TOTAL': 7, '_tiene_anexo': True},
+    ])
+    conciliator.allianz_df = keyed([
+        {'_source': 'PERSONAS', '_poliza_norm': '23537654', '_recibo': '347252144', '_recibo_norm': '347252144',
+         '_fecha_inicio_str': '2025-12-11', 'Cliente - Tomador': 'AGUDELO DIEZ,GLORIA LUCIA', 'Cartera Total': 100},
+        {'_source': 'COLECTIVAS', '_poliza_norm': '23770244', '_recibo': '350761189', '_recibo_norm': '350761189',
+         '_fecha_inicio_str': '2024-12-10', 'Cliente - Tomador': 'GALLEGO ORTIZ, TATIANA', 'Cartera Total': 200},
+        {'_source': 'COLECTIVAS', '_poliza_norm': '23770244', '_recibo': '350761190', '_recibo_norm': '350761190',
+         '_fecha_inicio_str': '2024-12-10', 'Cliente - Tomador': 'GALLEGO ORTIZ, TATIANA', 'Cartera Total': 300},
+        {'_source': 'PERSONAS', '_poliza_norm': '22222222', '_recibo': '2', '_recibo_norm': '2',
+         '_fecha_inicio_str': '2024-02-02', 'Cliente - Tomador': 'SOLO ALLIANZ', 'Cartera Total': 400},
+    ])
+
+    conciliator.perform_conciliation()
+    results = conciliator.results
+
+    assert [(r['tomador'], r['saldo'], r['cartera_total']) for r in results['no_pagado']] == [('PRIMERA', 10, 100)]
+    assert [(r['recibo_allianz'], r['cartera_allianz']) for r in results['actualizar_recibo_softseguros']] == [('350761189', 200)]
+    assert results['actualizar_sistema'] == []
+    assert [r['cliente'] for r in results['only_allianz']] == ['SOLO ALLIANZ']
+    assert [(r['poliza'], r['saldo']) for r in results['only_combined']] == [('11111111', 7)]
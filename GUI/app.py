@@ -3,6 +3,7 @@ Seguros Unión - Sistema de Conciliación
 Main application entry point
 """
 import sys
+import multiprocessing
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
 from main_window import MainWindow
@@ -34,4 +35,6 @@ def main():
 
 
 if __name__ == '__main__':
+    # Input files are read in worker processes; needed by the frozen executable
+    multiprocessing.freeze_support()
     main()
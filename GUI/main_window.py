@@ -114,9 +114,24 @@ class MainWindow(QMainWindow):
         # Create and start worker
         self.transformer_worker = TransformerWorker(file_path)
         self.transformer_worker.progress.connect(self.transformer_tab.update_progress)
+        self.transformer_worker.transformed.connect(self.on_transformer_result)
+        self.transformer_worker.output_failed.connect(self.on_transformer_output_failed)
         self.transformer_worker.finished.connect(self.on_transformer_finished)
         self.transformer_worker.start()
         
+    def on_transformer_result(self, celer_data, output_file: str):
+        """Hand the transformed data to the conciliator while the file is written"""
+        self.conciliator_tab.load_celer_file(output_file, celer_data)
+        self.status_bar.showMessage("✓ Datos Celer cargados en Conciliador (guardando archivo...)", 5000)
+        
+    def on_transformer_output_failed(self, output_file: str, workbook_written: bool):
+        """Keep or drop the data handed to the conciliator when saving the output fails"""
+        if workbook_written:
+            # Only the Parquet copy is missing: the data matches the workbook
+            self.status_bar.showMessage("⚠ Copia Parquet no guardada, se leerá el archivo Excel la próxima vez", 5000)
+        else:
+            self.conciliator_tab.unload_celer_file(output_file)
+        
     def on_transformer_finished(self, success: bool, message: str, output_file: str):
         """Handle transformer process completion"""
         self.transformer_tab.show_results(success, message, output_file)
@@ -124,8 +139,8 @@ class MainWindow(QMainWindow):
         if success:
             self.status_bar.showMessage("✓ Transformación completada exitosamente", 5000)
             
-            # Auto-load transformed file into conciliator tab
-            if output_file:
+            # Auto-load transformed file into conciliator tab (unless already handed over)
+            if output_file and self.conciliator_tab.celer_file != output_file:
                 self.conciliator_tab.load_celer_file(output_file)
                 self.status_bar.showMessage("✓ Archivo Celer cargado automáticamente en Conciliador", 5000)
         else:
@@ -19,6 +19,7 @@ class ConciliatorTab(QWidget):
         super().__init__(parent)
         self.softseguros_file = None
         self.celer_file = None
+        self.celer_data = None  # Transformed DataFrame handed over by the transformer
         self.allianz_personas_file = None
         self.allianz_colectivas_file = None
         self.output_directory = None
@@ -246,20 +247,44 @@ class ConciliatorTab(QWidget):
     def on_celer_dropped(self, file_path: str):
         """Handle Celer file drop"""
         self.celer_file = file_path
+        self.celer_data = None
         self.check_ready()
         
-    def load_celer_file(self, file_path: str):
-        """Load Celer file programmatically (from transformer)"""
+    def load_celer_file(self, file_path: str, celer_data=None):
+        """
+        Load Celer file programmatically (from transformer)
+        
+        celer_data is the transformed DataFrame, passed to the conciliator
+        instead of reading the file again (optional)
+        """
         from pathlib import Path
         path = Path(file_path)
         
         self.celer_file = str(path)
+        self.celer_data = celer_data
         self.celer_drop.text_label.setText(f"✓ {path.name}")
         self.celer_drop.text_label.setStyleSheet("color: #10b981; font-weight: bold; background: transparent; border: none;")
         self.celer_drop.icon_label.setText("✅")
         self.results_text.append(f"\n✓ Archivo Celer cargado automáticamente: {path.name}\n")
         self.check_ready()
         
+    def unload_celer_file(self, file_path: str):
+        """
+        Drop the Celer data handed over by the transformer if its file could not be written
+        
+        Nothing changes if another Celer file was loaded since.
+        """
+        from pathlib import Path
+        path = Path(file_path)
+        if self.celer_file != str(path):
+            return
+        
+        self.celer_file = None
+        self.celer_data = None
+        self.celer_drop.reset()
+        self.process_button.setEnabled(False)
+        self.results_text.append(f"\n✗ No se pudo guardar {path.name}, se descartaron sus datos Celer\n")
+        
     def on_allianz_personas_dropped(self, file_path: str):
         """Handle Allianz Personas file drop"""
         self.allianz_personas_file = file_path
@@ -299,6 +324,7 @@ class ConciliatorTab(QWidget):
         config = {
             'softseguros': self.softseguros_file,
             'celer': self.celer_file,
+            'celer_data': self.celer_data,
             'allianz_personas': self.allianz_personas_file,
             'allianz_colectivas': self.allianz_colectivas_file,
             'allianz_source': allianz_source,
@@ -339,6 +365,7 @@ class ConciliatorTab(QWidget):
         """Clear all inputs and results"""
         self.softseguros_file = None
         self.celer_file = None
+        self.celer_data = None
         self.allianz_personas_file = None
         self.allianz_colectivas_file = None
         
@@ -4,13 +4,28 @@ Worker Threads - Background processing
 from PyQt6.QtCore import QThread, pyqtSignal
 import sys
 import importlib.util
+import multiprocessing
 from pathlib import Path
 
 
+def signal_progress(signal, start: int, end: int):
+    """
+    Progress callback (done, total) emitting start..end on a progress signal.
+    
+    The readers and writers throttle their callbacks, so the signal only
+    fires a few times per second.
+    """
+    def report(done: int, total: int) -> None:
+        signal.emit(start + (end - start) * done // max(total, 1))
+    return report
+
+
 class TransformerWorker(QThread):
     """Worker thread for Celer transformation"""
     
     progress = pyqtSignal(int)
+    transformed = pyqtSignal(object, str)  # transformed DataFrame, output_file (before it is written)
+    output_failed = pyqtSignal(str, bool)  # output_file handed over by transformed, workbook written
     finished = pyqtSignal(bool, str, str)  # success, message, output_file
     
     def __init__(self, file_path: str):
@@ -19,6 +34,8 @@ class TransformerWorker(QThread):
         
     def run(self):
         """Run the transformation process"""
+        # Output file handed over by the transformed signal, if any
+        handed_over = []
         try:
             # Get transformer path (works both in dev and packaged exe)
             transformer_path = Path(__file__).parent.parent.parent / "TRANSFORMER CELER"
@@ -45,22 +62,39 @@ class TransformerWorker(QThread):
             sys.modules['transformer_module'] = transformer_main  # Register in sys.modules
             spec.loader.exec_module(transformer_main)
             
-            self.progress.emit(30)
-            
             # Determine file type and call appropriate function
             file_path = Path(self.file_path)
             file_extension = file_path.suffix.lower()
             
+            # Read, transform and write report their progress (0-100) into 10-100
+            progress = signal_progress(self.progress, 10, 100)
+            
+            # The result is handed over in memory as soon as it is transformed, so
+            # the conciliator does not wait for the Excel serialization; the workbook
+            # (and a Parquet copy for later runs) is written after, and output_failed
+            # tells whether the handed-over data still has a file behind it
+            def on_transformed(df, path):
+                handed_over.append(str(Path(path).absolute()))
+                self.transformed.emit(df, handed_over[0])
+            
+            # The same portfolio is exported several times a week: with delta only
+            # the rows that changed since the previous export are transformed again
             if file_extension == '.xml':
                 # Process XML file
-                output_file = transformer_main.transform_xml_format(file_path)
+                output_file = transformer_main.transform_xml_format(
+                    file_path, progress=progress, sidecar='parquet', on_transformed=on_transformed, delta=True
+                )
             else:
                 # Process XLSX/XLSB file
-                output_file = transformer_main.transform_xlsx_format(file_path)
-            
-            self.progress.emit(80)
+                output_file = transformer_main.transform_xlsx_format(
+                    file_path, progress=progress, sidecar='parquet', on_transformed=on_transformed, delta=True
+                )
             
             if output_file:
+                # A missing sidecar is only logged by the transformer: the workbook is valid
+                sidecar = output_file.with_suffix('.parquet')
+                if handed_over and not (sidecar.exists() and sidecar.stat().st_mtime >= output_file.stat().st_mtime):
+                    self.output_failed.emit(handed_over[0], True)
                 message = f"Archivo transformado exitosamente"
                 self.finished.emit(True, message, str(output_file.absolute()))
             else:
@@ -69,6 +103,9 @@ class TransformerWorker(QThread):
             self.progress.emit(100)
             
         except Exception as e:
+            if handed_over:
+                # The workbook was not written: the handed-over data has no file behind it
+                self.output_failed.emit(handed_over[0], False)
             error_msg = f"Error durante la transformación: {str(e)}"
             self.finished.emit(False, error_msg, "")
 
@@ -111,14 +148,11 @@ class ConciliatorWorker(QThread):
             
             self.progress.emit(10)
             
-            # Import the conciliator module using importlib
-            spec = importlib.util.spec_from_file_location("conciliator_module", conciliator_path / "conciliator.py")
-            if spec is None or spec.loader is None:
+            # Import the conciliator by its module name from conciliator_path: the
+            # worker processes reading the input files import its readers the same way
+            if not (conciliator_path / "conciliator.py").exists():
                 raise ImportError(f"No se pudo encontrar conciliator.py en {conciliator_path}")
-            
-            conciliator_main = importlib.util.module_from_spec(spec)
-            sys.modules['conciliator_module'] = conciliator_main  # Register in sys.modules
-            spec.loader.exec_module(conciliator_main)
+            conciliator_main = importlib.import_module("conciliator")
             
             self.progress.emit(20)
             
@@ -130,16 +164,18 @@ class ConciliatorWorker(QThread):
                 data_source_type='both',
                 softseguros_file_path=self.config['softseguros'],
                 celer_file_path=self.config['celer'],
-                output_directory=self.config.get('output_directory')
+                celer_data=self.config.get('celer_data'),
+                output_directory=self.config.get('output_directory'),
+                progress=signal_progress(self.progress, 20, 90),
+                # Input files are read in spawned worker processes: forking this
+                # multi-threaded Qt process could copy locks held by other threads
+                # (app.py calls freeze_support() for the packaged executable)
+                mp_context=multiprocessing.get_context('spawn')
             )
             
-            self.progress.emit(40)
-            
-            # Run conciliation
+            # Run conciliation (reports its progress into 20-90)
             conciliator.run()
             
-            self.progress.emit(80)
-            
             # Generate summary
             summary = self.generate_summary_from_conciliator(conciliator)
             
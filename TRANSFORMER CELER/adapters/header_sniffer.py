@@ -0,0 +1,96 @@
+"""
+Header Sniffer
+--------------
+Reads only the header row of an input file (Excel XML, XLSX or XLSB).
+
+Checking the columns of a dropped file should not cost a full parse: each
+format is streamed from the start of the first worksheet and reading stops
+at the header row, so the answer comes back in milliseconds whatever the
+number of data rows.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, List
+
+from adapters.xml_reader import ExcelXMLReader
+
+logger = logging.getLogger(__name__)
+
+XML_EXTENSIONS = ('.xml',)
+XLSX_EXTENSIONS = ('.xlsx', '.xlsm')
+XLSB_EXTENSIONS = ('.xlsb',)
+
+
+def sniff_headers(file_path: Path, header_row: int = 4) -> List[Any]:
+    """
+    Read the header row of the first worksheet of a file.
+
+    Trailing empty cells are dropped, as pandas does when it reads the header.
+
+    Args:
+        file_path: Path to .xml, .xlsx/.xlsm or .xlsb file
+        header_row: Row index where headers are located (0-indexed)
+
+    Returns:
+        Header values in column order
+
+    Raises:
+        ValueError: If the format is not supported or there is no row at header_row
+        ImportError: If the reader library for the format is not installed
+    """
+    file_path = Path(file_path)
+    suffix = file_path.suffix.lower()
+
+    if suffix in XML_EXTENSIONS:
+        headers = ExcelXMLReader().read_headers(file_path, header_row)
+    elif suffix in XLSX_EXTENSIONS:
+        headers = _sniff_xlsx(file_path, header_row)
+    elif suffix in XLSB_EXTENSIONS:
+        headers = _sniff_xlsb(file_path, header_row)
+    else:
+        raise ValueError(f"Unsupported file format: {file_path.suffix}")
+
+    while headers and headers[-1] is None:
+        headers.pop()
+
+    logger.debug(f"Sniffed {len(headers)} headers at row {header_row} of {file_path.name}")
+    return headers
+
+
+def _sniff_xlsx(file_path: Path, header_row: int) -> List[Any]:
+    """Read one row of the first sheet with openpyxl in read-only mode"""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        for row in sheet.iter_rows(
+            min_row=header_row + 1, max_row=header_row + 1, values_only=True
+        ):
+            return list(row)
+    finally:
+        workbook.close()
+
+    raise ValueError(f"No header row found at index {header_row}")
+
+
+def _sniff_xlsb(file_path: Path, header_row: int) -> List[Any]:
+    """Read one row of the first sheet with pyxlsb"""
+    try:
+        from pyxlsb import open_workbook
+    except ImportError:
+        raise ImportError("pyxlsb is required to read .xlsb files")
+
+    with open_workbook(str(file_path)) as workbook:
+        with workbook.get_sheet(1) as sheet:
+            # Sparse rows skip blank ones, so the row number comes from the cells
+            for row in sheet.rows(sparse=True):
+                row_idx = row[0].r if row else -1
+                if row_idx == header_row:
+                    return [cell.v for cell in row]
+                if row_idx > header_row:
+                    # Blank header row
+                    return []
+
+    raise ValueError(f"No header row found at index {header_row}")
@@ -0,0 +1,339 @@
+"""
+On-disk cache of parsed input files.
+
+Parsing the Celer XML export, the Softseguros workbook and the Allianz
+.xlsb reports dominates every run, yet the same files are processed many
+times a day. Parsed DataFrames are stored as Parquet files keyed by the
+SHA-256 of the input content plus the reader name/version and the reader
+options, so a warm run skips Excel/XML parsing entirely and any change to
+the file or to the reader produces a new entry.
+
+The cache is bounded in size; least recently used entries are evicted
+first. It is shared by the transformer and the conciliator and can be
+configured or bypassed through environment variables:
+
+    PARSE_CACHE_DIR       Cache directory (default: ~/.cache/conciliator_parse_cache)
+    PARSE_CACHE_MAX_MB    Size bound in MB (default: 512)
+    PARSE_CACHE_DISABLED  Set to 1/true/yes to bypass the cache
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout changes; old entries are then never hit again
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "conciliator_parse_cache"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+_METADATA_KEY = b"parse_cache"
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def _json_option(value: Any) -> Any:
+    """JSON form of an option value; sets are sorted so the key does not depend on the hash seed"""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes")
+
+
+class ParseCache:
+    """
+    Size-bounded LRU cache of parsed DataFrames stored as Parquet files.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: Optional[int] = None,
+        enabled: Optional[bool] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (default: PARSE_CACHE_DIR or
+                ~/.cache/conciliator_parse_cache)
+            max_bytes: Size bound for all entries (default: PARSE_CACHE_MAX_MB or 512 MB)
+            enabled: Whether the cache is used (default: unless PARSE_CACHE_DISABLED)
+        """
+        if cache_dir is None:
+            cache_dir = Path(os.environ.get("PARSE_CACHE_DIR", DEFAULT_CACHE_DIR))
+        if max_bytes is None:
+            max_mb = os.environ.get("PARSE_CACHE_MAX_MB")
+            max_bytes = int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES
+        if enabled is None:
+            enabled = not _env_flag("PARSE_CACHE_DISABLED")
+
+        if enabled and not PYARROW_AVAILABLE:
+            logger.info("pyarrow not installed, parse cache disabled")
+            enabled = False
+
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        # (path, size, mtime) -> content hash, so a file is hashed once per process
+        self._hash_memo: Dict[Tuple[str, int, int], str] = {}
+
+    def file_hash(self, file_path: Path) -> str:
+        """
+        Compute the SHA-256 of a file's content.
+
+        Args:
+            file_path: File to hash
+
+        Returns:
+            Hex digest of the content
+        """
+        stat = os.stat(file_path)
+        memo_key = (str(Path(file_path).resolve()), stat.st_size, stat.st_mtime_ns)
+        digest = self._hash_memo.get(memo_key)
+        if digest is None:
+            sha = hashlib.sha256()
+            with open(file_path, "rb") as f:
+                for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+                    sha.update(block)
+            digest = sha.hexdigest()
+            self._hash_memo[memo_key] = digest
+        return digest
+
+    def make_key(
+        self,
+        file_path: Path,
+        reader: str,
+        options: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Build the cache key for a file parsed by a given reader.
+
+        Args:
+            file_path: Input file
+            reader: Reader name and version (e.g. "celer_xml/3")
+            options: Reader options that affect the result
+
+        Returns:
+            Hex key identifying the parsed result
+        """
+        identity = json.dumps(
+            {
+                "format": CACHE_FORMAT_VERSION,
+                "pandas": pd.__version__,
+                "reader": reader,
+                "options": options or {},
+                "content": self.file_hash(file_path),
+            },
+            sort_keys=True,
+            default=_json_option
+        )
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.parquet"
+
+    def load(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Load a cached DataFrame.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Cached DataFrame, or None on a miss
+        """
+        path = self._entry_path(key)
+        if not path.exists():
+            return None
+
+        try:
+            table = pq.read_table(path)
+            df = table.to_pandas()
+            info = json.loads((table.schema.metadata or {}).get(_METADATA_KEY, b"{}"))
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        # Object columns read by pandas hold NaN for empty cells; Parquet
+        # hands them back as None
+        for position in info.get("nan_columns", []):
+            column = df.iloc[:, position]
+            df.isetitem(position, column.where(column.notna(), math.nan))
+
+        # Mark as recently used
+        os.utime(path)
+        return df
+
+    def store(self, key: str, df: pd.DataFrame) -> bool:
+        """
+        Store a DataFrame and evict old entries beyond the size bound.
+
+        Frames that do not round-trip through Parquet exactly (duplicated or
+        non-string column names, columns mixing types) are not cached.
+
+        Args:
+            key: Key from make_key
+            df: DataFrame to cache
+
+        Returns:
+            True if the entry was written
+        """
+        nan_columns = self._nan_columns(df)
+        if nan_columns is None:
+            logger.debug("DataFrame not cacheable: column names or null markers do not round-trip")
+            return False
+
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=True)
+        except (pa.ArrowException, TypeError, ValueError) as e:
+            logger.debug(f"DataFrame not cacheable: {e}")
+            return False
+
+        metadata = dict(table.schema.metadata or {})
+        metadata[_METADATA_KEY] = json.dumps({"nan_columns": nan_columns}).encode("utf-8")
+        table = table.replace_schema_metadata(metadata)
+
+        path = self._entry_path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return False
+
+        self.evict()
+        return True
+
+    @staticmethod
+    def _nan_columns(df: pd.DataFrame) -> Optional[List[int]]:
+        """
+        Find object columns whose empty cells are NaN rather than None.
+
+        Returns:
+            Column positions to restore on load, or None if the frame cannot
+            be cached faithfully
+        """
+        columns = list(df.columns)
+        if len(set(columns)) != len(columns) or not all(isinstance(c, str) for c in columns):
+            return None
+
+        nan_columns = []
+        for position in range(df.shape[1]):
+            column = df.iloc[:, position]
+            if column.dtype != object:
+                continue
+            nulls = column[column.isna()]
+            if nulls.empty:
+                continue
+            is_nan = [isinstance(value, float) for value in nulls]
+            if all(is_nan):
+                nan_columns.append(position)
+            elif any(is_nan) or not all(value is None for value in nulls):
+                # Mixed None/NaN/NaT markers cannot be restored exactly
+                return None
+        return nan_columns
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits max_bytes."""
+        if not self.cache_dir.exists():
+            return
+
+        entries = []
+        for path in self.cache_dir.glob("*.parquet"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.debug(f"Evicted cache entry {path.name}")
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.parquet"):
+                path.unlink(missing_ok=True)
+
+    def get_or_parse(
+        self,
+        file_path: Path,
+        reader: str,
+        parse: Callable[[], pd.DataFrame],
+        options: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True
+    ) -> pd.DataFrame:
+        """
+        Return the cached DataFrame for a file, parsing and storing it on a miss.
+
+        Args:
+            file_path: Input file
+            reader: Reader name and version (e.g. "celer_xml/3")
+            parse: Callable producing the DataFrame on a miss
+            options: Reader options that affect the result
+            use_cache: Set to False to bypass the cache for this call
+
+        Returns:
+            Parsed DataFrame
+        """
+        if not (self.enabled and use_cache):
+            return parse()
+
+        try:
+            key = self.make_key(file_path, reader, options)
+        except OSError:
+            # Let the reader report missing/unreadable files
+            return parse()
+
+        df = self.load(key)
+        if df is not None:
+            logger.info(f"Loaded {Path(file_path).name} from parse cache ({len(df)} rows)")
+            return df
+
+        df = parse()
+        if self.store(key, df):
+            logger.info(f"Stored {Path(file_path).name} in parse cache")
+        return df
+
+
+_default_cache: Optional[ParseCache] = None
+
+
+def get_parse_cache() -> ParseCache:
+    """
+    Get the process-wide cache configured from the environment.
+
+    Returns:
+        Shared ParseCache instance
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ParseCache()
+    return _default_cache
@@ -0,0 +1,123 @@
+"""
+Progress Reporting
+------------------
+Callback protocol used by the readers and writers to report how far a
+long operation has got.
+
+A progress callback takes (done, total) in the unit of the operation
+(bytes read, rows written, ...). Readers call it through ProgressReporter,
+which throttles the calls to a few per second, so reporting from a hot
+loop costs one clock read per update.
+"""
+
+import io
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+ProgressCallback = Callable[[int, int], None]
+
+# Minimum seconds between two calls to the callback
+DEFAULT_INTERVAL = 0.2
+
+
+class ProgressReporter:
+    """
+    Throttled progress reporting towards a fixed total.
+    """
+
+    __slots__ = ('callback', 'total', 'done', 'interval', '_last_call')
+
+    def __init__(self, callback: Optional[ProgressCallback], total: int, interval: float = DEFAULT_INTERVAL):
+        """
+        Args:
+            callback: Progress callback, or None to report nothing
+            total: Amount of work when done
+            interval: Minimum seconds between two callback calls
+        """
+        self.callback = callback
+        self.total = max(int(total), 0)
+        self.done = 0
+        self.interval = interval
+        self._last_call = 0.0
+
+    def update(self, done: int) -> None:
+        """Set the amount of work done (never moves backwards, capped at total)"""
+        if done > self.done:
+            self.done = min(int(done), self.total)
+        self._report()
+
+    def advance(self, amount: int) -> None:
+        """Add to the amount of work done"""
+        self.update(self.done + amount)
+
+    def finish(self) -> None:
+        """Report completion, bypassing the throttle"""
+        self.done = self.total
+        if self.callback is not None:
+            self.callback(self.total, self.total)
+
+    def _report(self) -> None:
+        if self.callback is None:
+            return
+        now = time.monotonic()
+        if now - self._last_call >= self.interval:
+            self._last_call = now
+            self.callback(self.done, self.total)
+
+
+class ProgressFile(io.FileIO):
+    """
+    Binary file that reports the bytes read through a ProgressReporter.
+
+    Readers that only accept a path or a file object (pandas.read_excel)
+    get progress this way without any change to their loop.
+    """
+
+    def __init__(self, file_path: Path, reporter: ProgressReporter):
+        super().__init__(file_path, 'rb')
+        self._reporter = reporter
+
+    def readinto(self, buffer) -> int:
+        size = super().readinto(buffer)
+        if size:
+            self._reporter.advance(size)
+        return size
+
+    def read(self, size: int = -1) -> bytes:
+        data = super().read(size)
+        self._reporter.advance(len(data))
+        return data
+
+    def readall(self) -> bytes:
+        data = super().readall()
+        self._reporter.advance(len(data))
+        return data
+
+
+def progress_stage(
+    callback: Optional[ProgressCallback],
+    start: int,
+    end: int,
+    total: int = 100
+) -> Optional[ProgressCallback]:
+    """
+    Map the progress of one stage of a pipeline onto part of the overall scale.
+
+    Args:
+        callback: Overall progress callback (or None)
+        start: Overall progress when the stage begins
+        end: Overall progress when the stage ends
+        total: Overall total (default: 100, a percentage)
+
+    Returns:
+        Callback for the stage, or None if callback is None
+    """
+    if callback is None:
+        return None
+
+    def report(done: int, stage_total: int) -> None:
+        fraction = done / stage_total if stage_total else 1.0
+        callback(start + int((end - start) * fraction), total)
+
+    return report
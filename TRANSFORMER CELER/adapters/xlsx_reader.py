@@ -0,0 +1,196 @@
+"""
+XLSX Reader Engines
+-------------------
+Excel engines used to read .xlsx exports through pandas.
+
+openpyxl builds a Python object for every cell of every column before
+pandas sees the values. calamine (the Rust reader behind python-calamine)
+decodes the sheet natively and is about ten times faster on the Celer
+export. It is optional: the fastest installed engine is picked
+automatically.
+
+The engines only disagree on date-formatted cells whose Excel serial is
+below 1, which have no date part (negative serials are not even valid
+dates in Excel): calamine reads them as times of day, openpyxl as
+datetimes before 1899-12-30. read_xlsx turns the latter into the same
+times of day, so both engines give the same DataFrame. pyxlsb does not
+read number formats: date cells of .xlsb files come back as serial numbers.
+
+Binary workbooks (.xlsb) cannot be opened by openpyxl; they are read by
+calamine or, when it is not installed, by pyxlsb.
+
+Only the requested columns (usecols) are kept, so columns that are not
+mapped are never converted to Series.
+"""
+
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Version of the DataFrames produced by read_xlsx. Bump it whenever the
+# output changes (dtypes, null handling, ...) so parse cache entries built
+# by an older reader are not reused.
+READER_VERSION = 1
+
+# Excel serial 0; openpyxl reads negative serials as datetimes before it
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+
+# Engine names for pandas.read_excel, fastest first
+XLSX_ENGINES = ('calamine', 'openpyxl')
+XLSB_ENGINES = ('calamine', 'pyxlsb')
+
+# Engines able to read each file format
+_FORMAT_ENGINES = {'xlsx': XLSX_ENGINES, 'xlsb': XLSB_ENGINES}
+
+
+def _calamine_available() -> bool:
+    # pandas reads through calamine from 2.2 on
+    if tuple(int(part) for part in pd.__version__.split('.')[:2]) < (2, 2):
+        return False
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _pyxlsb_available() -> bool:
+    try:
+        import pyxlsb  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def excel_file_format(file_path: Union[str, Path]) -> str:
+    """
+    File format of an Excel workbook, from its extension.
+    
+    Args:
+        file_path: Workbook path
+        
+    Returns:
+        'xlsb' for binary workbooks, 'xlsx' otherwise
+    """
+    return 'xlsb' if Path(file_path).suffix.lower() == '.xlsb' else 'xlsx'
+
+
+def available_xlsx_engines(file_format: str = 'xlsx') -> List[str]:
+    """
+    List the engines whose library is installed.
+    
+    Args:
+        file_format: 'xlsx' or 'xlsb'
+    
+    Returns:
+        Engine names able to read the format, fastest first
+    """
+    installed = {'calamine': _calamine_available, 'pyxlsb': _pyxlsb_available}
+    return [
+        engine for engine in _FORMAT_ENGINES[file_format]
+        if engine not in installed or installed[engine]()
+    ]
+
+
+def select_xlsx_engine(engine: str = 'auto', file_format: str = 'xlsx') -> str:
+    """
+    Resolve the engine used to read XLSX/XLSB files.
+    
+    Args:
+        engine: Engine name (see XLSX_ENGINES, XLSB_ENGINES), or 'auto' for
+            the fastest installed one
+        file_format: 'xlsx' or 'xlsb' (see excel_file_format)
+        
+    Returns:
+        Engine name
+        
+    Raises:
+        ValueError: If the engine is unknown, cannot read the format or its
+            library is not installed
+    """
+    engines = _FORMAT_ENGINES[file_format]
+    available = available_xlsx_engines(file_format)
+    if engine == 'auto':
+        if not available:
+            raise ValueError(
+                f"No engine installed for .{file_format} files (install one of {engines})"
+            )
+        return available[0]
+    if engine not in engines:
+        raise ValueError(f"Unknown {file_format.upper()} engine '{engine}'. Expected one of {engines}")
+    if engine not in available:
+        raise ValueError(f"{file_format.upper()} engine '{engine}' is not available (library not installed)")
+    return engine
+
+
+def read_xlsx(
+    source: Union[Path, BinaryIO],
+    header_row: int = 0,
+    usecols: Optional[Iterable[str]] = None,
+    category_columns: Iterable[str] = (),
+    engine: str = 'auto',
+    file_format: str = 'xlsx'
+) -> pd.DataFrame:
+    """
+    Read the first sheet of an XLSX or XLSB file.
+
+    Args:
+        source: Path or binary file-like object
+        header_row: Row index of the header (0-based)
+        usecols: Names of the columns to keep (default: all). Names missing
+            from the file are ignored, so callers can validate them afterwards.
+        category_columns: Columns stored as pandas categoricals
+        engine: Engine name (see XLSX_ENGINES, XLSB_ENGINES), or 'auto'
+        file_format: 'xlsx' or 'xlsb' (see excel_file_format)
+
+    Returns:
+        DataFrame with the sheet data
+    """
+    engine = select_xlsx_engine(engine, file_format)
+    logger.debug(f"Reading XLSX with engine '{engine}'")
+
+    selected: Optional[Callable[[str], bool]] = None
+    if usecols is not None:
+        selected = frozenset(usecols).__contains__
+
+    df = pd.read_excel(
+        source,
+        header=header_row,
+        usecols=selected,
+        dtype={column: 'category' for column in category_columns},
+        engine=engine
+    )
+    if engine == 'openpyxl':
+        _pre_epoch_dates_to_times(df)
+    return df
+
+
+def _pre_epoch_dates_to_times(df: pd.DataFrame) -> None:
+    """
+    Turn openpyxl's datetimes before serial 0 into times of day, as calamine reads them.
+    
+    Args:
+        df: DataFrame read with openpyxl, changed in place
+    """
+    for column in df.columns:
+        values = df[column]
+        if pd.api.types.is_datetime64_any_dtype(values.dtype):
+            pre_epoch = (values < _EXCEL_EPOCH).to_numpy()
+        elif values.dtype == object:
+            pre_epoch = np.fromiter(
+                (isinstance(value, datetime) and value < _EXCEL_EPOCH for value in values),
+                dtype=bool, count=len(values)
+            )
+        else:
+            continue
+        if not pre_epoch.any():
+            continue
+        cells = values.astype(object).where(values.notna(), np.nan).to_numpy()
+        cells[pre_epoch] = [value.time() for value in cells[pre_epoch]]
+        df[column] = pd.Series(cells, index=df.index, dtype=object)
@@ -5,15 +5,34 @@ Reads Excel 2003 XML format files and converts them to pandas DataFrame.
 Handles special characters properly to match XLSX output exactly.
 """
 
+import io
 import logging
+import mmap
+import os
 import xml.etree.ElementTree as ET
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, BinaryIO, Callable, Optional, Iterable, Iterator, Tuple, Union
 import html
 import re
 
+import numpy as np
 import pandas as pd
 
+from adapters.progress import ProgressCallback, ProgressReporter
+from adapters.xml_backends import (
+    MalformedXMLError,
+    create_backend,
+    recovering_backend,
+    select_backend,
+)
+
 logger = logging.getLogger(__name__)
 
 # XML namespaces used in Excel 2003 XML format
@@ -24,6 +43,577 @@ NAMESPACES = {
     'html': 'http://www.w3.org/TR/REC-html40'
 }
 
+# Reader modes:
+#   tree      - build the full document tree, then visit rows (original behaviour)
+#   streaming - iterparse the document and release each Row once it is parsed
+#   parallel  - split the Row elements by byte offset and parse the row ranges
+#               in a process pool, concatenating the column buffers in order
+READER_MODES = ('tree', 'streaming', 'parallel')
+
+# Version of the DataFrames produced by this reader. Bump it whenever the
+# output changes (dtypes, null handling, ...) so parse cache entries built
+# by an older reader are not reused.
+READER_VERSION = 1
+
+# Sentinel stored in datetime buffers for empty cells (NaT as int64 nanoseconds)
+_NAT_NS = np.iinfo(np.int64).min
+_EPOCH = datetime(1970, 1, 1)
+# Range of datetime64[ns] / pd.Timestamp, to the microsecond
+_MIN_DATETIME = datetime(1677, 9, 21, 0, 12, 43, 145225)
+_MAX_DATETIME = datetime(2262, 4, 11, 23, 47, 16, 854775)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+# SpreadsheetML DateTime cells (e.g. 2024-09-20T00:00:00.000), converted per
+# column in batches of _DATETIME_BATCH cells; cells not matching the format
+# go through the per-cell parser
+_ISO_DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+_DATETIME_BATCH = 8192
+
+# Structural tags located by byte offset in parallel mode (any namespace prefix).
+# Data content never holds a raw '<', so these only match real tags.
+_WORKBOOK_START = re.compile(rb'<((?:[\w.-]+:)?Workbook)\b[^>]*>')
+_WORKSHEET_START = re.compile(rb'<((?:[\w.-]+:)?Worksheet)\b[^>]*>')
+_WORKSHEET_END = re.compile(rb'</(?:[\w.-]+:)?Worksheet\s*>')
+_TABLE_START = re.compile(rb'<((?:[\w.-]+:)?Table)\b[^>]*>')
+_TABLE_END = re.compile(rb'</(?:[\w.-]+:)?Table\s*>')
+_ROW_START = re.compile(rb'<(?:[\w.-]+:)?Row[\s/>]')
+# ss:Name attribute of a Worksheet start tag
+_NAME_ATTRIBUTE = re.compile(rb'\s(?:[\w.-]+:)?Name\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+
+# Entity repair: bare '&' inside <Data> content is escaped. Celer does not
+# always encode it, and the rest of the document is left untouched.
+_DATA_ELEMENT = re.compile(r'(<Data[^>]*>)(.*?)(</Data>)', flags=re.DOTALL)
+_DATA_CLOSE = '</Data>'
+_DATA_CLOSE_BYTES = b'</Data>'
+# Bytes handed to the parser per step by the repair stream
+_REPAIR_CHUNK_BYTES = 1024 * 1024
+# Smaller steps when only the header row is read
+_SNIFF_CHUNK_BYTES = 64 * 1024
+
+# Tree mode with automatic backend selection streams files larger than
+# this instead of building their whole tree (same rows, bounded memory)
+_TREE_MAX_BYTES = 32 * 1024 * 1024
+
+# Parallel mode: smallest row range worth shipping to a worker, and number
+# of ranges per worker (several, so uneven ranges still balance out)
+_PARALLEL_MIN_BLOCK_ROWS = 1000
+_PARALLEL_BLOCKS_PER_WORKER = 4
+
+
+class _ColumnBuffer:
+    """
+    Typed accumulator for the values of one column.
+    
+    Cells are appended in row order and the buffer settles on the narrowest
+    storage able to hold everything seen so far:
+    
+        empty -> int     array('q')  Number cells, no gaps
+              -> float   array('d')  Number cells with decimals or gaps (NaN)
+              -> datetime array('q') DateTime cells as ns since epoch (NaT)
+              -> object  list        String cells or mixed types
+    
+    This mirrors what pandas infers from the equivalent list of Python
+    values, so the column array can be handed to the DataFrame as-is.
+    
+    DateTime cells are not parsed one by one: append_datetime_text queues
+    their text and whole batches are converted with one pd.to_datetime call.
+    """
+    
+    __slots__ = ('kind', 'size', 'values', 'int_flags', 'pending')
+    
+    def __init__(self):
+        self.kind = 'empty'
+        self.size = 0
+        self.values: Any = None
+        # For float columns: 1 where the cell was an int (restores ints if
+        # the column later degrades to object)
+        self.int_flags: Optional[bytearray] = None
+        # For datetime columns: DateTime cell texts (None for empty cells)
+        # not converted yet, they follow the cells in values
+        self.pending: List[Optional[str]] = []
+    
+    def append_datetime_text(self, text: str) -> None:
+        """Append the raw text of a DateTime cell"""
+        kind = self.kind
+        if kind == 'empty':
+            self.kind = 'datetime'
+            self.values = array('q', [_NAT_NS]) * self.size
+        elif kind != 'datetime':
+            self.append(ExcelXMLReader._parse_cell_value(text, 'DateTime'))
+            return
+        
+        self.pending.append(text)
+        self.size += 1
+        if len(self.pending) >= _DATETIME_BATCH:
+            self._flush_datetimes()
+    
+    def _flush_datetimes(self) -> None:
+        """Convert the queued DateTime texts in one vectorized call"""
+        pending = self.pending
+        if not pending:
+            return
+        self.pending = []
+        
+        texts = np.array(pending, dtype=object)
+        converted = pd.to_datetime(texts, format=_ISO_DATETIME_FORMAT, errors='coerce')
+        if converted.isna().sum() == pd.isna(texts).sum():
+            self.values.frombytes(converted.as_unit('ns').asi8.tobytes())
+            return
+        
+        # Some cells are not in the fixed format: replay the batch through
+        # the per-cell parser, with the same promotions as append()
+        self.size -= len(pending)
+        for text in pending:
+            self.append(None if text is None else ExcelXMLReader._parse_cell_value(text, 'DateTime'))
+    
+    def append(self, value: Any) -> None:
+        """Append one decoded cell value (None for empty cells)"""
+        kind = self.kind
+        value_type = type(value)
+        
+        if value is None:
+            if kind == 'float':
+                self.values.append(np.nan)
+                self.int_flags.append(0)
+            elif kind == 'datetime':
+                if self.pending:
+                    self.pending.append(None)
+                else:
+                    self.values.append(_NAT_NS)
+            elif kind == 'object':
+                self.values.append(None)
+            elif kind == 'int':
+                self._to_float()
+                self.values.append(np.nan)
+                self.int_flags.append(0)
+            self.size += 1
+            return
+        
+        if self.pending:
+            self._flush_datetimes()
+            kind = self.kind
+        
+        if value_type is int:
+            if kind == 'int':
+                try:
+                    self.values.append(value)
+                except OverflowError:
+                    self._to_object()
+                    self.values.append(value)
+            elif kind == 'float':
+                self.values.append(value)
+                self.int_flags.append(1)
+            elif kind == 'empty':
+                if self.size:
+                    self._to_float()
+                    self.values.append(value)
+                    self.int_flags.append(1)
+                else:
+                    self.kind = 'int'
+                    self.values = array('q', [value])
+            else:
+                if kind != 'object':
+                    self._to_object()
+                self.values.append(value)
+        
+        elif value_type is float:
+            if kind in ('empty', 'int'):
+                self._to_float()
+            elif kind == 'datetime':
+                self._to_object()
+            if self.kind == 'float':
+                self.values.append(value)
+                self.int_flags.append(0)
+            else:
+                self.values.append(value)
+        
+        elif value_type is datetime:
+            if kind == 'empty':
+                self.kind = 'datetime'
+                self.values = array('q', [_NAT_NS]) * self.size
+            elif kind != 'datetime' and kind != 'object':
+                self._to_object()
+            if self.kind == 'datetime':
+                try:
+                    self.values.append((value - _EPOCH) // _ONE_MICROSECOND * 1000)
+                except OverflowError:
+                    # Outside the datetime64[ns] range (1677-2262), e.g. a
+                    # 9999-12-31 "no expiry" date: kept as a Python datetime
+                    # in an object column, as pandas does
+                    self._to_object()
+                    self.values.append(value)
+            elif _MIN_DATETIME <= value <= _MAX_DATETIME:
+                self.values.append(pd.Timestamp(value))
+            else:
+                self.values.append(value)
+        
+        else:
+            if kind != 'object':
+                self._to_object()
+            self.values.append(value)
+        
+        self.size += 1
+    
+    def _to_float(self) -> None:
+        """Promote empty/int storage to float64 (gaps become NaN)"""
+        if self.kind == 'int':
+            self.int_flags = bytearray(b'\x01') * len(self.values)
+            self.values = array('d', self.values)
+        else:
+            self.int_flags = bytearray(self.size)
+            self.values = array('d', [np.nan]) * self.size
+        self.kind = 'float'
+    
+    def _to_object(self) -> None:
+        """Degrade to a list of Python values, restoring the original cell types"""
+        kind = self.kind
+        if kind == 'empty':
+            values = [None] * self.size
+        elif kind == 'int':
+            values = list(self.values)
+        elif kind == 'float':
+            values = [
+                int(value) if is_int else (None if value != value else value)
+                for value, is_int in zip(self.values, self.int_flags)
+            ]
+        elif kind == 'datetime':
+            values = [None if value == _NAT_NS else pd.Timestamp(value) for value in self.values]
+        else:
+            return
+        self.kind = 'object'
+        self.values = values
+        self.int_flags = None
+    
+    def to_array(self) -> np.ndarray:
+        """Return the accumulated column as a typed numpy array"""
+        self._flush_datetimes()
+        kind = self.kind
+        if kind == 'int':
+            return np.frombuffer(self.values, dtype=np.int64)
+        if kind == 'float':
+            return np.frombuffer(self.values, dtype=np.float64)
+        if kind == 'datetime':
+            return np.frombuffer(self.values, dtype=np.int64).view('datetime64[ns]')
+        
+        column = np.empty(self.size, dtype=object)
+        if kind == 'object':
+            column[:] = self.values
+        return column
+    
+    def extend(self, other: '_ColumnBuffer') -> None:
+        """Append every value of another buffer, as if appended one by one"""
+        self._flush_datetimes()
+        other._flush_datetimes()
+        if self.size == 0:
+            self.kind = other.kind
+            self.size = other.size
+            self.values = other.values
+            self.int_flags = other.int_flags
+            return
+        
+        if other.kind == self.kind:
+            if self.kind != 'empty':
+                self.values.extend(other.values)
+                if self.kind == 'float':
+                    self.int_flags.extend(other.int_flags)
+            self.size += other.size
+            return
+        
+        # Different storage: replay the values so promotions match append()
+        for value in other._iter_values():
+            self.append(value)
+    
+    def _iter_values(self) -> Iterator[Any]:
+        """Yield the values as originally appended (None for empty cells)"""
+        self._flush_datetimes()
+        kind = self.kind
+        if kind == 'empty':
+            yield from repeat(None, self.size)
+        elif kind == 'float':
+            for value, is_int in zip(self.values, self.int_flags):
+                yield int(value) if is_int else (None if value != value else value)
+        elif kind == 'datetime':
+            for value in self.values:
+                yield None if value == _NAT_NS else _EPOCH + timedelta(microseconds=value // 1000)
+        else:
+            yield from self.values
+
+
+class _CategoryBuffer:
+    """
+    Dictionary-encoded accumulator for columns with few distinct values.
+    
+    Each distinct value is stored once and cells keep an int32 code into
+    it (-1 for empty cells), so repeated strings such as insurer or branch
+    names are not allocated per row. The column comes out as a pandas
+    Categorical with sorted categories, like Series.astype('category').
+    """
+    
+    __slots__ = ('size', 'codes', 'lookup', 'categories')
+    
+    def __init__(self):
+        self.size = 0
+        self.codes = array('i')
+        self.lookup: Dict[Any, int] = {}
+        self.categories: List[Any] = []
+    
+    def append(self, value: Any) -> None:
+        """Append one decoded cell value (None for empty cells)"""
+        if value is None:
+            self.codes.append(-1)
+        else:
+            self.codes.append(self._code(value))
+        self.size += 1
+    
+    def append_datetime_text(self, text: str) -> None:
+        """Append the raw text of a DateTime cell"""
+        self.append(ExcelXMLReader._parse_cell_value(text, 'DateTime'))
+    
+    def _code(self, value: Any) -> int:
+        code = self.lookup.get(value)
+        if code is None:
+            code = self.lookup[value] = len(self.categories)
+            self.categories.append(value)
+        return code
+    
+    def extend(self, other: '_CategoryBuffer') -> None:
+        """Append every value of another buffer, re-coding its categories"""
+        if self.size == 0:
+            self.size = other.size
+            self.codes = other.codes
+            self.lookup = other.lookup
+            self.categories = other.categories
+            return
+        
+        # Last entry maps the empty code (-1) to itself
+        recode = np.array([self._code(value) for value in other.categories] + [-1], dtype=np.intc)
+        codes = recode[np.frombuffer(other.codes, dtype=np.intc)]
+        self.codes.frombytes(codes.tobytes())
+        self.size += other.size
+    
+    def to_array(self) -> pd.Categorical:
+        """Return the accumulated column as a pandas Categorical"""
+        codes = np.frombuffer(self.codes, dtype=np.intc)
+        categories = pd.Index(self.categories)
+        try:
+            order = np.asarray(categories.argsort())
+        except TypeError:
+            # Values of mixed types cannot be sorted, keep first-seen order
+            order = np.arange(len(categories))
+        
+        rank = np.empty(len(categories) + 1, dtype=np.intc)
+        rank[order] = np.arange(len(categories), dtype=np.intc)
+        rank[-1] = -1
+        return pd.Categorical.from_codes(
+            rank[codes], dtype=pd.CategoricalDtype(categories.take(order))
+        )
+
+
+def _fix_data_content(match: 're.Match[str]') -> str:
+    """Fix entities in Data element content"""
+    opening = match.group(1)
+    content_text = match.group(2)
+    closing = match.group(3)
+    
+    # Replace special characters with entities
+    fixed_content = content_text
+    fixed_content = fixed_content.replace('&', '&amp;')
+    fixed_content = fixed_content.replace('&amp;amp;', '&amp;')
+    
+    return opening + fixed_content + closing
+
+
+def _repair_data_entities(text: str) -> str:
+    """
+    Escape bare '&' inside the Data elements of an XML fragment.
+    
+    The fragment must start at an element boundary (document start or just
+    after a </Data>). Only the Data elements holding an '&' are rewritten,
+    everything else is copied as-is. Data start tags are assumed to be
+    closed by their own '>' (true for any SpreadsheetML export).
+    
+    Args:
+        text: XML text
+        
+    Returns:
+        Repaired XML text
+    """
+    amp = text.find('&')
+    if amp == -1:
+        return text
+    
+    pieces = []
+    position = 0
+    while amp != -1:
+        # A </Data> always ends any element, so the span between the
+        # closings around the '&' can be repaired on its own
+        start = text.rfind(_DATA_CLOSE, position, amp)
+        start = position if start == -1 else start + len(_DATA_CLOSE)
+        end = text.find(_DATA_CLOSE, amp)
+        end = len(text) if end == -1 else end + len(_DATA_CLOSE)
+        
+        pieces.append(text[position:start])
+        pieces.append(_DATA_ELEMENT.sub(_fix_data_content, text[start:end]))
+        position = end
+        amp = text.find('&', position)
+    
+    pieces.append(text[position:])
+    return ''.join(pieces)
+
+
+@dataclass(frozen=True)
+class WorksheetSpan:
+    """
+    Location of one worksheet in a SpreadsheetML file.
+    
+    Attributes:
+        name: Worksheet name (ss:Name)
+        index: Position of the worksheet in the workbook (0-based)
+        start: Byte offset of the Worksheet start tag
+        end: Byte offset just past the Worksheet end tag
+        prefix: Workbook start tag, read before the worksheet so namespaces resolve
+        suffix: Workbook end tag
+    """
+    name: str
+    index: int
+    start: int
+    end: int
+    prefix: bytes
+    suffix: bytes
+    
+    @property
+    def size(self) -> int:
+        """Bytes of the worksheet in the file"""
+        return self.end - self.start
+
+
+class _RepairedXMLStream(io.RawIOBase):
+    """
+    Read-only binary stream over an XML file with Data entities repaired.
+    
+    The file is memory-mapped and handed to the parser one step at a time,
+    straight from the map. A step ends just after a </Data>, so no element
+    or character is split by a step boundary. Valid UTF-8 is not copied:
+    only the spans around the Data elements holding an '&' are decoded,
+    repaired and encoded again. A step with invalid UTF-8 is decoded whole
+    with the bad bytes replaced, then repaired.
+    Bytes read from the file are reported to the optional progress reporter.
+    
+    The stream can cover a region of the file only (a worksheet, a range of
+    rows), read between a prefix and a suffix holding the enclosing start
+    and end tags so namespaces resolve.
+    """
+    
+    def __init__(
+        self,
+        file_path: Path,
+        prefix: bytes = b'',
+        start: int = 0,
+        end: Optional[int] = None,
+        suffix: bytes = b'',
+        chunk_bytes: int = _REPAIR_CHUNK_BYTES,
+        reporter: Optional[ProgressReporter] = None
+    ):
+        super().__init__()
+        with open(file_path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            # An empty file cannot be mapped
+            self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self._view = memoryview(self._data)
+        self._start = start
+        self._position = start
+        self._end = size if end is None else end
+        self._suffix = suffix
+        self._chunk_bytes = chunk_bytes
+        self._reporter = reporter
+        self._parts = deque()
+        self._queue(prefix)
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, target: Any) -> int:
+        while not self._parts:
+            if not self._next_step():
+                return 0
+        
+        part = self._parts[0]
+        size = min(len(target), len(part))
+        target[:size] = part[:size]
+        if size == len(part):
+            self._parts.popleft()
+        else:
+            self._parts[0] = part[size:]
+        return size
+    
+    def readall(self) -> bytes:
+        while self._next_step():
+            pass
+        document = b''.join(self._parts)
+        self._parts.clear()
+        return document
+    
+    def close(self) -> None:
+        if not self.closed:
+            self._parts.clear()
+            self._view.release()
+            if isinstance(self._data, mmap.mmap):
+                self._data.close()
+        super().close()
+    
+    def _queue(self, part: Any) -> None:
+        if len(part):
+            self._parts.append(memoryview(part))
+    
+    def _next_step(self) -> bool:
+        """Queue the next step of the region (then the suffix), False at the end"""
+        if self._position >= self._end:
+            if self._suffix is None:
+                return False
+            self._queue(self._suffix)
+            self._suffix = None
+            return True
+        
+        start = self._position
+        end = min(start + self._chunk_bytes, self._end)
+        if end < self._end:
+            close = self._data.rfind(_DATA_CLOSE_BYTES, start, end)
+            if close == -1:
+                close = self._data.find(_DATA_CLOSE_BYTES, end, self._end)
+            end = self._end if close == -1 else close + len(_DATA_CLOSE_BYTES)
+        
+        self._position = end
+        if self._reporter is not None:
+            self._reporter.update(end - self._start)
+        self._queue_repaired(start, end)
+        return True
+    
+    def _queue_repaired(self, start: int, end: int) -> None:
+        """Queue the bytes from start to end with bare '&' in Data elements escaped"""
+        step = self._view[start:end]
+        try:
+            # Only validates the step, the decoded text is dropped
+            str(step, 'utf-8')
+        except UnicodeDecodeError:
+            self._queue(_repair_data_entities(str(step, 'utf-8', 'replace')).encode('utf-8'))
+            return
+        
+        # Same spans as _repair_data_entities, found in the mapped bytes
+        position = start
+        amp = self._data.find(b'&', position, end)
+        while amp != -1:
+            span_start = self._data.rfind(_DATA_CLOSE_BYTES, position, amp)
+            span_start = position if span_start == -1 else span_start + len(_DATA_CLOSE_BYTES)
+            span_end = self._data.find(_DATA_CLOSE_BYTES, amp, end)
+            span_end = end if span_end == -1 else span_end + len(_DATA_CLOSE_BYTES)
+            
+            self._queue(self._view[position:span_start])
+            span = str(self._view[span_start:span_end], 'utf-8')
+            self._queue(_DATA_ELEMENT.sub(_fix_data_content, span).encode('utf-8'))
+            position = span_end
+            amp = self._data.find(b'&', position, end)
+        
+        self._queue(self._view[position:end])
+
 
 class ExcelXMLReader:
     """
@@ -32,125 +622,622 @@ class ExcelXMLReader:
     Handles the SpreadsheetML format which uses nested XML structure
     with Workbook > Worksheet > Table > Row > Cell elements.
     Properly preserves special characters like &, accents, etc.
+    
+    In 'streaming' mode rows are handled as soon as the parser closes them
+    and are cleared right after, so memory does not grow with the tree.
+    In 'parallel' mode the rows after the header are split into byte
+    ranges parsed by a pool of worker processes.
+    Every mode feeds the parser from a memory map of the file.
+    All modes produce the same DataFrame.
+    
+    The XML parser is a pluggable backend (see adapters.xml_backends). By
+    default it is chosen per file: well-formed documents use the fastest
+    strict parser, malformed ones lxml in recover mode, and a strict parse
+    that fails part way resumes in recover mode from the row it reached.
     """
     
-    def __init__(self):
+    def __init__(self, mode: str = 'tree', workers: Optional[int] = None, backend: str = 'auto'):
+        """
+        Args:
+            mode: Reader mode (see READER_MODES)
+            workers: Worker processes for 'parallel' mode (default: CPU count)
+            backend: Parser backend name (see xml_backends.BACKENDS), or
+                'auto' to pick one per file
+        """
+        if mode not in READER_MODES:
+            raise ValueError(f"Unknown reader mode '{mode}'. Expected one of {READER_MODES}")
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be a positive integer, got {workers}")
+        if backend != 'auto':
+            # Fails early for unknown or missing backends
+            parser_backend = create_backend(backend)
+            if mode != 'tree' and not parser_backend.streams:
+                raise ValueError(f"Parser backend '{backend}' does not stream, it cannot be used in '{mode}' mode")
         self.namespaces = NAMESPACES
-        logger.info("ExcelXMLReader initialized")
+        self.mode = mode
+        self.workers = workers or os.cpu_count() or 1
+        self.backend = backend
+        logger.info(f"ExcelXMLReader initialized (mode={mode}, backend={backend})")
     
-    def _preprocess_xml(self, file_path: Path) -> bytes:
+    def _open_repaired(
+        self,
+        file_path: Path,
+        reporter: Optional[ProgressReporter] = None,
+        worksheet: Optional[WorksheetSpan] = None
+    ) -> _RepairedXMLStream:
+        """
+        Open the XML file as a binary stream with entity issues fixed.
+        
+        Celer exports may contain bare '&' inside Data elements; they are
+        escaped on the fly while the parser reads the memory-mapped file,
+        without holding a second copy of the document.
+        
+        Args:
+            file_path: Path to XML file
+            reporter: Receives the bytes read from the file (optional)
+            worksheet: Only read this worksheet (optional, default: whole file)
+            
+        Returns:
+            Readable binary stream with the repaired XML
+        """
+        if worksheet is None:
+            return _RepairedXMLStream(file_path, reporter=reporter)
+        return _RepairedXMLStream(
+            file_path, worksheet.prefix, worksheet.start, worksheet.end, worksheet.suffix, reporter=reporter
+        )
+    
+    def _preprocess_xml(self, file_path: Path, reporter: Optional[ProgressReporter] = None) -> bytes:
         """
         Pre-process XML file to handle special characters properly.
         Reads the file and ensures entities are properly encoded.
         
         Args:
             file_path: Path to XML file
+            reporter: Receives the bytes read from the file (optional)
             
         Returns:
             Processed XML content as bytes
         """
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
-        
-        # Fix common entity issues in malformed XML
-        # Excel XML should have entities properly encoded, but Celer might not
-        # We need to be careful not to break existing proper XML
-        # Only fix entities within Data elements
-        def fix_data_content(match):
-            """Fix entities in Data element content"""
-            opening = match.group(1)
-            content_text = match.group(2)
-            closing = match.group(3)
-            
-            # Replace special characters with entities
-            fixed_content = content_text
-            fixed_content = fixed_content.replace('&', '&amp;')
-            fixed_content = fixed_content.replace('&amp;amp;', '&amp;')
-            
-            return opening + fixed_content + closing
-        
-        # Pattern to match Data elements with content
-        # This preserves XML structure while fixing content
-        pattern = r'(<Data[^>]*>)(.*?)(</Data>)'
-        content = re.sub(pattern, fix_data_content, content, flags=re.DOTALL)
-        
-        return content.encode('utf-8')
+        with self._open_repaired(file_path, reporter) as source:
+            return source.readall()
     
     def read_xml_to_dataframe(
         self, 
         file_path: Path, 
-        header_row: int = 4
+        header_row: int = 4,
+        usecols: Optional[Iterable[str]] = None,
+        category_columns: Optional[Iterable[str]] = None,
+        progress: Optional[ProgressCallback] = None,
+        worksheet: Optional[WorksheetSpan] = None
     ) -> pd.DataFrame:
         """
         Read Excel XML file and convert to pandas DataFrame.
-        Uses lxml parser with special character preservation.
+        Uses the reader's parser backend, with special character preservation.
         
         Args:
             file_path: Path to XML file
             header_row: Row index where headers are located (0-indexed)
+            usecols: Column names to keep (optional). Cells of any other
+                column are skipped without being decoded.
+            category_columns: Columns to dictionary-encode as pandas
+                category (optional), for fields with few distinct values
+            progress: Called with (bytes read, file size) while reading,
+                a few times per second (optional). In 'parallel' mode the
+                total is twice the file size: reading, then decoding.
+            worksheet: Worksheet to read, from ExcelXMLWorkbook (optional,
+                default: the first one). Only its bytes are parsed.
             
         Returns:
             DataFrame with data from XML file
         """
         logger.info(f"Reading XML file: {file_path}")
+        file_size = os.path.getsize(file_path) if worksheet is None else worksheet.size
         
-        # Pre-process the XML file to fix common entity issues
-        xml_content = self._preprocess_xml(file_path)
-        
-        try:
-            # Try with lxml parser (more robust)
-            try:
-                import lxml.etree as letree
-                parser = letree.XMLParser(recover=True, encoding='utf-8')
-                root = letree.fromstring(xml_content, parser)
-                logger.info("Successfully parsed XML with lxml (recover mode)")
-            except ImportError:
-                # Fallback to built-in ElementTree
-                logger.warning("lxml not available, using built-in ElementTree")
-                root = ET.fromstring(xml_content)
-            
-        except Exception as e:
-            logger.error(f"Failed to parse XML file: {e}")
-            raise ValueError(f"Failed to parse XML file: {e}")
-        
-        # Find the worksheet (usually first one)
-        worksheet = root.find('.//ss:Worksheet', self.namespaces)
-        if worksheet is None:
-            raise ValueError("No Worksheet found in XML file")
-        
-        # Find the table
-        table = worksheet.find('.//ss:Table', self.namespaces)
-        if table is None:
-            raise ValueError("No Table found in Worksheet")
+        if self.mode == 'parallel':
+            reporter = ProgressReporter(progress, 2 * file_size)
+            headers, buffers, size = self._decode_parallel(
+                file_path, header_row, usecols, category_columns, reporter, worksheet
+            )
+            df = self._build_frame(headers, buffers, size)
+            reporter.finish()
+            logger.info(f"Created DataFrame with {len(df)} rows and {len(df.columns)} columns")
+            return df
         
-        # Extract all rows
-        rows = table.findall('.//ss:Row', self.namespaces)
-        logger.info(f"Found {len(rows)} rows in XML")
+        reporter = ProgressReporter(progress, file_size)
+        if self.mode == 'streaming':
+            rows = self._iter_rows_streaming(file_path, reporter, worksheet)
+        else:
+            rows = self._iter_rows_tree(file_path, reporter, worksheet)
         
-        # Parse rows into list of lists
-        data_rows = []
+        # Decode data rows straight into typed per-column buffers
         headers = None
+        buffers: List[Optional[_ColumnBuffer]] = []
+        size = 0
         
         for row_idx, row in enumerate(rows):
-            row_data = self._parse_row(row)
+            if row_idx < header_row:
+                continue
             
             if row_idx == header_row:
                 # This is the header row
-                headers = row_data
+                headers = self._parse_row(row)
+                buffers = self._new_buffers(headers, usecols, category_columns)
                 logger.info(f"Found {len(headers)} headers at row {header_row}")
-            elif row_idx > header_row:
+            else:
                 # Data rows after header
-                data_rows.append(row_data)
+                self._append_row(row, buffers)
+                size += 1
         
         if headers is None:
             raise ValueError(f"No header row found at index {header_row}")
         
         # Create DataFrame
-        df = pd.DataFrame(data_rows, columns=headers)
+        df = self._build_frame(headers, buffers, size)
+        reporter.finish()
         
         logger.info(f"Created DataFrame with {len(df)} rows and {len(df.columns)} columns")
         return df
     
+    def iter_dataframes(
+        self,
+        file_path: Path,
+        header_row: int = 4,
+        chunk_rows: int = 10000,
+        usecols: Optional[Iterable[str]] = None,
+        category_columns: Optional[Iterable[str]] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read Excel XML file as a sequence of DataFrames of at most chunk_rows rows.
+        
+        Rows are always streamed, so only one chunk is held in memory at a
+        time and the first chunk is available before the file is fully read.
+        Every chunk has the same headers and continues the index of the
+        previous one, so concatenating them gives the same rows as
+        read_xml_to_dataframe. Dtypes are inferred per chunk.
+        
+        Args:
+            file_path: Path to XML file
+            header_row: Row index where headers are located (0-indexed)
+            chunk_rows: Maximum number of data rows per DataFrame
+            usecols: Column names to keep (optional), see read_xml_to_dataframe
+            category_columns: Columns to read as category (optional)
+            progress: Called with (bytes read, file size) while reading (optional)
+            
+        Yields:
+            DataFrames with data from XML file
+        """
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be a positive integer, got {chunk_rows}")
+        
+        logger.info(f"Reading XML file in chunks of {chunk_rows} rows: {file_path}")
+        
+        headers = None
+        buffers: List[Optional[_ColumnBuffer]] = []
+        chunk_size = 0
+        start = 0
+        
+        reporter = ProgressReporter(progress, os.path.getsize(file_path))
+        for row_idx, row in enumerate(self._iter_rows_streaming(file_path, reporter)):
+            if row_idx < header_row:
+                continue
+            
+            if row_idx == header_row:
+                headers = self._parse_row(row)
+                buffers = self._new_buffers(headers, usecols, category_columns)
+                logger.info(f"Found {len(headers)} headers at row {header_row}")
+                continue
+            
+            self._append_row(row, buffers)
+            chunk_size += 1
+            if chunk_size == chunk_rows:
+                yield self._build_frame(headers, buffers, chunk_size, start)
+                start += chunk_size
+                chunk_size = 0
+                buffers = [type(buffer)() if buffer is not None else None for buffer in buffers]
+        
+        if headers is None:
+            raise ValueError(f"No header row found at index {header_row}")
+        
+        # Flush the last partial chunk; an export without data rows still
+        # yields one empty frame so callers always see the headers
+        if chunk_size or start == 0:
+            yield self._build_frame(headers, buffers, chunk_size, start)
+            start += chunk_size
+        reporter.finish()
+        
+        logger.info(f"Streamed {start} data rows in chunks of {chunk_rows}")
+
+    def read_headers(self, file_path: Path, header_row: int = 4) -> List[Any]:
+        """
+        Read only the header row of an Excel XML file.
+
+        The document is streamed in small chunks and parsing stops at the
+        header row, so the cost does not depend on the number of data rows.
+
+        Args:
+            file_path: Path to XML file
+            header_row: Row index where headers are located (0-indexed)
+
+        Returns:
+            Header values, parsed exactly as read_xml_to_dataframe parses them
+
+        Raises:
+            ValueError: If the file has no row at header_row or is not valid XML
+        """
+        rows = self._iter_source_rows(
+            partial(_RepairedXMLStream, file_path, chunk_bytes=_SNIFF_CHUNK_BYTES),
+            verbose=False
+        )
+        try:
+            for row_idx, row in enumerate(rows):
+                if row_idx == header_row:
+                    return self._parse_row(row)
+        finally:
+            rows.close()
+
+        raise ValueError(f"No header row found at index {header_row}")
+
+    def _new_buffers(
+        self,
+        headers: List[Any],
+        usecols: Optional[Iterable[str]] = None,
+        category_columns: Optional[Iterable[str]] = None
+    ) -> List[Optional[_ColumnBuffer]]:
+        """
+        Create one buffer per header position.
+        
+        When usecols is given, positions of unwanted columns get None so
+        their cells are skipped while parsing. Columns in category_columns
+        get a dictionary-encoding buffer.
+        
+        Args:
+            headers: Column names from the header row
+            usecols: Column names to keep (optional)
+            category_columns: Columns to read as category (optional)
+            
+        Returns:
+            List aligned with headers, a buffer or None per position
+        """
+        categorical = set(category_columns or ())
+        
+        def new_buffer(header: Any) -> Any:
+            return _CategoryBuffer() if header in categorical else _ColumnBuffer()
+        
+        if usecols is None:
+            return [new_buffer(header) for header in headers]
+        
+        wanted = set(usecols)
+        not_found = wanted - set(headers)
+        if not_found:
+            logger.warning(f"Requested columns not found in header row: {sorted(not_found)}")
+        
+        buffers = [new_buffer(header) if header in wanted else None for header in headers]
+        logger.info(f"Decoding {sum(buffer is not None for buffer in buffers)} of {len(headers)} columns")
+        return buffers
+    
+    def _build_frame(
+        self,
+        headers: List[Any],
+        buffers: List[Optional[_ColumnBuffer]],
+        size: int,
+        start: int = 0
+    ) -> pd.DataFrame:
+        """
+        Assemble a DataFrame from typed column buffers.
+        
+        The arrays already carry their final dtype, so pandas does not run
+        type inference again. Columns are attached by position first so
+        duplicated or empty header names are preserved as-is. Positions
+        without a buffer (not in usecols) are left out.
+        
+        Args:
+            headers: Column names from the header row
+            buffers: Buffer (or None) per header position
+            size: Number of data rows in the buffers
+            start: First index label (used for chunks)
+            
+        Returns:
+            DataFrame built from the buffers
+        """
+        kept = [(header, buffer) for header, buffer in zip(headers, buffers) if buffer is not None]
+        df = pd.DataFrame(
+            {position: buffer.to_array() for position, (_, buffer) in enumerate(kept)},
+            index=pd.RangeIndex(start, start + size),
+            copy=False
+        )
+        df.columns = [header for header, _ in kept]
+        return df
+    
+    def _iter_rows_tree(
+        self,
+        file_path: Path,
+        reporter: Optional[ProgressReporter] = None,
+        worksheet: Optional[WorksheetSpan] = None
+    ) -> Iterator[ET.Element]:
+        """
+        Build the full document tree and return the Row elements of the
+        first worksheet table.
+        
+        With automatic backend selection, files above _TREE_MAX_BYTES are
+        streamed instead; the rows are the same.
+        
+        Args:
+            file_path: Path to XML file
+            reporter: Receives the bytes read from the file (optional)
+            worksheet: Only parse this worksheet (optional)
+            
+        Returns:
+            Iterator over Row elements
+        """
+        size = os.path.getsize(file_path) if worksheet is None else worksheet.size
+        streaming = self.backend == 'auto' and size > _TREE_MAX_BYTES
+        if streaming:
+            logger.info("Large XML file, streaming rows instead of building the tree")
+        return self._iter_source_rows(
+            partial(self._open_repaired, file_path, reporter, worksheet), streaming=streaming
+        )
+    
+    def _iter_rows_streaming(
+        self,
+        file_path: Path,
+        reporter: Optional[ProgressReporter] = None,
+        worksheet: Optional[WorksheetSpan] = None
+    ) -> Iterator[ET.Element]:
+        """
+        Incrementally parse the document and yield the Row elements of the
+        first worksheet table one at a time.
+        
+        Each Row is cleared and detached from its Table once the caller
+        moves on, and parsing stops as soon as that Table is closed, so
+        no full tree is ever built.
+        
+        Args:
+            file_path: Path to XML file
+            reporter: Receives the bytes read from the file (optional)
+            worksheet: Only parse this worksheet (optional)
+            
+        Returns:
+            Iterator over Row elements
+        """
+        return self._iter_source_rows(partial(self._open_repaired, file_path, reporter, worksheet))
+    
+    def _iter_source_rows(
+        self,
+        open_source: Callable[[], BinaryIO],
+        verbose: bool = True,
+        streaming: bool = True
+    ) -> Iterator[ET.Element]:
+        """
+        Row iterator over an already repaired XML source.
+        
+        If a strict backend picked automatically meets malformed markup,
+        the document is parsed again in recover mode and rows continue
+        from where the strict parse stopped.
+        
+        Args:
+            open_source: Callable opening the XML document as a binary stream
+            verbose: Log the backend choice (off for headers and parallel blocks)
+            streaming: Use a streaming backend (False builds the full tree)
+            
+        Returns:
+            Iterator over Row elements
+        """
+        if self.backend == 'auto':
+            backend = select_backend(open_source, streaming)
+        else:
+            backend = create_backend(self.backend)
+        if verbose:
+            logger.info(f"Parsing XML with {backend.describe()}")
+        
+        rows_seen = 0
+        try:
+            with open_source() as source:
+                for row in backend.iter_rows(source):
+                    rows_seen += 1
+                    yield row
+            return
+        except MalformedXMLError as e:
+            fallback = None
+            if self.backend == 'auto' and not backend.recover:
+                fallback = recovering_backend(streaming)
+            if fallback is None:
+                logger.error(str(e))
+                raise
+            logger.warning(f"{e}; resuming at row {rows_seen} with {fallback.describe()}")
+        
+        with open_source() as source:
+            for row_idx, row in enumerate(fallback.iter_rows(source)):
+                if row_idx >= rows_seen:
+                    yield row
+    
+    def _decode_parallel(
+        self,
+        file_path: Path,
+        header_row: int,
+        usecols: Optional[Iterable[str]] = None,
+        category_columns: Optional[Iterable[str]] = None,
+        reporter: Optional[ProgressReporter] = None,
+        worksheet: Optional[WorksheetSpan] = None
+    ) -> Tuple[List[Any], List[Optional[_ColumnBuffer]], int]:
+        """
+        Decode the first worksheet table with a pool of worker processes.
+        
+        The file is memory-mapped and the Row start tags of the table are
+        located by byte offset, without reading it into memory. The header
+        row is parsed here; the rows after it are split into byte balanced
+        ranges. Each worker maps the file itself, repairs and parses only its
+        range, wrapped in the original Workbook/Worksheet/Table start tags
+        (so namespaces resolve), and returns column buffers, which are then
+        concatenated in order. No copy of the whole file is ever made.
+        
+        Args:
+            file_path: Path to XML file
+            header_row: Row index where headers are located (0-indexed)
+            usecols: Column names to keep (optional)
+            category_columns: Columns to read as category (optional)
+            reporter: Progress over twice the file size: the bytes read,
+                then the share of row ranges decoded (optional)
+            worksheet: Only decode this worksheet (optional)
+            
+        Returns:
+            Tuple of (headers, buffers, number of data rows)
+        """
+        file_size = os.path.getsize(file_path) if worksheet is None else worksheet.size
+        if file_size == 0:
+            raise ValueError("Failed to parse XML file: no Workbook element found")
+        
+        with open(file_path, 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            headers, buffers, ranges = self._locate_rows(
+                file_path, data, header_row, usecols, category_columns, worksheet
+            )
+        if reporter is not None:
+            reporter.update(file_size)
+        if not ranges:
+            return headers, buffers, 0
+        
+        buffer_types = [type(buffer) if buffer is not None else None for buffer in buffers]
+        workers = min(self.workers, len(ranges))
+        logger.info(f"Decoding rows in {len(ranges)} blocks with {workers} worker processes")
+        block_bytes = [end - start for _, _, start, end, _ in ranges]
+        
+        def decode_blocks() -> Iterator[Tuple[List[Optional[_ColumnBuffer]], int]]:
+            if workers == 1:
+                yield from (self._decode_block(block, buffer_types) for block in ranges)
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    yield from executor.map(self._decode_block, ranges, repeat(buffer_types))
+        
+        size = 0
+        decoded_bytes = 0
+        for (block_buffers, block_size), length in zip(decode_blocks(), block_bytes):
+            for buffer, block_buffer in zip(buffers, block_buffers):
+                if buffer is not None:
+                    buffer.extend(block_buffer)
+            size += block_size
+            decoded_bytes += length
+            if reporter is not None:
+                reporter.update(file_size + file_size * decoded_bytes // sum(block_bytes))
+        
+        return headers, buffers, size
+    
+    def _locate_rows(
+        self,
+        file_path: Path,
+        data: mmap.mmap,
+        header_row: int,
+        usecols: Optional[Iterable[str]] = None,
+        category_columns: Optional[Iterable[str]] = None,
+        worksheet: Optional[WorksheetSpan] = None
+    ) -> Tuple[List[Any], List[Optional[_ColumnBuffer]], List[Tuple[Path, bytes, int, int, bytes]]]:
+        """
+        Find the table rows in the mapped file and split the data rows into ranges.
+        
+        Args:
+            file_path: Path to XML file
+            data: The file, memory-mapped
+            header_row: Row index where headers are located (0-indexed)
+            usecols: Column names to keep (optional)
+            category_columns: Columns to read as category (optional)
+            worksheet: Worksheet to read (optional, default: the first one)
+            
+        Returns:
+            Tuple of (headers, buffers, row ranges); a row range is
+            (file_path, prefix, start offset, end offset, suffix)
+        """
+        workbook = _WORKBOOK_START.search(data)
+        if workbook is None:
+            raise ValueError("Failed to parse XML file: no Workbook element found")
+        
+        sheet_start = workbook.end() if worksheet is None else worksheet.start
+        sheet = _WORKSHEET_START.search(data, sheet_start)
+        if sheet is None:
+            raise ValueError("No Worksheet found in XML file")
+        
+        sheet_end = _WORKSHEET_END.search(data, sheet.end())
+        table = None
+        if not sheet.group(0).endswith(b'/>'):
+            table = _TABLE_START.search(
+                data, sheet.end(), sheet_end.start() if sheet_end else len(data)
+            )
+        if table is None:
+            raise ValueError("No Table found in Worksheet")
+        
+        if table.group(0).endswith(b'/>'):
+            table_end = table.end()
+        else:
+            end_match = _TABLE_END.search(data, table.end())
+            table_end = end_match.start() if end_match else len(data)
+        
+        # Start offset of every Row, plus the end of the table as sentinel
+        row_starts = [match.start() for match in _ROW_START.finditer(data, table.end(), table_end)]
+        logger.info(f"Found {len(row_starts)} rows in XML")
+        if header_row >= len(row_starts):
+            raise ValueError(f"No header row found at index {header_row}")
+        row_starts.append(table_end)
+        
+        prefix = workbook.group(0) + sheet.group(0) + table.group(0)
+        suffix = b'</%s></%s></%s>' % (table.group(1), sheet.group(1), workbook.group(1))
+        
+        header_rows = self._iter_source_rows(
+            partial(
+                _RepairedXMLStream, file_path, prefix, row_starts[header_row], row_starts[header_row + 1], suffix
+            ),
+            verbose=False
+        )
+        headers = self._parse_row(next(header_rows))
+        header_rows.close()
+        buffers = self._new_buffers(headers, usecols, category_columns)
+        logger.info(f"Found {len(headers)} headers at row {header_row}")
+        
+        # Split the data rows into byte balanced ranges
+        first_row = header_row + 1
+        last_row = len(row_starts) - 1
+        data_rows = last_row - first_row
+        if data_rows == 0:
+            return headers, buffers, []
+        
+        block_count = max(1, min(
+            self.workers * _PARALLEL_BLOCKS_PER_WORKER,
+            data_rows // _PARALLEL_MIN_BLOCK_ROWS
+        ))
+        offsets = np.asarray(row_starts)
+        targets = np.linspace(offsets[first_row], offsets[last_row], block_count + 1)[1:-1]
+        cuts = np.searchsorted(offsets, targets).clip(first_row, last_row).tolist()
+        bounds = sorted({first_row, last_row, *cuts})
+        logger.info(f"Split {data_rows} data rows into {len(bounds) - 1} ranges")
+        ranges = [
+            (file_path, prefix, row_starts[start], row_starts[end], suffix)
+            for start, end in zip(bounds, bounds[1:])
+        ]
+        return headers, buffers, ranges
+    
+    def _decode_block(
+        self,
+        block: Tuple[Path, bytes, int, int, bytes],
+        buffer_types: List[Optional[type]]
+    ) -> Tuple[List[Optional[_ColumnBuffer]], int]:
+        """
+        Decode one row range (runs in a worker process in parallel mode).
+        
+        The parser reads the range straight from the memory-mapped file;
+        only the Data elements holding an '&' are copied to be repaired.
+        
+        Args:
+            block: Row range (file_path, prefix, start offset, end offset, suffix)
+            buffer_types: Buffer class per header position (None to skip it)
+            
+        Returns:
+            Tuple of (buffers, number of rows)
+        """
+        buffers = [buffer_type() if buffer_type is not None else None for buffer_type in buffer_types]
+        size = 0
+        for row in self._iter_source_rows(partial(_RepairedXMLStream, *block), verbose=False):
+            self._append_row(row, buffers)
+            size += 1
+        return buffers, size
+    
     def _parse_row(self, row_element: ET.Element) -> List[Any]:
         """
         Parse a Row element into a list of cell values.
@@ -193,7 +1280,72 @@ class ExcelXMLReader:
         
         return row_data
     
-    def _parse_cell_value(self, text: str, data_type: str) -> Any:
+    def _append_row(self, row_element: ET.Element, buffers: List[Optional[_ColumnBuffer]]) -> None:
+        """
+        Decode a Row element straight into the column buffers.
+        
+        Follows the same rules as _parse_row: ss:Index gaps and trailing
+        missing cells become empty values. Cells whose position has no
+        buffer (projected out by usecols) are not decoded at all.
+        
+        Args:
+            row_element: XML Element representing a Row
+            buffers: Buffer (or None) per header column
+            
+        Raises:
+            ValueError: If the row has more cells than there are headers
+        """
+        ss = self.namespaces['ss']
+        data_tag = f'{{{ss}}}Data'
+        index_key = f'{{{ss}}}Index'
+        type_key = f'{{{ss}}}Type'
+        total_columns = len(buffers)
+        current_index = 0
+        
+        # iter(tag) walks descendants in document order, like findall('.//ss:Cell')
+        # but without evaluating a path expression per row
+        for cell in row_element.iter(f'{{{ss}}}Cell'):
+            index_attr = cell.get(index_key)
+            
+            if index_attr:
+                # Cell specifies its position, fill gaps with None
+                target_index = int(index_attr) - 1  # Convert to 0-based
+                while current_index < target_index and current_index < total_columns:
+                    buffer = buffers[current_index]
+                    if buffer is not None:
+                        buffer.append(None)
+                    current_index += 1
+            
+            if current_index >= total_columns:
+                raise ValueError(
+                    f"{total_columns} columns passed, passed data had more than {total_columns} columns"
+                )
+            
+            buffer = buffers[current_index]
+            current_index += 1
+            if buffer is None:
+                continue
+            
+            data_element = next(cell.iter(data_tag), None)
+            
+            if data_element is not None and data_element.text:
+                data_type = data_element.get(type_key, 'String')
+                if data_type == 'DateTime':
+                    buffer.append_datetime_text(data_element.text)
+                else:
+                    buffer.append(self._parse_cell_value(data_element.text, data_type))
+            else:
+                buffer.append(None)
+        
+        # Missing trailing cells
+        while current_index < total_columns:
+            buffer = buffers[current_index]
+            if buffer is not None:
+                buffer.append(None)
+            current_index += 1
+    
+    @staticmethod
+    def _parse_cell_value(text: str, data_type: str) -> Any:
         """
         Parse cell value based on its type.
         Properly decodes HTML/XML entities to preserve special characters.
@@ -224,23 +1376,204 @@ class ExcelXMLReader:
                 return text
         
         elif data_type == 'DateTime':
-            # Keep as string, pandas will handle date parsing
-            return text
+            # SpreadsheetML dates are ISO 8601 (e.g. 2024-09-20T00:00:00.000)
+            try:
+                value = datetime.fromisoformat(text)
+            except ValueError:
+                return text
+            # Timezone-aware values are kept as text, the buffers hold naive datetimes
+            return value if value.tzinfo is None else text
         
         # Default: return as string with special characters preserved
         return text
 
 
-def read_celer_xml(file_path: Path, header_row: int = 4) -> pd.DataFrame:
+class ExcelXMLWorkbook:
+    """
+    Index of the worksheets of an Excel 2003 XML workbook.
+    
+    The worksheet names and byte ranges are found in one scan of the
+    memory-mapped file, without parsing any XML. sheet() then parses only
+    the bytes of the requested worksheet, so multi-sheet exports (e.g. one
+    sheet per branch) can be read selectively.
+    
+    Example:
+        workbook = ExcelXMLWorkbook(path)
+        df = workbook.sheet(workbook.sheet_names[1])
+    """
+    
+    def __init__(self, file_path: Path, mode: str = 'streaming', workers: Optional[int] = None,
+                 backend: str = 'auto'):
+        """
+        Args:
+            file_path: Path to XML file
+            mode: Reader mode used to parse a worksheet (see READER_MODES)
+            workers: Worker processes for 'parallel' mode (default: CPU count)
+            backend: Parser backend name, or 'auto' (see xml_backends.BACKENDS)
+            
+        Raises:
+            ValueError: If the file holds no Workbook element
+        """
+        self.file_path = Path(file_path)
+        self.reader = ExcelXMLReader(mode=mode, workers=workers, backend=backend)
+        self.worksheets = self._index_worksheets()
+        logger.info(f"Indexed {len(self.worksheets)} worksheets in {self.file_path.name}")
+    
+    @property
+    def sheet_names(self) -> List[str]:
+        """Worksheet names, in workbook order"""
+        return [worksheet.name for worksheet in self.worksheets]
+    
+    def __contains__(self, name: str) -> bool:
+        return any(worksheet.name == name for worksheet in self.worksheets)
+    
+    def _index_worksheets(self) -> List[WorksheetSpan]:
+        """Locate every Worksheet element by byte offset"""
+        if os.path.getsize(self.file_path) == 0:
+            raise ValueError("Failed to parse XML file: no Workbook element found")
+        
+        worksheets = []
+        with open(self.file_path, 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            workbook = _WORKBOOK_START.search(data)
+            if workbook is None:
+                raise ValueError("Failed to parse XML file: no Workbook element found")
+            prefix = workbook.group(0)
+            suffix = b'</%s>' % workbook.group(1)
+            
+            position = workbook.end()
+            while True:
+                start = _WORKSHEET_START.search(data, position)
+                if start is None:
+                    break
+                if start.group(0).endswith(b'/>'):
+                    position = start.end()
+                else:
+                    end = _WORKSHEET_END.search(data, start.end())
+                    position = end.end() if end else len(data)
+                
+                name = _NAME_ATTRIBUTE.search(start.group(0))
+                if name is None:
+                    name_text = f"Sheet{len(worksheets) + 1}"
+                else:
+                    raw_name = name.group(1) if name.group(1) is not None else name.group(2)
+                    name_text = html.unescape(raw_name.decode('utf-8', errors='replace'))
+                worksheets.append(WorksheetSpan(
+                    name=name_text,
+                    index=len(worksheets),
+                    start=start.start(),
+                    end=position,
+                    prefix=prefix,
+                    suffix=suffix
+                ))
+        return worksheets
+    
+    def worksheet(self, sheet: Union[str, int]) -> WorksheetSpan:
+        """
+        Look up a worksheet by name or position.
+        
+        Args:
+            sheet: Worksheet name, or 0-based position
+            
+        Returns:
+            WorksheetSpan of the worksheet
+            
+        Raises:
+            ValueError: If there is no such worksheet
+        """
+        if isinstance(sheet, int):
+            if 0 <= sheet < len(self.worksheets):
+                return self.worksheets[sheet]
+        else:
+            for worksheet in self.worksheets:
+                if worksheet.name == sheet:
+                    return worksheet
+        raise ValueError(f"Worksheet {sheet!r} not found. Available: {self.sheet_names}")
+    
+    def sheet(
+        self,
+        sheet: Union[str, int],
+        header_row: int = 4,
+        usecols: Optional[Iterable[str]] = None,
+        category_columns: Optional[Iterable[str]] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> pd.DataFrame:
+        """
+        Parse one worksheet into a DataFrame.
+        
+        Args:
+            sheet: Worksheet name, or 0-based position
+            header_row: Row index where headers are located (0-indexed)
+            usecols: Column names to keep (optional)
+            category_columns: Columns to read as category (optional)
+            progress: Progress callback (done, total) in bytes of the worksheet (optional)
+            
+        Returns:
+            DataFrame with the data of the worksheet
+            
+        Raises:
+            ValueError: If there is no such worksheet, or it cannot be parsed
+        """
+        worksheet = self.worksheet(sheet)
+        logger.info(f"Reading worksheet '{worksheet.name}' ({worksheet.size} bytes)")
+        return self.reader.read_xml_to_dataframe(
+            self.file_path, header_row, usecols, category_columns, progress, worksheet
+        )
+
+
+def read_celer_xml(
+    file_path: Path,
+    header_row: int = 4,
+    mode: str = 'tree',
+    usecols: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+    category_columns: Optional[Iterable[str]] = None,
+    backend: str = 'auto',
+    progress: Optional[ProgressCallback] = None
+) -> pd.DataFrame:
     """
     Convenience function to read Celer XML export.
     
     Args:
         file_path: Path to Celer XML file
         header_row: Row index where headers are (default: 4 for Celer exports)
+        mode: Reader mode, 'tree', 'streaming' or 'parallel' (see READER_MODES)
+        usecols: Column names to keep (optional, default: all 49)
+        workers: Worker processes for 'parallel' mode (default: CPU count)
+        category_columns: Columns to read as category (optional)
+        backend: Parser backend name, or 'auto' (see xml_backends.BACKENDS)
+        progress: Progress callback (done, total) in bytes (optional)
         
     Returns:
         DataFrame with Celer data
     """
-    reader = ExcelXMLReader()
-    return reader.read_xml_to_dataframe(file_path, header_row)
+    reader = ExcelXMLReader(mode=mode, workers=workers, backend=backend)
+    return reader.read_xml_to_dataframe(file_path, header_row, usecols, category_columns, progress)
+
+
+def iter_celer_xml(
+    file_path: Path,
+    chunk_rows: int = 10000,
+    header_row: int = 4,
+    usecols: Optional[Iterable[str]] = None,
+    category_columns: Optional[Iterable[str]] = None,
+    backend: str = 'auto',
+    progress: Optional[ProgressCallback] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Convenience function to stream a Celer XML export in chunks.
+    
+    Args:
+        file_path: Path to Celer XML file
+        chunk_rows: Maximum number of data rows per DataFrame
+        header_row: Row index where headers are (default: 4 for Celer exports)
+        usecols: Column names to keep (optional, default: all 49)
+        category_columns: Columns to read as category (optional)
+        backend: Streaming parser backend name, or 'auto' (see xml_backends.BACKENDS)
+        progress: Progress callback (done, total) in bytes (optional)
+        
+    Yields:
+        DataFrames with Celer data, all with the same headers
+    """
+    reader = ExcelXMLReader(mode='streaming', backend=backend)
+    return reader.iter_dataframes(file_path, header_row, chunk_rows, usecols, category_columns, progress)
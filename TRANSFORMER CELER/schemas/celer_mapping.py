@@ -7,7 +7,7 @@ This mapping is the source of truth for all transformations.
 """
 
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -47,6 +47,12 @@ class CelerMappingConfig(BaseModel):
         header_row: Row index where data starts (0-indexed, row 5 = index 4)
         output_to_original: Dictionary mapping output columns to original input column names
         generated_columns: Columns that are calculated/generated (not from source)
+        categorical_columns: Source columns with few distinct values, kept as pandas category
+        row_key_columns: Source columns identifying a row across exports (policy, document, installment)
+        delta_ignored_columns: Mapped columns left out of row fingerprints because they
+            change with the export date rather than with the row
+        date_columns: Source date columns exported as text, with their fixed strptime
+            format; they are converted to datetime64 once per column when read
     """
     sheet_name: str = Field(default="ARCHIVO", description="Sheet name for mapping reference")
     header_row: int = Field(default=4, description="Row index where headers are (0-indexed, row 5 = 4)")
@@ -78,6 +84,26 @@ class CelerMappingConfig(BaseModel):
         },
         description="Mapping from output column to original Celer column name"
     )
+    categorical_columns: List[str] = Field(
+        default=["Aseguradora", "Ramo", "Ejecutivo", "Unidad", "Tipo_Doc", "Estado"],
+        description="Repetitive text columns read and transformed as pandas category"
+    )
+    row_key_columns: List[str] = Field(
+        default=["Poliza", "Documento", "Cuota"],
+        description="Source columns identifying a row across exports"
+    )
+    delta_ignored_columns: List[str] = Field(
+        default=["Días"],
+        description="Mapped columns not fingerprinted (days overdue grows with every export)"
+    )
+    date_columns: Dict[str, str] = Field(
+        default={
+            "F_Inicio": "%m/%d/%Y",              # 9/20/2024
+            "F_Expedicion": "%m/%d/%Y",          # 10/10/2024
+            "F_Creacion": "%m/%d/%Y %I:%M %p",   # 11/22/2024 12:04 PM
+        },
+        description="Text date columns of the Celer export and their format"
+    )
     
     @property
     def generated_columns(self) -> list[OutputColumn]:
@@ -6,10 +6,11 @@ Orchestrates the transformation of Celer exports to standardized format.
 
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 import pandas as pd
 
+from adapters.header_sniffer import sniff_headers
 from schemas.celer_mapping import CELER_MAPPING, OutputColumn, COLUMN_DESCRIPTIONS
 
 logger = logging.getLogger(__name__)
@@ -28,6 +29,12 @@ class ColumnTransformer:
     
     def __init__(self):
         self.mapping = CELER_MAPPING
+        # Output names of the mapped columns kept as pandas category
+        self.categorical_output_columns = [
+            COLUMN_DESCRIPTIONS[output_col]
+            for output_col, source_col in self.mapping.mapped_columns.items()
+            if source_col in self.mapping.categorical_columns
+        ]
         logger.info("ColumnTransformer initialized with %d output columns", 
                    len(self.mapping.output_to_original))
     
@@ -75,11 +82,58 @@ class ColumnTransformer:
         column_headers = {col.value: COLUMN_DESCRIPTIONS[col] for col in OutputColumn}
         output_df.rename(columns=column_headers, inplace=True)
         
+        # Repetitive text columns stay dictionary-encoded
+        self.apply_categorical_dtypes(output_df)
+        
         logger.info("Transformation completed successfully for %d rows, %d columns", 
                    len(output_df), len(output_df.columns))
         
         return output_df
     
+    def transform_chunks(self, source_chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Transform a stream of source DataFrames chunk by chunk.
+        
+        Each chunk is validated and mapped exactly like transform(), so the
+        concatenated output has the same rows and columns as transforming the
+        whole export at once, while only one source chunk is held at a time.
+        
+        Args:
+            source_chunks: Iterable of DataFrames from a Celer export
+                (e.g. adapters.xml_reader.iter_celer_xml)
+            
+        Yields:
+            Transformed DataFrames with columns A-W
+            
+        Raises:
+            ValueError: If required source columns are missing
+        """
+        total_rows = 0
+        for chunk_number, source_chunk in enumerate(source_chunks, start=1):
+            transformed_chunk = self.transform(source_chunk)
+            total_rows += len(transformed_chunk)
+            logger.info("Transformed chunk %d (%d rows so far)", chunk_number, total_rows)
+            yield transformed_chunk
+    
+    def apply_categorical_dtypes(self, output_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store the repetitive text columns of a transformed DataFrame as category.
+        
+        Columns that are already categorical (read with category_columns) are
+        left as they are. Others, e.g. after concatenating chunks that carry
+        different categories, are converted in place.
+        
+        Args:
+            output_df: Transformed DataFrame with descriptive column names
+            
+        Returns:
+            The same DataFrame
+        """
+        for column in self.categorical_output_columns:
+            if column in output_df.columns and not isinstance(output_df[column].dtype, pd.CategoricalDtype):
+                output_df[column] = output_df[column].astype('category')
+        return output_df
+    
     def _generate_column(self, column: OutputColumn, source_df: pd.DataFrame) -> pd.Series:
         """
         Generate calculated/derived column values.
@@ -108,16 +162,15 @@ class ColumnTransformer:
         Validate if a Celer export file has all required columns.
         
         Args:
-            file_path: Path to Celer export Excel file
+            file_path: Path to Celer export (.xlsx, .xlsb or .xml)
             
         Returns:
             Tuple of (is_valid, missing_columns)
         """
         try:
-            # Read just the first row to check columns
-            df = pd.read_excel(file_path, nrows=1)
-            available_columns = set(df.columns)
-            return self.mapping.validate_source_columns(available_columns)
+            # Read just the header row (not the whole file) to check columns
+            headers = sniff_headers(file_path, self.mapping.header_row)
+            return self.mapping.validate_source_columns(set(headers))
         except Exception as e:
             logger.error("Failed to validate file %s: %s", file_path, str(e))
             return False, [f"Error reading file: {str(e)}"]
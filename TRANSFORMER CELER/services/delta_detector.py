@@ -0,0 +1,300 @@
+"""
+Row Delta Detection Service
+---------------------------
+Compares a Celer export with the previous export of the same portfolio.
+
+Most rows of CarteraPendiente do not change between exports. Each row is
+fingerprinted by hashing its mapped columns and identified by its key
+columns (policy, document, installment); comparing with the fingerprints
+stored from the previous export gives the rows that were added, removed or
+changed, so downstream work can be limited to them.
+
+The column transformer works row by row, so the transformed output of the
+previous export is stored too: rows that did not change are taken from it
+and only the delta is transformed again (see transformer.transform_celer_delta).
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from schemas.celer_mapping import CELER_MAPPING
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_DIR = Path.home() / ".cache" / "conciliator_delta"
+
+# Fingerprint table columns, besides the key columns
+KEY_HASH = "_key_hash"
+ROW_HASH = "_row_hash"
+
+# Version of the stored transformed outputs. Bump it whenever the column
+# transformer's output changes so outputs of an older version are not reused.
+OUTPUT_VERSION = 1
+
+
+@dataclass
+class CelerDelta:
+    """
+    Rows that differ between two exports.
+
+    Attributes:
+        added: Source rows whose key was not in the previous export
+        changed: Source rows whose key was present with other values
+        removed: Key columns of previous rows missing from this export
+        unchanged: Number of rows identical to the previous export
+        fingerprints: Fingerprint table of this export (stored for the next one)
+    """
+    added: pd.DataFrame
+    changed: pd.DataFrame
+    removed: pd.DataFrame
+    unchanged: int
+    fingerprints: pd.DataFrame
+
+    @property
+    def delta(self) -> pd.DataFrame:
+        """Added and changed rows, in source order"""
+        return pd.concat([self.added, self.changed]).sort_index()
+
+    @property
+    def is_empty(self) -> bool:
+        """True if nothing changed since the previous export"""
+        return self.added.empty and self.changed.empty and self.removed.empty
+
+
+class DeltaDetector:
+    """
+    Service that fingerprints Celer exports and reports row-level changes.
+
+    Fingerprints, and optionally the transformed output, are kept per
+    portfolio name in pickle files under state_dir (default: DELTA_STATE_DIR
+    or ~/.cache/conciliator_delta).
+    """
+
+    def __init__(self, state_dir: Optional[Path] = None):
+        if state_dir is None:
+            state_dir = Path(os.environ.get("DELTA_STATE_DIR", DEFAULT_STATE_DIR))
+        self.state_dir = Path(state_dir)
+        self.mapping = CELER_MAPPING
+        self.key_columns = list(self.mapping.row_key_columns)
+        ignored = set(self.mapping.delta_ignored_columns)
+        self.fingerprint_columns = sorted(
+            column for column in self.mapping.get_required_source_columns() if column not in ignored
+        )
+
+    def fingerprint(self, source_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fingerprint every row of a Celer export.
+
+        Rows sharing a key are told apart by their order of appearance.
+
+        Args:
+            source_df: DataFrame from Celer export
+
+        Returns:
+            DataFrame with the key columns, the key hash and the row hash,
+            on the same index as source_df
+
+        Raises:
+            ValueError: If key or mapped columns are missing
+        """
+        missing = sorted(set(self.key_columns + self.fingerprint_columns) - set(source_df.columns))
+        if missing:
+            raise ValueError(f"Missing required columns from Celer export: {missing}")
+
+        keys = source_df[self.key_columns]
+        occurrence = keys.groupby(self.key_columns, dropna=False, sort=False).cumcount()
+        key_hash = pd.util.hash_pandas_object(
+            self._normalize(keys).assign(_occurrence=occurrence.to_numpy()), index=False
+        )
+        row_hash = pd.util.hash_pandas_object(
+            self._normalize(source_df[self.fingerprint_columns]), index=False
+        )
+
+        fingerprints = keys.copy()
+        fingerprints[KEY_HASH] = key_hash.to_numpy()
+        fingerprints[ROW_HASH] = row_hash.to_numpy()
+        return fingerprints
+
+    @staticmethod
+    def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Hash-stable view of the values: numbers hash the same whether a
+        column was read as int or float, categories the same as their values.
+        """
+        normalized = {}
+        for column in df.columns:
+            values = df[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                values = values.astype(object)
+            elif pd.api.types.is_bool_dtype(values.dtype):
+                values = values.astype(object)
+            elif pd.api.types.is_numeric_dtype(values.dtype):
+                values = values.astype(np.float64)
+            normalized[column] = values
+        return pd.DataFrame(normalized, index=df.index)
+
+    def compare(self, source_df: pd.DataFrame, previous: Optional[pd.DataFrame]) -> CelerDelta:
+        """
+        Compare an export with the fingerprints of a previous one.
+
+        Args:
+            source_df: DataFrame from Celer export
+            previous: Fingerprint table of the previous export (None: every row is new)
+
+        Returns:
+            CelerDelta with added, changed and removed rows
+        """
+        fingerprints = self.fingerprint(source_df)
+
+        if previous is None or previous.empty:
+            logger.info("No previous fingerprints, all %d rows are new", len(source_df))
+            return CelerDelta(
+                added=source_df,
+                changed=source_df.iloc[0:0],
+                removed=fingerprints[self.key_columns].iloc[0:0],
+                unchanged=0,
+                fingerprints=fingerprints
+            )
+
+        previous_rows = pd.Series(previous[ROW_HASH].to_numpy(), index=previous[KEY_HASH].to_numpy())
+        current_keys = fingerprints[KEY_HASH].to_numpy()
+
+        known = np.isin(current_keys, previous_rows.index.to_numpy())
+        old_hashes = previous_rows.reindex(current_keys[known]).to_numpy()
+        changed_mask = np.zeros(len(fingerprints), dtype=bool)
+        changed_mask[known] = old_hashes != fingerprints[ROW_HASH].to_numpy()[known]
+        removed_mask = ~np.isin(previous[KEY_HASH].to_numpy(), current_keys)
+
+        delta = CelerDelta(
+            added=source_df[~known],
+            changed=source_df[changed_mask],
+            removed=previous.loc[removed_mask, self.key_columns].reset_index(drop=True),
+            unchanged=int(known.sum() - changed_mask.sum()),
+            fingerprints=fingerprints
+        )
+        logger.info(
+            "Delta: %d added, %d changed, %d removed, %d unchanged rows",
+            len(delta.added), len(delta.changed), len(delta.removed), delta.unchanged
+        )
+        return delta
+
+    def _state_path(self, name: str) -> Path:
+        return self.state_dir / f"{name}.fingerprints.pkl"
+
+    def _output_path(self, name: str) -> Path:
+        return self.state_dir / f"{name}.output.v{OUTPUT_VERSION}.pkl"
+
+    def _load(self, path: Path) -> Optional[pd.DataFrame]:
+        if not path.exists():
+            return None
+        try:
+            return pd.read_pickle(path)
+        except Exception as e:
+            logger.warning("Discarding unreadable delta state %s: %s", path.name, str(e))
+            return None
+
+    def _store(self, path: Path, df: pd.DataFrame) -> None:
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        df.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+
+    def load_fingerprints(self, name: str) -> Optional[pd.DataFrame]:
+        """
+        Load the fingerprints stored for a portfolio.
+
+        Args:
+            name: Portfolio name (e.g. "CarteraPendiente")
+
+        Returns:
+            Fingerprint table, or None if nothing was stored yet
+        """
+        return self._load(self._state_path(name))
+
+    def save_fingerprints(self, name: str, fingerprints: pd.DataFrame) -> None:
+        """
+        Store the fingerprints of an export for the next comparison.
+
+        Args:
+            name: Portfolio name
+            fingerprints: Fingerprint table (CelerDelta.fingerprints)
+        """
+        self._store(self._state_path(name), fingerprints.reset_index(drop=True))
+
+    def load_output(self, name: str) -> Optional[pd.DataFrame]:
+        """
+        Load the transformed output stored for a portfolio.
+
+        Args:
+            name: Portfolio name
+
+        Returns:
+            Transformed DataFrame indexed by key hash, or None if nothing was stored yet
+        """
+        return self._load(self._output_path(name))
+
+    def save_output(self, name: str, output_df: pd.DataFrame, fingerprints: pd.DataFrame) -> None:
+        """
+        Store the transformed output of an export for the next comparison.
+
+        Args:
+            name: Portfolio name
+            output_df: Transformed DataFrame, on the same index as the export
+            fingerprints: Fingerprint table of the export (CelerDelta.fingerprints)
+        """
+        stored = output_df.set_axis(fingerprints.loc[output_df.index, KEY_HASH].to_numpy(), axis=0)
+        self._store(self._output_path(name), stored)
+
+    def reuse_output(
+        self, delta: CelerDelta, source_df: pd.DataFrame, previous_output: Optional[pd.DataFrame]
+    ) -> Optional[pd.DataFrame]:
+        """
+        Take the transformed rows of the unchanged source rows from a previous output.
+
+        The columns left out of the fingerprints (delta_ignored_columns) may
+        differ from the previous export, so they are copied from source_df.
+
+        Args:
+            delta: Comparison of source_df with the previous export
+            source_df: DataFrame from Celer export
+            previous_output: Output stored by save_output for the previous export
+
+        Returns:
+            Transformed rows of the unchanged source rows, on their source
+            index, or None if the previous output does not hold all of them
+        """
+        unchanged = ~delta.fingerprints.index.isin(delta.delta.index)
+        key_hashes = delta.fingerprints.loc[unchanged, KEY_HASH].to_numpy()
+        if previous_output is None or not np.isin(key_hashes, previous_output.index.to_numpy()).all():
+            return None
+
+        reused = previous_output.loc[key_hashes].set_axis(delta.fingerprints.index[unchanged], axis=0)
+        headers = self.mapping.get_output_headers()
+        ignored = set(self.mapping.delta_ignored_columns)
+        for output_col, source_col in self.mapping.mapped_columns.items():
+            if source_col in ignored:
+                reused[headers[output_col]] = source_df.loc[reused.index, source_col]
+        return reused
+
+    def detect(self, source_df: pd.DataFrame, name: str, update: bool = True) -> CelerDelta:
+        """
+        Compare an export with the previous export of the same portfolio.
+
+        Args:
+            source_df: DataFrame from Celer export
+            name: Portfolio name the fingerprints are stored under
+            update: Store this export's fingerprints for the next call (default: True)
+
+        Returns:
+            CelerDelta with added, changed and removed rows
+        """
+        delta = self.compare(source_df, self.load_fingerprints(name))
+        if update:
+            self.save_fingerprints(name, delta.fingerprints)
+        return delta
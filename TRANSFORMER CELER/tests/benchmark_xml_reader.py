@@ -0,0 +1,223 @@
+"""
+XML Reader Benchmark
+--------------------
+Measures every ExcelXMLReader mode on synthetic Celer exports (see
+synthetic_celer.py) so reader regressions show up as numbers.
+
+For each file size and mode the reader runs in a fresh Python process,
+which reports:
+  - parse time (seconds) and rows per second
+  - peak resident memory of the reader process, and of its worker
+    processes in 'parallel' mode
+
+Generated files are kept in the work directory and reused by later runs.
+
+Usage:
+    python tests/benchmark_xml_reader.py --rows 1000 10000 100000
+    python tests/benchmark_xml_reader.py --rows 1000000 --modes streaming parallel --json results.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters.xml_reader import READER_MODES
+from synthetic_celer import DEFAULT_SEED, HEADER_ROW, write_synthetic_celer_xml
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_ROWS = (1000, 10000, 100000)
+DEFAULT_WORK_DIR = Path(tempfile.gettempdir()) / "celer_xml_benchmark"
+
+
+def _peak_rss_bytes(who: int) -> Optional[int]:
+    """Peak resident memory of this process or of its waited-for children"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _measure(file_path: Path, mode: str, workers: Optional[int], backend: str) -> Dict[str, Any]:
+    """Read one file in this process and report time and memory"""
+    from adapters.xml_reader import ExcelXMLReader
+
+    reader = ExcelXMLReader(mode=mode, workers=workers, backend=backend)
+    start = time.perf_counter()
+    df = reader.read_xml_to_dataframe(file_path, header_row=HEADER_ROW)
+    seconds = time.perf_counter() - start
+
+    return {
+        'seconds': seconds,
+        'data_rows': len(df),
+        'columns': len(df.columns),
+        'peak_rss_bytes': _peak_rss_bytes(resource.RUSAGE_SELF) if resource else None,
+        'worker_peak_rss_bytes': _peak_rss_bytes(resource.RUSAGE_CHILDREN) if resource else None,
+    }
+
+
+def synthetic_file(rows: int, work_dir: Path = DEFAULT_WORK_DIR, seed: int = DEFAULT_SEED) -> Path:
+    """
+    Path of the synthetic export with this many rows, generated if missing.
+
+    Args:
+        rows: Number of data rows
+        work_dir: Directory the generated files are kept in
+        seed: Random seed of the generator
+
+    Returns:
+        Path to the XML file
+    """
+    work_dir.mkdir(parents=True, exist_ok=True)
+    file_path = work_dir / f"synthetic_celer_{rows}_{seed}.xml"
+    if not file_path.exists():
+        tmp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.tmp")
+        write_synthetic_celer_xml(tmp_path, rows, seed)
+        os.replace(tmp_path, file_path)
+    return file_path
+
+
+def run_benchmark(
+    rows: int,
+    mode: str,
+    work_dir: Path = DEFAULT_WORK_DIR,
+    workers: Optional[int] = None,
+    backend: str = 'auto'
+) -> Dict[str, Any]:
+    """
+    Benchmark one reader mode on one file size, in a fresh process.
+
+    Args:
+        rows: Number of data rows of the synthetic export
+        mode: Reader mode (see READER_MODES)
+        work_dir: Directory the generated files are kept in
+        workers: Worker processes for 'parallel' mode (default: CPU count)
+        backend: Parser backend name, or 'auto'
+
+    Returns:
+        Benchmark record (rows, mode, file size, seconds, rows per second,
+        peak memory)
+
+    Raises:
+        RuntimeError: If the reader process fails or reads the wrong row count
+    """
+    if mode not in READER_MODES:
+        raise ValueError(f"Unknown reader mode '{mode}'. Expected one of {READER_MODES}")
+
+    file_path = synthetic_file(rows, work_dir)
+    command = [
+        sys.executable, str(Path(__file__).resolve()), '--measure', str(file_path),
+        '--modes', mode, '--backend', backend,
+    ]
+    if workers is not None:
+        command += ['--workers', str(workers)]
+
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Benchmark of '{mode}' mode failed:\n{result.stderr.strip()}")
+    measurement = json.loads(result.stdout.strip().splitlines()[-1])
+
+    if measurement['data_rows'] != rows:
+        raise RuntimeError(
+            f"'{mode}' mode read {measurement['data_rows']} rows, expected {rows}"
+        )
+
+    seconds = measurement['seconds']
+    return {
+        'rows': rows,
+        'mode': mode,
+        'backend': backend,
+        'file_mb': file_path.stat().st_size / 1e6,
+        'seconds': seconds,
+        'rows_per_second': rows / seconds if seconds else float('inf'),
+        'peak_rss_mb': _to_mb(measurement['peak_rss_bytes']),
+        'worker_peak_rss_mb': _to_mb(measurement['worker_peak_rss_bytes']),
+    }
+
+
+def _to_mb(value: Optional[int]) -> Optional[float]:
+    return value / 1e6 if value is not None else None
+
+
+def run_suite(
+    rows: Sequence[int] = DEFAULT_ROWS,
+    modes: Sequence[str] = READER_MODES,
+    work_dir: Path = DEFAULT_WORK_DIR,
+    workers: Optional[int] = None,
+    backend: str = 'auto'
+) -> List[Dict[str, Any]]:
+    """
+    Benchmark every mode on every file size.
+
+    Returns:
+        One benchmark record per (rows, mode), see run_benchmark
+    """
+    records = []
+    for row_count in rows:
+        for mode in modes:
+            record = run_benchmark(row_count, mode, work_dir, workers, backend)
+            print(format_record(record), flush=True)
+            records.append(record)
+    return records
+
+
+def format_record(record: Dict[str, Any]) -> str:
+    """One table line for a benchmark record"""
+    def mb(value):
+        return f"{value:9.1f}" if value is not None else f"{'-':>9}"
+
+    return (
+        f"{record['rows']:>9} {record['mode']:<10} {record['file_mb']:9.1f} "
+        f"{record['seconds']:9.2f} {record['rows_per_second']:12.0f} "
+        f"{mb(record['peak_rss_mb'])} {mb(record['worker_peak_rss_mb'])}"
+    )
+
+
+TABLE_HEADER = (
+    f"{'rows':>9} {'mode':<10} {'file MB':>9} {'seconds':>9} {'rows/s':>12} "
+    f"{'peak MB':>9} {'worker MB':>9}"
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Celer XML reader modes")
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_ROWS),
+                        help="Data rows of each synthetic export (default: 1000 10000 100000)")
+    parser.add_argument("--modes", nargs="+", choices=READER_MODES, default=list(READER_MODES),
+                        help="Reader modes to measure (default: all)")
+    parser.add_argument("--workers", type=int, default=None, help="Workers for 'parallel' mode")
+    parser.add_argument("--backend", default="auto", help="Parser backend (default: auto)")
+    parser.add_argument("--work-dir", type=Path, default=DEFAULT_WORK_DIR,
+                        help="Directory for the generated exports")
+    parser.add_argument("--json", type=Path, default=None, help="Write the records to this JSON file")
+    parser.add_argument("--measure", type=Path, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure is not None:
+        # Child process: one mode, one file, result as JSON on the last line
+        print(json.dumps(_measure(args.measure, args.modes[0], args.workers, args.backend)))
+        return
+
+    print(TABLE_HEADER)
+    records = run_suite(args.rows, args.modes, args.work_dir, args.workers, args.backend)
+
+    if args.json is not None:
+        args.json.write_text(json.dumps(records, indent=2), encoding="utf-8")
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""
+Synthetic Celer Export Generator
+--------------------------------
+Writes deterministic Celer-shaped Excel 2003 XML (SpreadsheetML) files of
+any size, for reader tests and benchmarks that cannot rely on the one real
+export in DATA CELER.
+
+The files follow the layout of CarteraPendiente.xml: four title rows, the
+header row with the 49 CELER_COLUMN_NAMES, then one Row per installment.
+They also carry what makes the real exports hard to read:
+  - sparse rows: empty cells are sometimes left out, so the next cell
+    jumps ahead with ss:Index (and some rows omit ss:Index where it is
+    implied)
+  - bare '&' inside Data elements (e.g. "CONSTRUCCIONES B & Z S.A.S."),
+    besides properly escaped '&amp;'
+  - accented names and descriptions (MODIFICACIÓN, MUÑOZ, ...)
+
+The same rows and seed always produce the same bytes.
+
+Usage:
+    python tests/synthetic_celer.py output/synthetic_100k.xml --rows 100000
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from schemas.celer_mapping import CELER_COLUMN_NAMES
+
+# Row of the header in generated files (same as the real export)
+HEADER_ROW = 4
+
+DEFAULT_SEED = 20260127
+
+# Rows written per file write
+_WRITE_BATCH = 1000
+
+# 1-based positions of the ss:Type="Number" columns in the real export
+NUMBER_COLUMNS = frozenset({4, 6, 7, 11, 12, 13, 14, 15, 16, 17, 18, 19})
+
+# Every column not listed here is left empty most of the time
+_FILLED_COLUMNS = frozenset({1, 2, 3, 5, 8, 10, 21, 22, 23, 24, 25, 26, 27, 39, 40, 46})
+
+_FIRST_NAMES = [
+    "ANGEL ANTONIO", "MARÍA JOSÉ", "JOSÉ LUIS", "ANDRÉS FELIPE", "SEBASTIÁN",
+    "LUCÍA", "NICOLÁS", "CAMILA", "MARIO ALEJANDRO", "INÉS", "RAMÓN", "JULIÁN",
+]
+_LAST_NAMES = [
+    "GRAJALES ATEHORTUA", "MUÑOZ", "PEÑA", "AGUDELO ISAZA", "GÓMEZ", "MARTÍNEZ",
+    "RODRÍGUEZ", "CASTAÑO", "BASILIO BALTAZAR", "ÁLVAREZ", "ZAPATA", "ORDÓÑEZ",
+]
+# Company names; the bare '&' is written unescaped, as Celer does
+_COMPANIES = [
+    "CONSTRUCCIONES B & Z S.A.S.", "AB & C LOGISTICA S.A.S.", "PEÑA & ASOCIADOS LTDA",
+    "INVERSIONES EL ROBLE S.A.", "TRANSPORTES ÁGUILA S.A.S.", "R&D INGENIERÍA S.A.S.",
+]
+_INSURERS = ["SURAMERICANA S.A.", "ALLIANZ SEGUROS S.A.", "SEGUROS BOLÍVAR S.A.", "AXA COLPATRIA"]
+_BRANCHES = ["VIDA INDIVIDUAL", "AUTOMÓVILES", "SALUD", "HOGAR", "RESPONSABILIDAD CIVIL"]
+_OPERATIONS = ["MODIFICACIÓN", "RENOVACIÓN", "EXPEDICIÓN", "CANCELACIÓN"]
+_STATES = ["Pendiente de pago", "Pago parcial", "Vencido"]
+_VEHICLE_TYPES = ["AUTOMÓVIL", "CAMIONETA", "MOTOCICLETA", "CAMPERO"]
+
+Cell = Tuple[str, str]
+
+
+def _format_date(rng: random.Random, with_time: bool = False) -> str:
+    """US-format date string, the way Celer writes its dates"""
+    text = f"{rng.randint(1, 12)}/{rng.randint(1, 28)}/{rng.randint(2019, 2026)}"
+    if with_time:
+        text += f" {rng.randint(1, 12)}:{rng.randint(0, 59):02d} {rng.choice(('AM', 'PM'))}"
+    return text
+
+
+def _holder(rng: random.Random) -> Tuple[str, str, str]:
+    """Policy holder name, person type and document type"""
+    if rng.random() < 0.25:
+        return rng.choice(_COMPANIES), "Juridica", "NIT"
+    name = f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}"
+    if rng.random() < 0.05:
+        # Properly escaped '&', next to the bare ones
+        name += " &amp; CÍA"
+    return name, "Natural", "C.C"
+
+
+def synthetic_row(rng: random.Random, index: int) -> List[Optional[Cell]]:
+    """
+    Build one data row.
+
+    Args:
+        rng: Random generator (consumed in a fixed order)
+        index: Position of the row in the file, 0-based
+
+    Returns:
+        49 cells as (ss:Type, text) pairs; empty cells are ("String", "")
+        and cells left out of the row are None
+    """
+    holder, person_type, doc_type = _holder(rng)
+    amount = rng.randint(-2000000, 5000000)
+    values = {
+        1: _format_date(rng),
+        2: _format_date(rng),
+        3: _format_date(rng, with_time=True),
+        4: str(rng.randint(0, 900)),
+        5: str(60648000 + index),
+        6: str(rng.randint(0, 12)),
+        7: f"{amount}.000000",
+        8: rng.choice(_STATES),
+        10: rng.choice(_OPERATIONS),
+        11: f"{amount}.000000",
+        12: f"{amount}.000000",
+        17: f"{amount}.000000",
+        18: f"{amount}.000000",
+        19: f"{amount // 4}.000000",
+        21: str(5090000 + rng.randint(0, 99999)),
+        22: rng.choice(_INSURERS),
+        23: rng.choice(_BRANCHES),
+        24: holder,
+        25: person_type,
+        26: doc_type,
+        27: str(rng.randint(10000000, 1099999999)),
+        37: str(rng.randint(0, 1)),
+        39: f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}",
+        40: str(rng.randint(1000, 1099)),
+        46: f"POLIZA {rng.choice(_BRANCHES)}",
+    }
+    if rng.random() < 0.3:
+        values[30] = f"3{rng.randint(100000000, 199999999)}"
+        values[33] = f"cliente{index}@correo.com"
+    if rng.random() < 0.2:
+        values[41] = f"{rng.choice('ABCDEFGHJKLMNPRSTUVWXYZ') * 3}{rng.randint(100, 999)}"
+        values[42] = "SPARK GT"
+        values[43] = str(rng.randint(2005, 2026))
+        values[44] = rng.choice(_VEHICLE_TYPES)
+        values[45] = "CHEVROLET"
+    if rng.random() < 0.1:
+        values[34] = "Cliente solicitó acuerdo de pago & revisión"
+
+    sparse = rng.random() < 0.4
+    cells: List[Optional[Cell]] = []
+    for position in range(1, len(CELER_COLUMN_NAMES) + 1):
+        data_type = "Number" if position in NUMBER_COLUMNS else "String"
+        text = values.get(position)
+        if text is None:
+            if position in NUMBER_COLUMNS:
+                text = "0"
+            elif sparse and position not in _FILLED_COLUMNS:
+                cells.append(None)
+                continue
+            else:
+                text = ""
+        cells.append((data_type, text))
+    return cells
+
+
+def iter_synthetic_rows(rows: int, seed: int = DEFAULT_SEED) -> Iterator[List[Optional[Cell]]]:
+    """
+    Yield the data rows of a synthetic export.
+
+    Args:
+        rows: Number of data rows
+        seed: Random seed (same seed, same rows)
+
+    Yields:
+        Cells of each row (see synthetic_row)
+    """
+    rng = random.Random(seed)
+    for index in range(rows):
+        yield synthetic_row(rng, index)
+
+
+def _render_cell(position: int, cell: Cell, explicit_index: bool) -> str:
+    data_type, text = cell
+    index = f' ss:Index="{position}"' if explicit_index else ""
+    return f'    <Cell{index}><Data ss:Type="{data_type}">{text}</Data></Cell>\n'
+
+
+def render_row(cells: List[Optional[Cell]], explicit_index: bool = True) -> str:
+    """
+    Render one Row element.
+
+    Args:
+        cells: Cells of the row (see synthetic_row)
+        explicit_index: Write ss:Index on every cell; otherwise only on
+            cells that follow a left-out cell
+
+    Returns:
+        Row element text
+    """
+    parts = ["<Row>\n"]
+    skipped = False
+    for position, cell in enumerate(cells, start=1):
+        if cell is None:
+            skipped = True
+            continue
+        parts.append(_render_cell(position, cell, explicit_index or skipped))
+        skipped = False
+    parts.append("</Row>\n")
+    return "".join(parts)
+
+
+_PROLOGUE = """<?xml version="1.0"?>
+<?mso-application progid="Excel.Sheet"?>
+<Workbook xmlns="urn:schemas-microsoft-com:office:spreadsheet"
+ xmlns:o="urn:schemas-microsoft-com:office:office"
+ xmlns:x="urn:schemas-microsoft-com:office:excel"
+ xmlns:ss="urn:schemas-microsoft-com:office:spreadsheet"
+ xmlns:html="http://www.w3.org/TR/REC-html40">
+ <DocumentProperties xmlns="urn:schemas-microsoft-com:office:office">
+  <Author>CELER</Author>
+  <Title>Informe de cartera pendiente</Title>
+ </DocumentProperties>
+ <Styles>
+  <Style ss:ID="Default" ss:Name="Normal">
+   <Alignment ss:Vertical="Bottom"/>
+  </Style>
+  <Style ss:ID="Cabecera"><Font ss:FontName="arial" x:Family="Swiss" ss:Size="11"  ss:Bold="1" /></Style>
+ </Styles>
+ <Worksheet ss:Name="Informe">
+  <Table>
+<Row>
+    <Cell ss:StyleID="Cabecera"><Data ss:Type="String">INFORME DE CARTERA PENDIENTE</Data></Cell>
+</Row>
+<Row>
+    <Cell><Data ss:Type="String">Según fecha inicio vigencia del 1/1/2000 al 1/27/2026</Data></Cell>
+</Row>
+<Row>
+    <Cell ss:StyleID="Cabecera"><Data ss:Type="String">Filtros adicionales: </Data></Cell>
+    <Cell><Data ss:Type="String">No tiene</Data></Cell>
+</Row>
+<Row>
+    <Cell ss:StyleID="Cabecera"><Data ss:Type="String">Fecha: </Data></Cell>
+    <Cell><Data ss:Type="String">1/27/2026</Data></Cell>
+</Row>
+"""
+
+_EPILOGUE = """  </Table>
+  <WorksheetOptions xmlns="urn:schemas-microsoft-com:office:excel">
+   <Selected/>
+  </WorksheetOptions>
+ </Worksheet>
+</Workbook>
+"""
+
+
+def write_synthetic_celer_xml(file_path: Path, rows: int, seed: int = DEFAULT_SEED) -> Path:
+    """
+    Write a synthetic Celer export.
+
+    Every other row omits ss:Index where the position is implied, so both
+    cell addressing styles are exercised.
+
+    Args:
+        file_path: Output XML path
+        rows: Number of data rows (e.g. 1_000 to 1_000_000)
+        seed: Random seed (same rows and seed, same bytes)
+
+    Returns:
+        file_path
+    """
+    if rows < 0:
+        raise ValueError(f"rows must not be negative, got {rows}")
+
+    file_path = Path(file_path)
+    header = "".join(
+        f'    <Cell ss:StyleID="Cabecera" ss:Index="{position}"><Data ss:Type="String">{name}</Data></Cell>\n'
+        for position, name in enumerate(CELER_COLUMN_NAMES, start=1)
+    )
+
+    with open(file_path, 'w', encoding='utf-8', newline='\n') as file:
+        file.write(_PROLOGUE)
+        file.write(f"<Row>\n{header}</Row>\n")
+        batch = []
+        for index, cells in enumerate(iter_synthetic_rows(rows, seed)):
+            batch.append(render_row(cells, explicit_index=index % 2 == 0))
+            if len(batch) == _WRITE_BATCH:
+                file.write("".join(batch))
+                batch.clear()
+        file.write("".join(batch))
+        file.write(_EPILOGUE)
+
+    return file_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic Celer SpreadsheetML export")
+    parser.add_argument("output", type=Path, help="Output XML path")
+    parser.add_argument("--rows", type=int, default=1000, help="Data rows (default: 1000)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Random seed")
+    args = parser.parse_args()
+
+    path = write_synthetic_celer_xml(args.output, args.rows, args.seed)
+    print(f"Wrote {args.rows} rows to {path} ({path.stat().st_size / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -73,6 +73,27 @@ class TestColumnTransformer:
         assert list(result1.columns) == list(result2.columns)
         assert list(result1.columns) == [chr(65 + i) for i in range(23)]
     
+    def test_transform_chunks_matches_transform(self, transformer, valid_source_df):
+        """Test chunked transformation adds up to the whole-frame transformation"""
+        chunks = [valid_source_df.iloc[:2], valid_source_df.iloc[2:]]
+        
+        # Chunks carry their own categories, re-encoded after concatenation
+        result = transformer.apply_categorical_dtypes(pd.concat(transformer.transform_chunks(chunks)))
+        
+        pd.testing.assert_frame_equal(result, transformer.transform(valid_source_df))
+    
+    def test_repetitive_columns_are_categorical(self, transformer, valid_source_df):
+        """Test repetitive text columns come out as category, read as such or not"""
+        source_df = valid_source_df.copy()
+        source_df["Ramo"] = source_df["Ramo"].astype("category")
+        
+        result = transformer.transform(source_df)
+        
+        for column in ["Tipo_Doc", "Aseguradora", "Ramo", "Ejecutivo", "Unidad"]:
+            assert isinstance(result[column].dtype, pd.CategoricalDtype)
+        assert list(result["Aseguradora"]) == list(valid_source_df["Aseguradora"])
+        assert result["Tomador"].dtype == object
+    
     def test_validate_source_columns(self, transformer):
         """Test source column validation"""
         required = CELER_MAPPING.get_required_source_columns()
@@ -125,3 +146,32 @@ class TestCelerMapping:
         
         # Should not contain None
         assert None not in required
+    
+    def test_date_columns_are_mapped(self):
+        """Test every text date column is a mapped source column"""
+        assert set(CELER_MAPPING.date_columns) <= CELER_MAPPING.get_required_source_columns()
+    
+    def test_parse_date_columns(self):
+        """Test the text date columns are converted with their fixed formats"""
+        from transformer import parse_date_columns
+        
+        df = parse_date_columns(pd.DataFrame({
+            "F_Inicio": ["9/20/2024", None, "no es fecha"],
+            "F_Creacion": ["11/22/2024 12:04 PM", "11/28/2024 2:03 PM", None],
+            "Poliza": ["1", "2", "3"],
+        }))
+        
+        assert df["F_Inicio"].tolist()[0] == pd.Timestamp("2024-09-20")
+        assert df["F_Inicio"].isna().tolist() == [False, True, True]
+        assert df["F_Creacion"].tolist()[:2] == [pd.Timestamp("2024-11-22 12:04"), pd.Timestamp("2024-11-28 14:03")]
+        assert df["Poliza"].tolist() == ["1", "2", "3"]
+    
+    def test_parse_serial_date_columns(self):
+        """Test numeric date columns (pyxlsb date cells) are read as Excel serials"""
+        from transformer import parse_date_columns
+        
+        df = parse_date_columns(pd.DataFrame({"F_Inicio": [45555.0, None], "F_Creacion": [45618.5, 45624.0]}))
+        
+        assert df["F_Inicio"][0] == pd.Timestamp("2024-09-20")
+        assert pd.isna(df["F_Inicio"][1])
+        assert df["F_Creacion"].tolist() == [pd.Timestamp("2024-11-22 12:00"), pd.Timestamp("2024-11-28")]
@@ -0,0 +1,149 @@
+"""
+Unit tests for row-level delta detection between Celer exports.
+"""
+
+import pandas as pd
+import pytest
+
+import transformer
+from schemas.celer_mapping import CELER_MAPPING
+from services.column_transformer import ColumnTransformer
+from services.delta_detector import DeltaDetector
+from synthetic_celer import write_synthetic_celer_xml
+
+
+def export_frame(rows):
+    """Celer-shaped export with every required column"""
+    columns = sorted(CELER_MAPPING.get_required_source_columns())
+    df = pd.DataFrame({column: [f"{column}_{i}" for i in range(rows)] for column in columns})
+    df["Poliza"] = [f"02353{i:04d}" for i in range(rows)]
+    df["Documento"] = [str(60648000 + i) for i in range(rows)]
+    df["Cuota"] = 0
+    df["Saldo"] = [1000.0 * i for i in range(rows)]
+    df["Días"] = 30
+    return df
+
+
+@pytest.fixture
+def detector(tmp_path):
+    return DeltaDetector(state_dir=tmp_path / "delta")
+
+
+class TestDeltaDetector:
+    """Test suite for DeltaDetector"""
+
+    def test_first_export_is_all_added(self, detector):
+        previous = export_frame(5)
+
+        delta = detector.detect(previous, "CarteraPendiente")
+
+        assert len(delta.added) == 5
+        assert delta.changed.empty and delta.removed.empty
+
+    def test_added_changed_removed(self, detector):
+        """Test each kind of row change is reported against the stored export"""
+        detector.detect(export_frame(5), "CarteraPendiente")
+
+        current = export_frame(6).drop(index=1)
+        current.loc[3, "Saldo"] = -244611.0
+
+        delta = detector.detect(current, "CarteraPendiente")
+
+        assert delta.added.index.tolist() == [5]
+        assert delta.changed.index.tolist() == [3]
+        assert delta.removed["Poliza"].tolist() == ["023530001"]
+        assert delta.unchanged == 3
+        assert delta.delta.index.tolist() == [3, 5]
+
+    def test_unchanged_export(self, detector):
+        """Test days overdue alone, dtype and row order do not count as changes"""
+        detector.detect(export_frame(5), "CarteraPendiente")
+
+        current = export_frame(5).iloc[::-1]
+        current["Días"] += 7
+        current["Aseguradora"] = current["Aseguradora"].astype("category")
+        current["Cuota"] = current["Cuota"].astype(float)
+
+        delta = detector.detect(current, "CarteraPendiente")
+
+        assert delta.is_empty
+        assert delta.unchanged == 5
+
+    def test_duplicated_keys(self, detector):
+        """Test rows sharing a key are matched by order of appearance"""
+        previous = export_frame(3)
+        previous.loc[:, ["Poliza", "Documento"]] = ["5090960", "60648195"]
+        detector.detect(previous, "CarteraPendiente")
+
+        current = previous.copy()
+        current.loc[2, "Saldo"] = 1.0
+
+        delta = detector.detect(current, "CarteraPendiente")
+
+        assert delta.changed.index.tolist() == [2]
+        assert delta.added.empty and delta.removed.empty
+
+    def test_update_false_keeps_previous_fingerprints(self, detector):
+        detector.detect(export_frame(2), "CarteraPendiente")
+
+        detector.detect(export_frame(4), "CarteraPendiente", update=False)
+        delta = detector.detect(export_frame(4), "CarteraPendiente")
+
+        assert len(delta.added) == 2
+
+    def test_delta_can_be_transformed(self, detector):
+        """Test the delta rows go through the column transformer"""
+        detector.detect(export_frame(3), "CarteraPendiente")
+        current = export_frame(4)
+
+        delta = detector.detect(current, "CarteraPendiente")
+        transformed = ColumnTransformer().transform(delta.delta)
+
+        assert len(transformed) == 1
+        assert transformed["Poliza"].tolist() == ["023530003"]
+
+    def test_missing_columns(self, detector):
+        with pytest.raises(ValueError, match="Missing required columns"):
+            detector.fingerprint(export_frame(2).drop(columns=["Documento"]))
+
+
+class TestDeltaTransform:
+    """Test suite for transforming only the rows that changed"""
+
+    def test_same_output_as_full_transform(self, detector, monkeypatch):
+        column_transformer = ColumnTransformer()
+        previous = export_frame(5)
+        previous["Aseguradora"] = previous["Aseguradora"].astype("category")
+        transformer.transform_celer_delta(previous, "CarteraPendiente", column_transformer, detector)
+
+        current = pd.concat([previous.drop(index=1), export_frame(6).iloc[[5]]]).iloc[::-1]
+        current.loc[3, "Saldo"] = -244611.0
+        current["Días"] += 7
+        current["Aseguradora"] = current["Aseguradora"].astype(str).astype("category")
+        transformed_rows = []
+        full_transform = column_transformer.transform
+        def spy(source_df):
+            transformed_rows.append(len(source_df))
+            return full_transform(source_df)
+        monkeypatch.setattr(column_transformer, "transform", spy)
+
+        result = transformer.transform_celer_delta(current, "CarteraPendiente", column_transformer, detector)
+
+        assert transformed_rows == [2]
+        pd.testing.assert_frame_equal(result, full_transform(current))
+
+    def test_transform_xml_with_delta(self, tmp_path, monkeypatch):
+        """Test delta mode writes the same workbook as a full transformation"""
+        monkeypatch.setenv("DELTA_STATE_DIR", str(tmp_path / "delta"))
+        source = tmp_path / "CarteraPendiente.xml"
+        write_synthetic_celer_xml(source, 120, seed=1)
+        transformer.transform_xml_format(source, tmp_path / "primera.xlsx", use_cache=False, delta=True)
+
+        write_synthetic_celer_xml(source, 150, seed=1)
+        transformer.transform_xml_format(source, tmp_path / "delta.xlsx", use_cache=False, delta=True)
+        transformer.transform_xml_format(source, tmp_path / "completa.xlsx", use_cache=False)
+
+        pd.testing.assert_frame_equal(pd.read_excel(tmp_path / "delta.xlsx"), pd.read_excel(tmp_path / "completa.xlsx"))
+        assert (tmp_path / "delta" / "CarteraPendiente.fingerprints.pkl").exists()
+        with pytest.raises(ValueError, match="chunk_rows"):
+            transformer.transform_xml_format(source, tmp_path / "x.xlsx", chunk_rows=100, delta=True)
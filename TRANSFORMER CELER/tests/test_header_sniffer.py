@@ -0,0 +1,123 @@
+"""
+Unit tests for the header sniffer.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from adapters.header_sniffer import sniff_headers
+from adapters.xml_reader import read_celer_xml
+from schemas.celer_mapping import CELER_MAPPING
+from services.column_transformer import ColumnTransformer
+
+
+REAL_CELER_XML = Path(__file__).parent.parent.parent / "DATA CELER" / "CarteraPendiente.xml"
+ALLIANZ_XLSB_DIR = Path(__file__).parent.parent.parent / "CONCILIATOR ALLIANZ" / "INPUT" / "PERSONAS"
+ALLIANZ_XLSB = next(
+    (path for path in sorted(ALLIANZ_XLSB_DIR.glob("*.xlsb")) if not path.name.startswith("~$")),
+    None
+) if ALLIANZ_XLSB_DIR.exists() else None
+
+SAMPLE_XML = """<?xml version="1.0"?>
+<Workbook xmlns="urn:schemas-microsoft-com:office:spreadsheet"
+ xmlns:ss="urn:schemas-microsoft-com:office:spreadsheet">
+ <Worksheet ss:Name="Informe">
+  <Table>
+<Row><Cell><Data ss:Type="String">INFORME DE CARTERA PENDIENTE</Data></Cell></Row>
+<Row>
+    <Cell ss:Index="1"><Data ss:Type="String">Poliza</Data></Cell>
+    <Cell ss:Index="2"><Data ss:Type="String">Tomador</Data></Cell>
+    <Cell ss:Index="3"><Data ss:Type="String">Saldo</Data></Cell>
+    <Cell ss:Index="4"><Data ss:Type="String">Días</Data></Cell>
+</Row>
+<Row><Cell><Data ss:Type="String">B & Z S.A.S.</Data></Cell></Row>
+  </Table>
+ </Worksheet>
+</Workbook>
+"""
+
+
+def write_celer_xlsx(path, columns):
+    """Write a workbook with title rows above the header, like a Celer export"""
+    title = pd.DataFrame([["INFORME DE CARTERA PENDIENTE"], [None], ["Filtros"], [None]])
+    data = pd.DataFrame([["x"] * len(columns)], columns=columns)
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        title.to_excel(writer, index=False, header=False)
+        data.to_excel(writer, index=False, startrow=CELER_MAPPING.header_row)
+    return path
+
+
+class TestSniffHeaders:
+    """Test suite for sniff_headers"""
+
+    def test_xml(self, tmp_path):
+        """Test the XML header row is parsed like the full reader does"""
+        path = tmp_path / "CarteraPendiente.xml"
+        path.write_text(SAMPLE_XML, encoding="utf-8")
+
+        assert sniff_headers(path, header_row=1) == ["Poliza", "Tomador", "Saldo", "Días"]
+
+    def test_xml_missing_header_row(self, tmp_path):
+        """Test a file shorter than the header row is reported"""
+        path = tmp_path / "CarteraPendiente.xml"
+        path.write_text(SAMPLE_XML, encoding="utf-8")
+
+        with pytest.raises(ValueError, match="No header row"):
+            sniff_headers(path, header_row=4)
+
+    @pytest.mark.skipif(not REAL_CELER_XML.exists(), reason="Celer export not available")
+    def test_real_export_matches_full_read(self):
+        """Test the sniffed headers are the columns of the full read"""
+        headers = sniff_headers(REAL_CELER_XML, CELER_MAPPING.header_row)
+
+        assert headers == list(read_celer_xml(REAL_CELER_XML).columns)
+
+    def test_xlsx(self, tmp_path):
+        """Test the header of an XLSX is read at header_row"""
+        columns = ["Poliza", "Tomador", "Saldo"]
+        path = write_celer_xlsx(tmp_path / "celer.xlsx", columns)
+
+        assert sniff_headers(path, CELER_MAPPING.header_row) == columns
+        assert sniff_headers(path, 0) == ["INFORME DE CARTERA PENDIENTE"]
+
+    @pytest.mark.skipif(ALLIANZ_XLSB is None, reason="Allianz .xlsb report not available")
+    @pytest.mark.parametrize("header_row", [1, 14])
+    def test_xlsb_matches_pandas(self, header_row):
+        """Test the XLSB header matches what pandas reads at the same row"""
+        headers = sniff_headers(ALLIANZ_XLSB, header_row)
+        expected = pd.read_excel(ALLIANZ_XLSB, header=header_row, nrows=0).columns
+
+        assert [
+            f"Unnamed: {position}" if header is None else header
+            for position, header in enumerate(headers)
+        ] == list(expected[:len(headers)])
+
+    def test_unsupported_format(self, tmp_path):
+        """Test formats without a header reader are rejected"""
+        path = tmp_path / "cartera.csv"
+        path.write_text("Poliza,Tomador\n", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Unsupported file format"):
+            sniff_headers(path)
+
+
+class TestValidateSourceFile:
+    """Test suite for ColumnTransformer.validate_source_file"""
+
+    def test_valid_xlsx_at_header_row(self, tmp_path):
+        """Test the header is looked up at the mapping's header_row"""
+        columns = sorted(CELER_MAPPING.get_required_source_columns())
+        path = write_celer_xlsx(tmp_path / "celer.xlsx", columns)
+
+        assert ColumnTransformer().validate_source_file(path) == (True, [])
+
+    def test_wrong_file(self, tmp_path):
+        """Test a file that is not a Celer export reports the missing columns"""
+        path = write_celer_xlsx(tmp_path / "otro.xlsx", ["Cliente - Tomador", "Cartera Total"])
+
+        is_valid, missing = ColumnTransformer().validate_source_file(path)
+
+        assert not is_valid
+        assert missing == sorted(CELER_MAPPING.get_required_source_columns())
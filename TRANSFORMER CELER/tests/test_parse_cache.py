@@ -0,0 +1,148 @@
+"""
+Unit tests for the on-disk parse cache.
+"""
+
+import math
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from adapters.parse_cache import ParseCache, PYARROW_AVAILABLE
+
+
+pytestmark = pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Cache in a temporary directory"""
+    return ParseCache(cache_dir=tmp_path / "cache", max_bytes=10 * 1024 * 1024, enabled=True)
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    """Input file whose content keys the cache"""
+    path = tmp_path / "input.xml"
+    path.write_text("contenido original", encoding="utf-8")
+    return path
+
+
+def sample_frame():
+    return pd.DataFrame({
+        "Poliza": ["023537654", None, "5090961"],
+        "Saldo": [-244611.0, 0.0, 1500.5],
+        "Dias": [494, 12, 3],
+        "F_Inicio": pd.to_datetime(["2025-12-11", None, "2026-01-27"]),
+    })
+
+
+class TestParseCache:
+    """Test suite for ParseCache"""
+
+    def test_warm_read_skips_parse(self, cache, source_file):
+        """Test the second read returns the cached frame without parsing"""
+        calls = []
+
+        def parse():
+            calls.append(1)
+            return sample_frame()
+
+        first = cache.get_or_parse(source_file, "celer_xml/1", parse)
+        second = cache.get_or_parse(source_file, "celer_xml/1", parse)
+
+        assert len(calls) == 1
+        pd.testing.assert_frame_equal(second, first)
+
+    def test_key_depends_on_content_reader_and_options(self, cache, source_file):
+        """Test content, reader version and options all change the key"""
+        key = cache.make_key(source_file, "celer_xml/1", {"header_row": 4})
+
+        assert cache.make_key(source_file, "celer_xml/2", {"header_row": 4}) != key
+        assert cache.make_key(source_file, "celer_xml/1", {"header_row": 5}) != key
+
+        source_file.write_text("contenido modificado", encoding="utf-8")
+        assert cache.make_key(source_file, "celer_xml/1", {"header_row": 4}) != key
+
+    def test_key_is_stable_across_interpreters(self, cache, source_file):
+        """Test set options (e.g. usecols) give the same key whatever the hash seed"""
+        script = (
+            "import sys; from adapters.parse_cache import ParseCache; "
+            "cache = ParseCache(cache_dir=sys.argv[1], enabled=True); "
+            "print(cache.make_key(sys.argv[2], 'celer_xml/1', "
+            "{'usecols': {'Poliza', 'Documento', 'Tomador', 'Saldo', 'F_Inicio'}}))"
+        )
+        keys = set()
+        for seed in ("1", "2", "3"):
+            result = subprocess.run(
+                [sys.executable, "-c", script, str(cache.cache_dir), str(source_file)],
+                capture_output=True, text=True, check=True,
+                cwd=Path(__file__).parent.parent, env={**os.environ, "PYTHONHASHSEED": seed}
+            )
+            keys.add(result.stdout.strip())
+
+        assert keys == {cache.make_key(source_file, "celer_xml/1", {"usecols": sorted(["Poliza", "Documento", "Tomador", "Saldo", "F_Inicio"])})}
+
+    def test_bypass(self, cache, source_file):
+        """Test use_cache=False parses every time and stores nothing"""
+        calls = []
+
+        def parse():
+            calls.append(1)
+            return sample_frame()
+
+        cache.get_or_parse(source_file, "celer_xml/1", parse, use_cache=False)
+        cache.get_or_parse(source_file, "celer_xml/1", parse, use_cache=False)
+
+        assert len(calls) == 2
+        assert not cache.cache_dir.exists() or not list(cache.cache_dir.iterdir())
+
+    def test_nan_markers_round_trip(self, cache, source_file):
+        """Test object columns read by pandas keep NaN for empty cells"""
+        df = pd.DataFrame({"Recibo": ["1347216594", math.nan], "Anexo": [None, "2"]})
+        key = cache.make_key(source_file, "softseguros_xlsx")
+
+        assert cache.store(key, df)
+        loaded = cache.load(key)
+
+        assert isinstance(loaded["Recibo"][1], float)
+        assert loaded["Anexo"][0] is None
+        pd.testing.assert_frame_equal(loaded, df)
+
+    def test_uncacheable_frame_is_returned_unchanged(self, cache, source_file):
+        """Test frames mixing types in a column are parsed but not stored"""
+        df = pd.DataFrame({"Mixto": [7, "siete", 7.5]})
+
+        result = cache.get_or_parse(source_file, "celer_xml/1", lambda: df)
+
+        assert result is df
+        assert not list(cache.cache_dir.glob("*.parquet"))
+
+    def test_lru_eviction(self, tmp_path, source_file):
+        """Test the least recently used entry is evicted first"""
+        cache = ParseCache(cache_dir=tmp_path / "cache", enabled=True)
+        frame = pd.DataFrame({"Valor": range(1000)})
+        keys = [cache.make_key(source_file, f"reader/{i}") for i in range(3)]
+        for key in keys:
+            cache.store(key, frame)
+        entry_size = cache._entry_path(keys[0]).stat().st_size
+
+        # Touch the oldest entry, then shrink the bound to two entries
+        assert cache.load(keys[0]) is not None
+        cache.max_bytes = 2 * entry_size
+        cache.evict()
+
+        assert cache.load(keys[0]) is not None
+        assert cache.load(keys[1]) is None
+        assert cache.load(keys[2]) is not None
+
+    def test_disabled_cache(self, tmp_path, source_file):
+        """Test a disabled cache always parses"""
+        cache = ParseCache(cache_dir=tmp_path / "cache", enabled=False)
+
+        cache.get_or_parse(source_file, "celer_xml/1", sample_frame)
+
+        assert not (tmp_path / "cache").exists()
@@ -0,0 +1,138 @@
+"""
+Unit tests for progress reporting in the readers and writers.
+"""
+
+import pandas as pd
+import pytest
+
+from adapters.progress import ProgressFile, ProgressReporter, progress_stage
+from adapters.xml_reader import READER_MODES, read_celer_xml
+import transformer
+
+
+SAMPLE_XML = """<?xml version="1.0"?>
+<Workbook xmlns="urn:schemas-microsoft-com:office:spreadsheet"
+ xmlns:ss="urn:schemas-microsoft-com:office:spreadsheet">
+ <Worksheet ss:Name="Informe">
+  <Table>
+   <Row><Cell><Data ss:Type="String">Poliza</Data></Cell><Cell><Data ss:Type="String">Saldo</Data></Cell></Row>
+{rows}
+  </Table>
+ </Worksheet>
+</Workbook>
+"""
+
+
+@pytest.fixture
+def sample_xml(tmp_path):
+    rows = "\n".join(
+        f'   <Row><Cell><Data ss:Type="String">0235{i}</Data></Cell>'
+        f'<Cell><Data ss:Type="Number">{i}.5</Data></Cell></Row>'
+        for i in range(2000)
+    )
+    path = tmp_path / "CarteraPendiente.xml"
+    path.write_text(SAMPLE_XML.format(rows=rows), encoding="utf-8")
+    return path
+
+
+class TestProgressReporter:
+    """Test suite for ProgressReporter"""
+
+    def test_throttled(self):
+        calls = []
+        reporter = ProgressReporter(lambda done, total: calls.append(done), 1000, interval=3600)
+
+        for done in range(0, 1000, 10):
+            reporter.update(done)
+
+        assert calls == [0]
+
+    def test_finish_always_reports_total(self):
+        calls = []
+        reporter = ProgressReporter(lambda done, total: calls.append((done, total)), 1000, interval=3600)
+
+        reporter.update(10)
+        reporter.finish()
+
+        assert calls[-1] == (1000, 1000)
+
+    def test_monotonic_and_capped(self):
+        calls = []
+        reporter = ProgressReporter(lambda done, total: calls.append(done), 100, interval=0)
+
+        reporter.update(50)
+        reporter.update(20)
+        reporter.advance(500)
+
+        assert calls == [50, 50, 100]
+
+    def test_no_callback(self):
+        reporter = ProgressReporter(None, 100)
+        reporter.update(50)
+        reporter.finish()
+
+        assert reporter.done == 100
+
+    def test_progress_file_counts_bytes(self, tmp_path):
+        path = tmp_path / "datos.bin"
+        path.write_bytes(b"x" * 5000)
+        reporter = ProgressReporter(None, 5000)
+
+        with ProgressFile(path, reporter) as source:
+            source.read(1000)
+            source.read()
+
+        assert reporter.done == 5000
+
+    def test_progress_stage(self):
+        calls = []
+        stage = progress_stage(lambda done, total: calls.append((done, total)), 70, 100)
+
+        stage(0, 10)
+        stage(5, 10)
+        stage(10, 10)
+
+        assert calls == [(70, 100), (85, 100), (100, 100)]
+        assert progress_stage(None, 0, 50) is None
+
+
+class TestReaderProgress:
+    """Test suite for progress reported by the readers and the writer"""
+
+    @pytest.mark.parametrize("mode", READER_MODES)
+    def test_xml_reader_reports_bytes(self, sample_xml, mode):
+        calls = []
+        size = sample_xml.stat().st_size
+
+        df = read_celer_xml(sample_xml, header_row=0, mode=mode, workers=1,
+                            progress=lambda done, total: calls.append((done, total)))
+
+        assert len(df) == 2000
+        assert calls[-1][0] == calls[-1][1] >= size
+        assert [done for done, _ in calls] == sorted(done for done, _ in calls)
+
+    def test_write_output_file_reports_rows(self, tmp_path, monkeypatch):
+        """Test chunked writing reports rows and writes the same sheet"""
+        monkeypatch.setattr(transformer, "_WRITE_CHUNK_ROWS", 7)
+        df = pd.DataFrame({"Poliza": [f"0235{i}" for i in range(25)], "Saldo": range(25)})
+        calls = []
+
+        transformer.write_output_file(df, tmp_path / "salida.xlsx",
+                                      progress=lambda done, total: calls.append((done, total)))
+
+        assert calls[-1] == (25, 25)
+        pd.testing.assert_frame_equal(pd.read_excel(tmp_path / "salida.xlsx", dtype={"Poliza": str}), df)
+
+    def test_transform_reports_percent(self, tmp_path, monkeypatch):
+        """Test the whole transformation reports 0-100 and ends at 100"""
+        monkeypatch.setattr(transformer, "check_source_headers", lambda file_path, program: None)
+        source = pd.DataFrame({"Poliza": ["02353"]})
+        monkeypatch.setattr(transformer, "read_celer_xlsx", lambda file_path, use_cache, progress: source)
+        monkeypatch.setattr(transformer.ColumnTransformer, "transform", lambda self, df: df)
+        calls = []
+
+        transformer.transform_xlsx_format(tmp_path / "entrada.xlsx", tmp_path / "salida.xlsx",
+                                          progress=lambda done, total: calls.append((done, total)))
+
+        assert calls[0] == (transformer._TRANSFORM_STAGE_END, 100)
+        assert calls[-1] == (100, 100)
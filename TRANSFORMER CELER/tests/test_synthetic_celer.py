@@ -0,0 +1,78 @@
+"""
+Unit tests for the synthetic Celer export generator and the reader benchmark.
+"""
+
+import pandas as pd
+import pytest
+
+from adapters.xml_reader import READER_MODES, read_celer_xml
+from schemas.celer_mapping import CELER_COLUMN_NAMES
+from benchmark_xml_reader import run_benchmark
+from synthetic_celer import HEADER_ROW, iter_synthetic_rows, render_row, write_synthetic_celer_xml
+
+
+@pytest.fixture(scope="module")
+def synthetic_xml(tmp_path_factory):
+    return write_synthetic_celer_xml(tmp_path_factory.mktemp("synthetic") / "CarteraPendiente.xml", 1000)
+
+
+class TestSyntheticCeler:
+    """Test suite for the synthetic export generator"""
+
+    def test_deterministic(self, tmp_path, synthetic_xml):
+        again = write_synthetic_celer_xml(tmp_path / "again.xml", 1000)
+        other_seed = write_synthetic_celer_xml(tmp_path / "other.xml", 1000, seed=1)
+
+        assert again.read_bytes() == synthetic_xml.read_bytes()
+        assert other_seed.read_bytes() != synthetic_xml.read_bytes()
+
+    def test_hard_cases_are_present(self, synthetic_xml):
+        """Test the file has sparse cells, bare '&' and accents"""
+        text = synthetic_xml.read_text(encoding="utf-8")
+
+        assert "B & Z S.A.S." in text
+        assert "&amp;" in text
+        assert "MODIFICACIÓN" in text
+        assert any(None in cells for cells in iter_synthetic_rows(1000))
+
+    def test_render_row_sparse_index(self):
+        """Test cells after a left-out cell carry ss:Index even without explicit_index"""
+        row = render_row([("String", "a"), None, ("Number", "3")], explicit_index=False)
+
+        assert '<Cell><Data ss:Type="String">a</Data></Cell>' in row
+        assert '<Cell ss:Index="3"><Data ss:Type="Number">3</Data></Cell>' in row
+
+    @pytest.mark.parametrize("mode", READER_MODES)
+    def test_readable_by_every_mode(self, synthetic_xml, mode):
+        """Test every reader mode gets the generated rows back"""
+        df = read_celer_xml(synthetic_xml, header_row=HEADER_ROW, mode=mode, workers=2)
+        rows = list(iter_synthetic_rows(1000))
+
+        assert list(df.columns) == CELER_COLUMN_NAMES
+        assert len(df) == 1000
+        for position, name in [(5, "Documento"), (24, "Tomador"), (33, "Mail_Pers"), (41, "Placa")]:
+            expected = [cells[position - 1][1] if cells[position - 1] else "" for cells in rows]
+            expected = [text.replace("&amp;", "&") or None for text in expected]
+            assert df[name].tolist() == expected
+        assert (df["Saldo"] == pd.Series([float(cells[6][1]) for cells in rows])).all()
+
+    def test_rejects_negative_rows(self, tmp_path):
+        with pytest.raises(ValueError):
+            write_synthetic_celer_xml(tmp_path / "x.xml", -1)
+
+
+class TestReaderBenchmark:
+    """Test suite for the XML reader benchmark"""
+
+    @pytest.mark.slow
+    def test_benchmark_record(self, tmp_path):
+        record = run_benchmark(1000, "streaming", work_dir=tmp_path)
+
+        assert record["rows"] == 1000
+        assert record["seconds"] > 0
+        assert record["rows_per_second"] > 0
+        assert record["file_mb"] > 0
+
+    def test_unknown_mode(self, tmp_path):
+        with pytest.raises(ValueError):
+            run_benchmark(1000, "dom", work_dir=tmp_path)
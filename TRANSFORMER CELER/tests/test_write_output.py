@@ -0,0 +1,144 @@
+"""
+Unit tests for writing the transformed output workbook.
+"""
+
+import openpyxl
+import pandas as pd
+import pytest
+
+import transformer
+from synthetic_celer import write_synthetic_celer_xml
+
+
+def output_frame():
+    return pd.DataFrame({
+        "Poliza": ["023537654", None, "5090961"],
+        "Tomador": pd.Categorical(["CONSTRUCCIONES B & Z S.A.S.", "MARÍA JOSÉ MUÑOZ", None]),
+        "Saldo": [-244611.0, None, 1500.5],
+        "Días": [494, 12, 3],
+        "F_Inicio": pd.to_datetime(["2024-09-20", None, "2026-01-27"]),
+        "Observación con un nombre de columna muy largo para la hoja": ["", "x" * 80, None],
+    })
+
+
+class TestWriteOutputFile:
+    """Test suite for write_output_file"""
+
+    def test_column_widths(self):
+        """Test widths follow the longest header or value, padded and capped at 50"""
+        widths = transformer.column_widths(output_frame())
+
+        # Poliza (9 chars), Tomador (27), Saldo (-244611.0), Días, F_Inicio (with time), capped
+        assert widths == [11, 29, 11, 6, 21, 50]
+
+    def test_empty_cells_measured_as_none(self):
+        """Test empty cells widen a column as much as the text "None", like the old cell-by-cell loop"""
+        widths = transformer.column_widths(pd.DataFrame({"ID": ["1", None], "No": [1.0, None], "Ok": ["1", "2"]}))
+
+        assert widths == [6, 6, 4]
+
+    def test_round_trip_and_header_style(self, tmp_path):
+        df = output_frame()
+        path = tmp_path / "salida.xlsx"
+
+        transformer.write_output_file(df, path)
+
+        written = pd.read_excel(path, dtype={"Poliza": str})
+        assert written["Poliza"].tolist()[::2] == ["023537654", "5090961"]
+        assert pd.isna(written["Saldo"][1])
+        assert written["Tomador"][1] == "MARÍA JOSÉ MUÑOZ"
+        assert written["F_Inicio"][0] == pd.Timestamp("2024-09-20")
+
+        worksheet = openpyxl.load_workbook(path)["Cartera_Transformada"]
+        header = worksheet["A1"]
+        assert header.font.b and header.font.color.rgb == "00FFFFFF"
+        assert header.fill.start_color.rgb == "00366092"
+        assert header.alignment.horizontal == "center"
+        assert worksheet.column_dimensions["B"].width == 29
+
+    def test_empty_frame(self, tmp_path):
+        path = tmp_path / "vacia.xlsx"
+
+        transformer.write_output_file(output_frame().iloc[0:0], path)
+
+        assert list(pd.read_excel(path).columns) == list(output_frame().columns)
+
+    def test_chunks_match_whole_frame(self, tmp_path):
+        """Test writing a stream of chunks gives the same rows and widths as the whole frame"""
+        df = output_frame()
+        whole, chunked = tmp_path / "entera.xlsx", tmp_path / "por_partes.xlsx"
+        transformer.write_output_file(df, whole)
+
+        rows = transformer.write_output_chunks((df.iloc[i:i + 2] for i in range(0, 3, 2)), list(df.columns), chunked)
+
+        assert rows == 3
+        pd.testing.assert_frame_equal(pd.read_excel(chunked), pd.read_excel(whole))
+        widths = [openpyxl.load_workbook(path)["Cartera_Transformada"].column_dimensions["B"].width
+                  for path in (whole, chunked)]
+        assert widths == [29, 29]
+
+    def test_chunked_xml_transform(self, tmp_path):
+        source = write_synthetic_celer_xml(tmp_path / "CarteraPendiente.xml", 250)
+        whole, chunked = tmp_path / "entera.xlsx", tmp_path / "por_partes.xlsx"
+
+        transformer.transform_xml_format(source, whole, use_cache=False)
+        transformer.transform_xml_format(source, chunked, chunk_rows=100)
+
+        pd.testing.assert_frame_equal(pd.read_excel(chunked), pd.read_excel(whole))
+        with pytest.raises(ValueError, match="chunk_rows"):
+            transformer.transform_xml_format(source, chunked, chunk_rows=100, sidecar="parquet")
+
+
+class TestSidecarFile:
+    """Test suite for the columnar copy of the output"""
+
+    @pytest.mark.parametrize("sidecar_format", transformer.SIDECAR_FORMATS)
+    def test_keeps_columns_and_dtypes(self, tmp_path, sidecar_format):
+        pytest.importorskip("pyarrow")
+        df = output_frame()
+        output_file = tmp_path / "salida.xlsx"
+        transformer.write_output_file(df, output_file)
+
+        sidecar = transformer.write_sidecar_file(df, output_file, sidecar_format)
+
+        assert sidecar == tmp_path / f"salida.{sidecar_format}"
+        assert sidecar.stat().st_mtime >= output_file.stat().st_mtime
+        read = pd.read_parquet(sidecar) if sidecar_format == "parquet" else pd.read_feather(sidecar)
+        pd.testing.assert_frame_equal(read, df)
+
+    @pytest.mark.parametrize("sidecar_format", transformer.SIDECAR_FORMATS)
+    def test_unconvertible_columns_skip_sidecar(self, tmp_path, sidecar_format):
+        """Test a column pyarrow cannot convert leaves only the workbook behind"""
+        pytest.importorskip("pyarrow")
+        df = pd.DataFrame({"Identificacion": [123, "CC 456"], "Saldo": [1.0, 2.0]})
+        output_file = tmp_path / "salida.xlsx"
+        transformer.write_output_file(df, output_file)
+
+        assert transformer.write_sidecar_file(df, output_file, sidecar_format) is None
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["salida.xlsx"]
+
+    def test_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown sidecar format"):
+            transformer.transform_xml_format(tmp_path / "CarteraPendiente.xml", sidecar="csv")
+
+
+class TestInMemoryHandoff:
+    """Test suite for handing the transformed DataFrame to the caller"""
+
+    def test_on_transformed_runs_before_the_write(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(transformer, "check_source_headers", lambda file_path, program: None)
+        monkeypatch.setattr(transformer, "read_celer_xlsx", lambda file_path, use_cache, progress: output_frame())
+        monkeypatch.setattr(transformer.ColumnTransformer, "transform", lambda self, df: df)
+        output_file = tmp_path / "salida.xlsx"
+        handed = []
+
+        def on_transformed(df, path):
+            handed.append((df, path, path.exists()))
+
+        transformer.transform_xlsx_format(tmp_path / "entrada.xlsx", output_file, on_transformed=on_transformed)
+
+        assert len(handed) == 1
+        df, path, written = handed[0]
+        assert path == output_file and not written
+        pd.testing.assert_frame_equal(df, output_frame())
+        assert output_file.exists()
@@ -0,0 +1,182 @@
+"""
+Unit tests for the XLSX reader engines.
+"""
+
+from datetime import datetime, time
+from pathlib import Path
+
+import openpyxl
+import pandas as pd
+import pytest
+
+import adapters.xlsx_reader as xlsx_reader
+from adapters.parse_cache import PYARROW_AVAILABLE, ParseCache
+from adapters.xlsx_reader import available_xlsx_engines, excel_file_format, read_xlsx, select_xlsx_engine
+from domain.exceptions import FileProcessingError
+from schemas.celer_mapping import CELER_MAPPING
+import transformer
+
+
+REAL_CELER_XLSX = Path(__file__).parent.parent.parent / "DATA CELER" / "CarteraPendiente.xlsx"
+REAL_XLSB = next(
+    (path for path in (Path(__file__).parent.parent.parent / "CONCILIATOR ALLIANZ" / "INPUT" / "PERSONAS").glob("*.xlsb")
+     if not path.name.startswith("~$")),
+    None
+)
+
+CALAMINE_AVAILABLE = "calamine" in available_xlsx_engines()
+
+
+@pytest.fixture
+def sample_xlsx(tmp_path):
+    """Celer-shaped workbook: title rows, header at row 4, mixed types"""
+    path = tmp_path / "CarteraPendiente.xlsx"
+    data = pd.DataFrame({
+        "F_Inicio": ["9/20/2024", "11/7/2024", None],
+        "Días": [494, 446, 12],
+        "Poliza": ["023537654", "5090960", "5090961"],
+        "Saldo": [-244611.0, 1500.5, 0.0],
+        "Tomador": ["CONSTRUCCIONES B & Z S.A.S.", "MARÍA JOSÉ MUÑOZ", None],
+        "Aseguradora": ["SURAMERICANA S.A.", "SURAMERICANA S.A.", "ALLIANZ SEGUROS S.A."],
+        "Sin_Mapear": ["x", "y", "z"],
+    })
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        pd.DataFrame([["INFORME DE CARTERA PENDIENTE"]]).to_excel(writer, index=False, header=False)
+        data.to_excel(writer, index=False, startrow=4)
+    return path
+
+
+@pytest.fixture
+def date_cells_xlsx(tmp_path):
+    """Workbook with date-formatted cells, including serials below 1 (no date part)"""
+    path = tmp_path / "fechas.xlsx"
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["F_Inicio", "FECHA DE NACIMIENTO"])
+    for start, birth in [(45555, -18820), (45603, 45000), (None, 0.5), (45000, None)]:
+        sheet.append([start, birth])
+    for row in sheet.iter_rows(min_row=2):
+        for cell in row:
+            cell.number_format = "yyyy-mm-dd"
+    workbook.save(path)
+    return path
+
+
+class TestXlsxEngines:
+    """Test suite for XLSX engine selection and reading"""
+
+    def test_auto_picks_fastest_installed(self):
+        assert select_xlsx_engine() == available_xlsx_engines()[0]
+        assert "openpyxl" in available_xlsx_engines()
+
+    def test_auto_falls_back_to_openpyxl(self, monkeypatch):
+        monkeypatch.setattr(xlsx_reader, "_calamine_available", lambda: False)
+
+        assert select_xlsx_engine() == "openpyxl"
+        with pytest.raises(ValueError, match="not available"):
+            select_xlsx_engine("calamine")
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError, match="Unknown XLSX engine"):
+            select_xlsx_engine("xlrd")
+
+    @pytest.mark.parametrize("engine", available_xlsx_engines())
+    def test_usecols_projection(self, sample_xlsx, engine):
+        """Test only the requested columns are kept and missing names are ignored"""
+        df = read_xlsx(sample_xlsx, header_row=4, usecols={"Tomador", "Saldo", "Aseguradora", "Placa"},
+                       category_columns=["Aseguradora"], engine=engine)
+
+        assert list(df.columns) == ["Saldo", "Tomador", "Aseguradora"]
+        assert df["Tomador"][1] == "MARÍA JOSÉ MUÑOZ"
+        assert isinstance(df["Aseguradora"].dtype, pd.CategoricalDtype)
+
+    @pytest.mark.skipif(not CALAMINE_AVAILABLE, reason="python-calamine not installed")
+    def test_calamine_matches_openpyxl(self, sample_xlsx):
+        """Test the fast engine builds exactly the same DataFrame"""
+        options = dict(header_row=4, usecols=CELER_MAPPING.get_required_source_columns(),
+                       category_columns=["Aseguradora"])
+
+        pd.testing.assert_frame_equal(
+            read_xlsx(sample_xlsx, engine="calamine", **options),
+            read_xlsx(sample_xlsx, engine="openpyxl", **options)
+        )
+
+    @pytest.mark.parametrize("engine", available_xlsx_engines())
+    def test_date_cells(self, date_cells_xlsx, engine):
+        """Test date cells are datetimes, and serials below 1 times of day, with every engine"""
+        df = read_xlsx(date_cells_xlsx, engine=engine)
+
+        assert df["F_Inicio"].tolist()[:2] == [pd.Timestamp("2024-09-20"), pd.Timestamp("2024-11-07")]
+        assert pd.isna(df["F_Inicio"][2])
+        # Serial -18820 (openpyxl: 1848-06-20) has no valid date in Excel
+        assert df["FECHA DE NACIMIENTO"].tolist()[:3] == [time(0, 0), datetime(2023, 3, 15), time(12, 0)]
+        assert pd.isna(df["FECHA DE NACIMIENTO"][3])
+
+    @pytest.mark.skipif(not CALAMINE_AVAILABLE, reason="python-calamine not installed")
+    def test_engines_agree_on_date_cells(self, date_cells_xlsx):
+        pd.testing.assert_frame_equal(
+            read_xlsx(date_cells_xlsx, engine="calamine"),
+            read_xlsx(date_cells_xlsx, engine="openpyxl")
+        )
+
+    @pytest.mark.skipif(not CALAMINE_AVAILABLE or not PYARROW_AVAILABLE,
+                        reason="python-calamine or pyarrow not installed")
+    def test_cache_is_kept_per_engine(self, sample_xlsx, tmp_path, monkeypatch):
+        """Test a frame parsed by one engine is never served for the other"""
+        cache = ParseCache(cache_dir=tmp_path / "cache", max_bytes=10 * 1024 * 1024, enabled=True)
+        monkeypatch.setattr(transformer, "get_parse_cache", lambda: cache)
+        engines = []
+        def spy(*args, **kwargs):
+            engines.append(kwargs["engine"])
+            return read_xlsx(*args, **kwargs)
+        monkeypatch.setattr(transformer, "read_xlsx", spy)
+
+        for engine in ["openpyxl", "calamine", "openpyxl", "calamine"]:
+            transformer.read_celer_xlsx(sample_xlsx, engine=engine)
+
+        assert engines == ["openpyxl", "calamine"]
+
+    @pytest.mark.skipif(not CALAMINE_AVAILABLE or not REAL_CELER_XLSX.exists(),
+                        reason="python-calamine or Celer export not available")
+    def test_engines_agree_on_real_export(self):
+        pd.testing.assert_frame_equal(
+            transformer.read_celer_xlsx(REAL_CELER_XLSX, use_cache=False, engine="calamine"),
+            transformer.read_celer_xlsx(REAL_CELER_XLSX, use_cache=False, engine="openpyxl")
+        )
+
+
+class TestXlsbEngines:
+    """Test suite for reading binary (.xlsb) workbooks"""
+
+    def test_file_format_from_extension(self):
+        assert excel_file_format("CarteraPendiente.XLSB") == "xlsb"
+        assert excel_file_format("CarteraPendiente.xlsx") == "xlsx"
+
+    def test_auto_never_picks_openpyxl(self, monkeypatch):
+        monkeypatch.setattr(xlsx_reader, "_calamine_available", lambda: False)
+
+        assert select_xlsx_engine(file_format="xlsb") == "pyxlsb"
+        with pytest.raises(ValueError, match="Unknown XLSB engine 'openpyxl'"):
+            select_xlsx_engine("openpyxl", file_format="xlsb")
+
+    def test_no_engine_installed(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(xlsx_reader, "_calamine_available", lambda: False)
+        monkeypatch.setattr(xlsx_reader, "_pyxlsb_available", lambda: False)
+
+        with pytest.raises(ValueError, match=r"No engine installed for \.xlsb files"):
+            select_xlsx_engine(file_format="xlsb")
+        xlsb_file = tmp_path / "CarteraPendiente.xlsb"
+        xlsb_file.write_bytes(b"")
+        with pytest.raises(FileProcessingError, match="No engine installed"):
+            transformer.read_celer_xlsx(xlsb_file, use_cache=False)
+
+    @pytest.mark.skipif(REAL_XLSB is None or "pyxlsb" not in available_xlsx_engines("xlsb"),
+                        reason="pyxlsb or .xlsb report not available")
+    def test_reads_xlsb_without_calamine(self, monkeypatch):
+        monkeypatch.setattr(xlsx_reader, "_calamine_available", lambda: False)
+
+        df = read_xlsx(REAL_XLSB, file_format="xlsb")
+
+        assert len(df) > 0
+        if "calamine" in available_xlsx_engines("xlsb"):
+            assert df.shape == read_xlsx(REAL_XLSB, engine="calamine", file_format="xlsb").shape
@@ -0,0 +1,138 @@
+"""
+Unit tests for the XML parser backends.
+"""
+
+import io
+
+import pandas as pd
+import pytest
+
+import adapters.xml_backends as xml_backends
+from adapters.xml_backends import (
+    BACKENDS,
+    available_backends,
+    create_backend,
+    probe_well_formed,
+    select_backend,
+)
+from adapters.xml_reader import ExcelXMLReader, READER_MODES, iter_celer_xml, read_celer_xml
+
+
+def build_document(row_count, bad_row=None):
+    """Two-column SpreadsheetML document; bad_row holds a character XML forbids"""
+    rows = ['<Row><Cell><Data ss:Type="String">Numero</Data></Cell>'
+            '<Cell><Data ss:Type="String">Texto</Data></Cell></Row>']
+    for i in range(row_count):
+        text = f"fila {i}\x01" if i == bad_row else f"fila {i}"
+        rows.append(
+            f'<Row><Cell><Data ss:Type="Number">{i}</Data></Cell>'
+            f'<Cell><Data ss:Type="String">{text}</Data></Cell></Row>'
+        )
+    return (
+        '<?xml version="1.0"?>\n'
+        '<Workbook xmlns="urn:schemas-microsoft-com:office:spreadsheet" '
+        'xmlns:ss="urn:schemas-microsoft-com:office:spreadsheet">'
+        f'<Worksheet ss:Name="Informe"><Table>{"".join(rows)}</Table></Worksheet></Workbook>'
+    )
+
+
+@pytest.fixture
+def clean_xml(tmp_path):
+    path = tmp_path / "limpio.xml"
+    path.write_text(build_document(50), encoding="utf-8")
+    return path
+
+
+def lxml_missing():
+    return "lxml-iterparse" not in available_backends()
+
+
+class TestParserBackends:
+    """Test suite for the parser backends"""
+
+    @pytest.mark.parametrize("name", list(BACKENDS))
+    def test_backends_agree(self, clean_xml, name):
+        """Test every installed backend decodes the same rows"""
+        if name not in available_backends():
+            pytest.skip(f"{name} not installed")
+
+        expected = read_celer_xml(clean_xml, header_row=0, backend="etree-tree")
+        result = read_celer_xml(clean_xml, header_row=0, backend=name)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_capabilities(self):
+        """Test backends declare recovery and streaming"""
+        assert BACKENDS["lxml-iterparse"].recovers and BACKENDS["lxml-iterparse"].streams
+        assert BACKENDS["lxml-tree"].recovers and not BACKENDS["lxml-tree"].streams
+        assert BACKENDS["expat"].streams and not BACKENDS["expat"].recovers
+        assert BACKENDS["etree-iterparse"].streams and not BACKENDS["etree-iterparse"].recovers
+
+    def test_strict_backend_cannot_recover(self):
+        with pytest.raises(ValueError, match="cannot recover"):
+            create_backend("expat", recover=True)
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown parser backend"):
+            ExcelXMLReader(backend="sax2")
+
+    def test_tree_backend_rejected_in_streaming_mode(self):
+        with pytest.raises(ValueError, match="does not stream"):
+            ExcelXMLReader(mode="streaming", backend="etree-tree")
+
+
+class TestBackendSelection:
+    """Test suite for automatic backend selection"""
+
+    def test_probe(self):
+        assert probe_well_formed(io.BytesIO(build_document(5).encode("utf-8")))
+        assert not probe_well_formed(io.BytesIO(build_document(5, bad_row=2).encode("utf-8")))
+
+    def test_clean_file_uses_strict_streaming_backend(self):
+        document = build_document(5).encode("utf-8")
+
+        backend = select_backend(lambda: io.BytesIO(document))
+
+        assert backend.streams
+        assert not backend.recover
+
+    @pytest.mark.skipif(lxml_missing(), reason="lxml not installed")
+    def test_malformed_file_uses_recover_mode(self):
+        document = build_document(5, bad_row=2).encode("utf-8")
+
+        assert select_backend(lambda: io.BytesIO(document)).recover
+        assert select_backend(lambda: io.BytesIO(document), streaming=False).name == "lxml-tree"
+
+    @pytest.mark.skipif(lxml_missing(), reason="lxml not installed")
+    @pytest.mark.parametrize("mode", READER_MODES)
+    def test_resumes_in_recover_mode_past_the_probe(self, tmp_path, monkeypatch, mode):
+        """Test a strict parse failing after the probed head resumes in recover mode"""
+        monkeypatch.setattr(xml_backends, "PROBE_BYTES", 1024)
+        monkeypatch.setattr("adapters.xml_reader._PARALLEL_MIN_BLOCK_ROWS", 100)
+        path = tmp_path / "cortado.xml"
+        path.write_text(build_document(1000, bad_row=700), encoding="utf-8")
+
+        expected = read_celer_xml(path, header_row=0, mode="streaming", backend="lxml-iterparse")
+        result = read_celer_xml(path, header_row=0, mode=mode, workers=2)
+
+        assert len(result) == 1000
+        assert result["Texto"][700] == "fila 700"
+        pd.testing.assert_frame_equal(result, expected)
+
+    @pytest.mark.skipif(lxml_missing(), reason="lxml not installed")
+    def test_resumes_in_recover_mode_in_chunks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(xml_backends, "PROBE_BYTES", 1024)
+        path = tmp_path / "cortado.xml"
+        path.write_text(build_document(1000, bad_row=700), encoding="utf-8")
+
+        expected = read_celer_xml(path, header_row=0, mode="streaming", backend="lxml-iterparse")
+        result = pd.concat(iter_celer_xml(path, 300, header_row=0))
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_explicit_strict_backend_reports_malformed_file(self, tmp_path):
+        path = tmp_path / "cortado.xml"
+        path.write_text(build_document(10, bad_row=5), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Failed to parse XML file"):
+            read_celer_xml(path, header_row=0, mode="streaming", backend="etree-iterparse")
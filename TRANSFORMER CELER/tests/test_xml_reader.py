@@ -0,0 +1,451 @@
+"""
+Unit tests for the Excel 2003 XML (SpreadsheetML) reader adapter.
+"""
+
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import adapters.xml_reader as xml_reader
+from adapters.xml_reader import (
+    ExcelXMLReader,
+    ExcelXMLWorkbook,
+    READER_MODES,
+    iter_celer_xml,
+    read_celer_xml,
+)
+
+
+REAL_CELER_XML = Path(__file__).parent.parent.parent / "DATA CELER" / "CarteraPendiente.xml"
+
+SAMPLE_XML = """<?xml version="1.0"?>
+<?mso-application progid="Excel.Sheet"?>
+<Workbook xmlns="urn:schemas-microsoft-com:office:spreadsheet"
+ xmlns:o="urn:schemas-microsoft-com:office:office"
+ xmlns:x="urn:schemas-microsoft-com:office:excel"
+ xmlns:ss="urn:schemas-microsoft-com:office:spreadsheet"
+ xmlns:html="http://www.w3.org/TR/REC-html40">
+ <Worksheet ss:Name="Informe">
+  <Table>
+<Row><Cell><Data ss:Type="String">INFORME DE CARTERA PENDIENTE</Data></Cell></Row>
+<Row><Cell><Data ss:Type="String">Filtros</Data></Cell></Row>
+<Row>
+    <Cell ss:Index="1"><Data ss:Type="String">Poliza</Data></Cell>
+    <Cell ss:Index="2"><Data ss:Type="String">Tomador</Data></Cell>
+    <Cell ss:Index="3"><Data ss:Type="String">Saldo</Data></Cell>
+    <Cell ss:Index="4"><Data ss:Type="String">Días</Data></Cell>
+</Row>
+<Row>
+    <Cell ss:Index="1"><Data ss:Type="String">023537654</Data></Cell>
+    <Cell ss:Index="2"><Data ss:Type="String">CONSTRUCCIONES B & Z S.A.S.</Data></Cell>
+    <Cell ss:Index="3"><Data ss:Type="Number">-244611.000000</Data></Cell>
+    <Cell ss:Index="4"><Data ss:Type="Number">494</Data></Cell>
+</Row>
+<Row>
+    <Cell ss:Index="1"><Data ss:Type="String">5090960</Data></Cell>
+    <Cell ss:Index="3"><Data ss:Type="Number">0</Data></Cell>
+    <Cell ss:Index="4"><Data ss:Type="Number">12</Data></Cell>
+</Row>
+<Row>
+    <Cell ss:Index="1"><Data ss:Type="String">5090961</Data></Cell>
+    <Cell ss:Index="2"><Data ss:Type="String">MARÍA  JOSÉ
+ MUÑOZ &amp; CÍA</Data></Cell>
+    <Cell ss:Index="3"><Data ss:Type="Number">1500.5</Data></Cell>
+    <Cell ss:Index="4"><Data ss:Type="String"></Data></Cell>
+</Row>
+  </Table>
+ </Worksheet>
+ <Worksheet ss:Name="Otra">
+  <Table>
+<Row><Cell><Data ss:Type="String">NO SE DEBE LEER</Data></Cell></Row>
+  </Table>
+ </Worksheet>
+</Workbook>
+"""
+
+
+def build_spreadsheet(rows):
+    """Build a single-sheet SpreadsheetML document from (type, text) cell rows"""
+    xml_rows = []
+    for row in rows:
+        cells = "".join(
+            f'<Cell><Data ss:Type="{data_type}">{text}</Data></Cell>' if data_type else "<Cell/>"
+            for data_type, text in row
+        )
+        xml_rows.append(f"<Row>{cells}</Row>")
+    return (
+        '<?xml version="1.0"?>\n'
+        '<Workbook xmlns="urn:schemas-microsoft-com:office:spreadsheet" '
+        'xmlns:ss="urn:schemas-microsoft-com:office:spreadsheet">'
+        f'<Worksheet ss:Name="Informe"><Table>{"".join(xml_rows)}</Table></Worksheet></Workbook>'
+    )
+
+
+@pytest.fixture
+def sample_xml(tmp_path):
+    """Write a small Celer-shaped SpreadsheetML file"""
+    path = tmp_path / "CarteraPendiente.xml"
+    path.write_text(SAMPLE_XML, encoding="utf-8")
+    return path
+
+
+class TestExcelXMLReader:
+    """Test suite for ExcelXMLReader"""
+    
+    @pytest.mark.parametrize("mode", READER_MODES)
+    def test_reads_sample(self, sample_xml, mode):
+        """Test headers, sparse cells, entities and whitespace handling"""
+        df = read_celer_xml(sample_xml, header_row=2, mode=mode)
+        
+        assert list(df.columns) == ["Poliza", "Tomador", "Saldo", "Días"]
+        assert len(df) == 3
+        assert df["Poliza"][0] == "023537654"
+        assert df["Tomador"][0] == "CONSTRUCCIONES B & Z S.A.S."
+        assert df["Tomador"][1] is None
+        assert df["Tomador"][2] == "MARÍA JOSÉ MUÑOZ & CÍA"
+        assert df["Saldo"][0] == -244611.0
+        assert df["Días"][1] == 12
+    
+    def test_streaming_matches_tree(self, sample_xml):
+        """Test streaming mode builds exactly the same DataFrame as tree mode"""
+        tree_df = read_celer_xml(sample_xml, header_row=2, mode="tree")
+        streaming_df = read_celer_xml(sample_xml, header_row=2, mode="streaming")
+        
+        pd.testing.assert_frame_equal(streaming_df, tree_df)
+    
+    @pytest.mark.skipif(not REAL_CELER_XML.exists(), reason="Celer export not available")
+    def test_streaming_matches_tree_on_real_export(self):
+        """Test both modes agree on the real Celer export"""
+        tree_df = read_celer_xml(REAL_CELER_XML, mode="tree")
+        streaming_df = read_celer_xml(REAL_CELER_XML, mode="streaming")
+        
+        pd.testing.assert_frame_equal(streaming_df, tree_df)
+    
+    @pytest.mark.parametrize("mode", READER_MODES)
+    def test_missing_header_row(self, sample_xml, mode):
+        """Test a header row beyond the table is reported"""
+        with pytest.raises(ValueError) as exc_info:
+            read_celer_xml(sample_xml, header_row=50, mode=mode)
+        
+        assert "No header row found" in str(exc_info.value)
+    
+    @pytest.mark.parametrize("mode", READER_MODES)
+    def test_missing_worksheet(self, tmp_path, mode):
+        """Test a workbook without worksheets is rejected"""
+        path = tmp_path / "empty.xml"
+        path.write_text(
+            '<Workbook xmlns="urn:schemas-microsoft-com:office:spreadsheet"></Workbook>',
+            encoding="utf-8"
+        )
+        
+        with pytest.raises(ValueError) as exc_info:
+            read_celer_xml(path, mode=mode)
+        
+        assert "No Worksheet found" in str(exc_info.value)
+    
+    def test_iter_chunks_concatenate_to_full_frame(self, sample_xml):
+        """Test chunks share headers, continue the index and add up to the full read"""
+        full_df = read_celer_xml(sample_xml, header_row=2)
+        chunks = list(iter_celer_xml(sample_xml, chunk_rows=2, header_row=2))
+        
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert all(list(chunk.columns) == list(full_df.columns) for chunk in chunks)
+        assert list(chunks[1].index) == [2]
+        # Dtypes are inferred per chunk, so compare values with nulls unified
+        chunked_df = pd.concat(chunks)
+        assert chunked_df.astype(object).where(chunked_df.notna(), None).equals(
+            full_df.astype(object).where(full_df.notna(), None)
+        )
+    
+    def test_iter_chunks_without_data_rows(self, sample_xml):
+        """Test an export with only headers still yields its columns"""
+        chunks = list(iter_celer_xml(sample_xml, chunk_rows=2, header_row=5))
+        
+        assert len(chunks) == 1
+        assert chunks[0].empty
+        assert chunks[0].columns[0] == "5090961"
+    
+    def test_iter_chunks_rejects_invalid_size(self, sample_xml):
+        """Test chunk_rows must be positive"""
+        with pytest.raises(ValueError):
+            list(iter_celer_xml(sample_xml, chunk_rows=0))
+    
+    @pytest.mark.parametrize("mode", READER_MODES)
+    def test_typed_columns(self, tmp_path, mode):
+        """Test ss:Type drives the column dtypes"""
+        path = tmp_path / "typed.xml"
+        path.write_text(build_spreadsheet([
+            [("String", "Entero"), ("String", "Decimal"), ("String", "Fecha"),
+             ("String", "Texto"), ("String", "Mixto"), ("String", "Vacio")],
+            [("Number", "1"), ("Number", "1.5"), ("DateTime", "2025-12-11T00:00:00.000"),
+             ("String", "A"), ("Number", "7"), (None, None)],
+            [("Number", "2"), ("Number", "3"), ("DateTime", "2026-01-27T14:03:02.000"),
+             ("String", "B"), ("String", "siete"), (None, None)],
+            [("Number", "3"), (None, None), (None, None),
+             (None, None), ("Number", "7.5"), (None, None)],
+        ]), encoding="utf-8")
+        
+        df = read_celer_xml(path, header_row=0, mode=mode)
+        
+        assert df["Entero"].dtype == "int64"
+        assert df["Decimal"].dtype == "float64"
+        assert pd.isna(df["Decimal"][2])
+        assert df["Fecha"].dtype == "datetime64[ns]"
+        assert df["Fecha"][0] == pd.Timestamp("2025-12-11")
+        assert pd.isna(df["Fecha"][2])
+        assert df["Texto"].tolist() == ["A", "B", None]
+        assert df["Mixto"].tolist() == [7, "siete", 7.5]
+        assert df["Vacio"].dtype == object
+        assert df["Vacio"].isna().all()
+    
+    @pytest.mark.parametrize("mode", READER_MODES)
+    def test_usecols_projects_columns(self, sample_xml, mode):
+        """Test usecols keeps only the requested columns, in file order"""
+        full_df = read_celer_xml(sample_xml, header_row=2, mode=mode)
+        df = read_celer_xml(
+            sample_xml, header_row=2, mode=mode, usecols=["Saldo", "Poliza", "No existe"]
+        )
+        
+        assert list(df.columns) == ["Poliza", "Saldo"]
+        pd.testing.assert_frame_equal(df, full_df[["Poliza", "Saldo"]])
+    
+    def test_usecols_in_chunks(self, sample_xml):
+        """Test usecols also applies to every chunk"""
+        chunks = list(iter_celer_xml(sample_xml, chunk_rows=2, header_row=2, usecols=["Tomador"]))
+        
+        assert [list(chunk.columns) for chunk in chunks] == [["Tomador"], ["Tomador"]]
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+    
+    @pytest.mark.parametrize("batch", [1, 2, 3, 8192])
+    def test_datetime_batches(self, tmp_path, monkeypatch, batch):
+        """Test DateTime cells converted in batches match the per-cell parse"""
+        monkeypatch.setattr(xml_reader, "_DATETIME_BATCH", batch)
+        path = tmp_path / "fechas.xml"
+        path.write_text(build_spreadsheet([
+            [("String", "Fecha"), ("String", "Sin fraccion"), ("String", "Mixto")],
+            [("DateTime", "2025-12-11T00:00:00.000"), ("DateTime", "2025-12-11T08:30:00"),
+             ("DateTime", "2025-12-11T00:00:00.000")],
+            [(None, None), (None, None), ("DateTime", "no es fecha")],
+            [("DateTime", "2026-01-27T14:03:02.250"), ("DateTime", "2026-01-27T14:03:02.000"),
+             ("DateTime", "2026-01-27T14:03:02.000")],
+        ]), encoding="utf-8")
+
+        df = read_celer_xml(path, header_row=0, mode="streaming")
+
+        assert df["Fecha"].tolist()[::2] == [pd.Timestamp("2025-12-11"), pd.Timestamp("2026-01-27 14:03:02.250")]
+        assert pd.isna(df["Fecha"][1])
+        assert df["Sin fraccion"].dtype == "datetime64[ns]"
+        assert df["Sin fraccion"][0] == pd.Timestamp("2025-12-11 08:30")
+        assert df["Mixto"].tolist() == [
+            pd.Timestamp("2025-12-11"), "no es fecha", pd.Timestamp("2026-01-27 14:03:02")
+        ]
+
+    @pytest.mark.parametrize("mode", READER_MODES)
+    def test_datetime_out_of_range(self, tmp_path, monkeypatch, mode):
+        """Test dates outside datetime64[ns] (e.g. 9999-12-31 "no expiry") are kept as datetimes"""
+        monkeypatch.setattr(xml_reader, "_PARALLEL_MIN_BLOCK_ROWS", 1)
+        path = tmp_path / "fechas.xml"
+        path.write_text(build_spreadsheet([
+            [("String", "Vence"), ("String", "Antigua")],
+            [("DateTime", "2025-12-11T00:00:00.000"), ("DateTime", "1600-01-01T00:00:00.000")],
+            [("DateTime", "9999-12-31T00:00:00.000"), (None, None)],
+            [(None, None), ("DateTime", "2026-01-27T00:00:00.000")],
+        ]), encoding="utf-8")
+
+        df = read_celer_xml(path, header_row=0, mode=mode, workers=2)
+
+        assert df["Vence"].dtype == object
+        assert df["Vence"].tolist()[:2] == [datetime(2025, 12, 11), datetime(9999, 12, 31)]
+        assert pd.isna(df["Vence"][2])
+        assert df["Antigua"].tolist()[::2] == [datetime(1600, 1, 1), datetime(2026, 1, 27)]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_parallel_blocks_match_tree(self, tmp_path, monkeypatch, workers):
+        """Test row ranges with different column types concatenate like a single pass"""
+        monkeypatch.setattr(xml_reader, "_PARALLEL_MIN_BLOCK_ROWS", 1)
+        path = tmp_path / "blocks.xml"
+        path.write_text(build_spreadsheet([
+            [("String", "Entero"), ("String", "Fecha"), ("String", "Mixto"), ("String", "Vacio")],
+            [("Number", "1"), ("DateTime", "2025-12-11T00:00:00.000"), ("Number", "7"), (None, None)],
+            [("Number", "2"), (None, None), ("Number", "7.5"), (None, None)],
+            [(None, None), ("DateTime", "2026-01-27T14:03:02.000"), ("String", "siete"), (None, None)],
+            [("Number", "4"), ("String", "sin fecha"), (None, None), ("Number", "1")],
+        ]), encoding="utf-8")
+        
+        tree_df = read_celer_xml(path, header_row=0, mode="tree")
+        parallel_df = read_celer_xml(path, header_row=0, mode="parallel", workers=workers)
+        
+        pd.testing.assert_frame_equal(parallel_df, tree_df)
+    
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_parallel_repairs_mapped_ranges(self, tmp_path, monkeypatch, workers):
+        """Test ranges read from the mapped file are repaired like the stream"""
+        monkeypatch.setattr(xml_reader, "_PARALLEL_MIN_BLOCK_ROWS", 1)
+        rows = [[("String", "Tomador"), ("String", "Saldo")]]
+        rows += [[("String", f"B & Z {i}"), ("Number", str(i))] for i in range(6)]
+        path = tmp_path / "raw.xml"
+        path.write_bytes(
+            build_spreadsheet(rows).replace("\n", "\r\n").encode("utf-8").replace(b"B & Z 3", b"B & Z \xff3")
+        )
+
+        streaming_df = read_celer_xml(path, header_row=0, mode="streaming")
+        parallel_df = read_celer_xml(path, header_row=0, mode="parallel", workers=workers)
+
+        assert parallel_df["Tomador"][3] == "B & Z �3"
+        pd.testing.assert_frame_equal(parallel_df, streaming_df)
+
+    @pytest.mark.skipif(not REAL_CELER_XML.exists(), reason="Celer export not available")
+    def test_parallel_matches_tree_on_real_export(self, monkeypatch):
+        """Test parallel mode split in many blocks agrees on the real Celer export"""
+        monkeypatch.setattr(xml_reader, "_PARALLEL_MIN_BLOCK_ROWS", 50)
+        tree_df = read_celer_xml(REAL_CELER_XML, mode="tree")
+        parallel_df = read_celer_xml(REAL_CELER_XML, mode="parallel", workers=2)
+        
+        pd.testing.assert_frame_equal(parallel_df, tree_df)
+    
+    @pytest.mark.parametrize("chunk_bytes", [1, 3, 7, 64, 1024 * 1024])
+    def test_entity_repair_across_chunk_boundaries(self, tmp_path, chunk_bytes):
+        """Test the repair stream fixes bare '&' wherever steps split the file"""
+        path = tmp_path / "entities.xml"
+        path.write_bytes(
+            '<Row><Data ss:Type="String">B & Z</Data><Data>&amp; &lt; ó</Data></Row>\r\n'
+            '<Cell ss:Formula="a&amp;b"><Data ss:Type="String">&&amp;amp;</Data></Cell>'
+            '<Other>& fuera</Other><Data>sin cierre &'.encode("utf-8")
+        )
+        
+        with xml_reader._RepairedXMLStream(path, chunk_bytes=chunk_bytes) as source:
+            repaired = source.read()
+        
+        assert repaired.decode("utf-8") == (
+            '<Row><Data ss:Type="String">B &amp; Z</Data><Data>&amp; &amp;lt; ó</Data></Row>\r\n'
+            '<Cell ss:Formula="a&amp;b"><Data ss:Type="String">&amp;&amp;amp;</Data></Cell>'
+            '<Other>& fuera</Other><Data>sin cierre &'
+        )
+    
+    @pytest.mark.parametrize("chunk_bytes", [1, 5, 64, 1024 * 1024])
+    def test_repair_stream_over_a_region(self, tmp_path, chunk_bytes):
+        """Test a file region is read between its prefix and suffix, invalid UTF-8 replaced"""
+        path = tmp_path / "region.xml"
+        body = '<Row><Data>ó & ñ</Data></Row>'.encode("utf-8") + b'<Row><Data>\xff &amp;</Data></Row>'
+        path.write_bytes(b"<skipped/>" + body + b"<skipped/>")
+        
+        with xml_reader._RepairedXMLStream(
+            path, b"<Table>", 10, 10 + len(body), b"</Table>", chunk_bytes=chunk_bytes
+        ) as source:
+            # Small reads, like a parser filling its buffer
+            repaired = b"".join(iter(partial(source.read, 3), b""))
+        
+        assert repaired.decode("utf-8") == (
+            '<Table><Row><Data>ó &amp; ñ</Data></Row><Row><Data>\ufffd &amp;</Data></Row></Table>'
+        )
+    
+    def test_repair_stream_over_empty_file(self, tmp_path):
+        """Test an empty file gives an empty stream"""
+        path = tmp_path / "empty.xml"
+        path.write_bytes(b"")
+        
+        with xml_reader._RepairedXMLStream(path) as source:
+            assert source.read() == b""
+    
+    @pytest.mark.parametrize("mode", READER_MODES)
+    def test_category_columns(self, sample_xml, mode, monkeypatch):
+        """Test category_columns dictionary-encodes the values without changing them"""
+        monkeypatch.setattr(xml_reader, "_PARALLEL_MIN_BLOCK_ROWS", 1)
+        full_df = read_celer_xml(sample_xml, header_row=2, mode=mode)
+        df = read_celer_xml(
+            sample_xml, header_row=2, mode=mode, workers=2, category_columns=["Poliza", "Tomador"]
+        )
+        
+        expected = full_df.astype({"Poliza": "category", "Tomador": "category"})
+        pd.testing.assert_frame_equal(df, expected)
+    
+    def test_category_columns_in_chunks(self, sample_xml):
+        """Test every chunk carries its own categories"""
+        chunks = list(iter_celer_xml(sample_xml, chunk_rows=2, header_row=2, category_columns=["Tomador"]))
+        
+        assert list(chunks[0]["Tomador"].cat.categories) == ["CONSTRUCCIONES B & Z S.A.S."]
+        assert list(chunks[1]["Tomador"]) == ["MARÍA JOSÉ MUÑOZ & CÍA"]
+    
+    def test_row_wider_than_headers(self, tmp_path):
+        """Test rows with more cells than headers are rejected"""
+        path = tmp_path / "wide.xml"
+        path.write_text(build_spreadsheet([
+            [("String", "Poliza")],
+            [("String", "1"), ("String", "2")],
+        ]), encoding="utf-8")
+        
+        with pytest.raises(ValueError):
+            read_celer_xml(path, header_row=0)
+    
+    def test_unknown_mode(self):
+        """Test an unknown reader mode is rejected"""
+        with pytest.raises(ValueError):
+            ExcelXMLReader(mode="dom")
+    
+    def test_invalid_workers(self):
+        """Test the worker count must be positive"""
+        with pytest.raises(ValueError):
+            ExcelXMLReader(mode="parallel", workers=0)
+
+
+class TestExcelXMLWorkbook:
+    """Test suite for ExcelXMLWorkbook"""
+    
+    def test_indexes_worksheets(self, sample_xml):
+        workbook = ExcelXMLWorkbook(sample_xml)
+        
+        assert workbook.sheet_names == ["Informe", "Otra"]
+        assert "Otra" in workbook
+        assert workbook.worksheets[0].end <= workbook.worksheets[1].start
+    
+    @pytest.mark.parametrize("mode", READER_MODES)
+    def test_sheet_by_name_or_position(self, sample_xml, mode):
+        """Test each worksheet is parsed on its own"""
+        workbook = ExcelXMLWorkbook(sample_xml, mode=mode, workers=1)
+        
+        first = workbook.sheet(0, header_row=2)
+        other = workbook.sheet("Otra", header_row=0)
+        
+        pd.testing.assert_frame_equal(first, read_celer_xml(sample_xml, header_row=2))
+        assert list(other.columns) == ["NO SE DEBE LEER"]
+        assert other.empty
+    
+    def test_sheet_parses_only_its_bytes(self, tmp_path):
+        """Test a malformed sheet does not prevent reading another one"""
+        path = tmp_path / "sucursales.xml"
+        path.write_text(
+            '<?xml version="1.0"?>\n'
+            '<Workbook xmlns="urn:schemas-microsoft-com:office:spreadsheet" '
+            'xmlns:ss="urn:schemas-microsoft-com:office:spreadsheet">'
+            '<Worksheet ss:Name="Rota"><Table><Row><Cell></Row></Table></Worksheet>'
+            '<Worksheet ss:Name="Sucursal A &amp; B"><Table>'
+            '<Row><Cell><Data ss:Type="String">Poliza</Data></Cell></Row>'
+            '<Row><Cell><Data ss:Type="String">023537654</Data></Cell></Row>'
+            '</Table></Worksheet></Workbook>',
+            encoding="utf-8"
+        )
+        workbook = ExcelXMLWorkbook(path, backend="etree-iterparse")
+        
+        df = workbook.sheet("Sucursal A & B", header_row=0)
+        
+        assert df["Poliza"].tolist() == ["023537654"]
+        with pytest.raises(ValueError):
+            workbook.sheet("Rota", header_row=0)
+    
+    def test_unknown_sheet(self, sample_xml):
+        workbook = ExcelXMLWorkbook(sample_xml)
+        
+        with pytest.raises(ValueError, match="not found"):
+            workbook.sheet("Sucursal")
+        with pytest.raises(ValueError, match="not found"):
+            workbook.sheet(2)
+    
+    def test_not_a_workbook(self, tmp_path):
+        path = tmp_path / "vacio.xml"
+        path.write_text("<root/>", encoding="utf-8")
+        
+        with pytest.raises(ValueError, match="no Workbook"):
+            ExcelXMLWorkbook(path)
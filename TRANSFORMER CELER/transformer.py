@@ -15,10 +15,13 @@ Usage:
 """
 
 import logging
+import os
+import pickle
 import sys
+import tempfile
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Iterable, Iterator, List, Optional
 
 import pandas as pd
 
@@ -31,7 +34,13 @@ except ImportError:
     pass
 
 from schemas.celer_mapping import CELER_MAPPING, OutputColumn
+from adapters.header_sniffer import sniff_headers
+from adapters.parse_cache import get_parse_cache
+from adapters.progress import ProgressCallback, ProgressFile, ProgressReporter, progress_stage
+from adapters.xlsx_reader import READER_VERSION as XLSX_READER_VERSION
+from adapters.xlsx_reader import excel_file_format, read_xlsx, select_xlsx_engine
 from services.column_transformer import ColumnTransformer
+from services.delta_detector import CelerDelta, DeltaDetector
 from domain.exceptions import (
     MissingColumnsError,
     TransformationError,
@@ -67,12 +76,83 @@ def setup_directories_legacy() -> None:
         logger.debug(f"Ensured directory exists: {dir_path}")
 
 
-def read_celer_xlsx(file_path: Path) -> pd.DataFrame:
+def check_source_headers(file_path: Path, program: str) -> None:
+    """
+    Check the header row of the input before the whole file is parsed.
+    
+    Only the rows up to the header are read, so a file that is not a Celer
+    export is rejected in milliseconds whatever its size.
+    
+    Args:
+        file_path: Path to Celer export (.xlsx, .xlsb or .xml)
+        program: Log prefix (e.g. "PROGRAM 1 - XLSX")
+        
+    Raises:
+        MissingColumnsError: If required source columns are missing
+        FileProcessingError: If the header row cannot be read
+    """
+    try:
+        headers = sniff_headers(file_path, CELER_MAPPING.header_row)
+    except FileNotFoundError:
+        error_msg = f"[{program}] File not found: {file_path}"
+        logger.error(error_msg)
+        raise FileProcessingError(error_msg)
+    except Exception as e:
+        error_msg = f"[{program}] Error reading file: {str(e)}"
+        logger.error(error_msg)
+        raise FileProcessingError(error_msg)
+    
+    is_valid, missing = CELER_MAPPING.validate_source_columns(set(headers))
+    if not is_valid:
+        logger.error(f"[{program}] Input is not a Celer export, missing columns: {missing}")
+        raise MissingColumnsError(missing)
+    
+    logger.info(f"[{program}] Header row checked: all required columns present")
+
+
+def parse_date_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the text date columns of a Celer export to datetime64.
+    
+    Each column is converted with one vectorized call using its fixed
+    format (CELER_MAPPING.date_columns); values that do not match become NaT.
+    Columns already read as datetimes are left as they are, and numeric
+    columns (date cells of .xlsb files read by pyxlsb) are Excel serials.
+    
+    Args:
+        df: DataFrame from Celer export
+        
+    Returns:
+        The same DataFrame, with typed date columns
+    """
+    for column, date_format in CELER_MAPPING.date_columns.items():
+        if column not in df.columns or pd.api.types.is_datetime64_any_dtype(df[column]):
+            continue
+        if pd.api.types.is_numeric_dtype(df[column]):
+            df[column] = pd.to_datetime(df[column], unit='D', origin='1899-12-30', errors='coerce')
+        else:
+            df[column] = pd.to_datetime(df[column], format=date_format, errors='coerce')
+    return df
+
+
+def read_celer_xlsx(
+    file_path: Path,
+    use_cache: bool = True,
+    progress: Optional[ProgressCallback] = None,
+    engine: str = 'auto'
+) -> pd.DataFrame:
     """
     PROGRAM 1: Read Celer XLSX format.
     
+    Only the columns used by the mapping are read. The Excel engine is
+    calamine when python-calamine is installed, openpyxl otherwise, or
+    pyxlsb for .xlsb workbooks (see adapters.xlsx_reader).
+    
     Args:
         file_path: Path to Celer XLSX file
+        use_cache: Reuse a previous parse of the same content (default: True)
+        progress: Progress callback (done, total) in bytes of the file read (optional)
+        engine: Excel engine name, or 'auto' for the fastest installed one
         
     Returns:
         DataFrame with Celer data
@@ -82,9 +162,40 @@ def read_celer_xlsx(file_path: Path) -> pd.DataFrame:
     """
     try:
         logger.info(f"[PROGRAM 1 - XLSX] Reading file: {file_path}")
+        reporter = ProgressReporter(progress, Path(file_path).stat().st_size)
+        file_format = excel_file_format(file_path)
+        engine = select_xlsx_engine(engine, file_format)
+        usecols = CELER_MAPPING.get_required_source_columns()
+        
+        def parse() -> pd.DataFrame:
+            logger.info(f"[PROGRAM 1 - XLSX] Parsing with the {engine} engine")
+            # Bytes are counted as the Excel engine reads them from the file
+            with ProgressFile(file_path, reporter) as source:
+                df = read_xlsx(
+                    source,
+                    header_row=CELER_MAPPING.header_row,
+                    usecols=usecols,
+                    category_columns=CELER_MAPPING.categorical_columns,
+                    engine=engine,
+                    file_format=file_format
+                )
+            return parse_date_columns(df)
         
         # Read Excel file starting at row 5 (header_row=4)
-        df = pd.read_excel(file_path, header=CELER_MAPPING.header_row)
+        df = get_parse_cache().get_or_parse(
+            file_path,
+            f'celer_xlsx/{XLSX_READER_VERSION}',
+            parse,
+            options={
+                'engine': engine,
+                'header_row': CELER_MAPPING.header_row,
+                'usecols': usecols,
+                'category_columns': CELER_MAPPING.categorical_columns,
+                'date_columns': CELER_MAPPING.date_columns
+            },
+            use_cache=use_cache
+        )
+        reporter.finish()
         logger.info(f"[PROGRAM 1 - XLSX] Successfully read {len(df)} rows, {len(df.columns)} columns")
         
         return df
@@ -99,12 +210,18 @@ def read_celer_xlsx(file_path: Path) -> pd.DataFrame:
         raise FileProcessingError(error_msg)
 
 
-def read_celer_xml(file_path: Path) -> pd.DataFrame:
+def read_celer_xml(
+    file_path: Path,
+    use_cache: bool = True,
+    progress: Optional[ProgressCallback] = None
+) -> pd.DataFrame:
     """
     PROGRAM 2: Read Celer XML format.
     
     Args:
         file_path: Path to Celer XML file
+        use_cache: Reuse a previous parse of the same content (default: True)
+        progress: Progress callback (done, total) in bytes of the file read (optional)
         
     Returns:
         DataFrame with Celer data
@@ -115,9 +232,34 @@ def read_celer_xml(file_path: Path) -> pd.DataFrame:
     try:
         logger.info(f"[PROGRAM 2 - XML] Reading file: {file_path}")
         
-        # Read Excel XML format
-        from adapters.xml_reader import read_celer_xml as xml_reader
-        df = xml_reader(file_path, header_row=CELER_MAPPING.header_row)
+        # Read Excel XML format (streaming keeps memory flat on large exports).
+        # Only the columns used by the mapping are decoded, repetitive text
+        # columns are dictionary-encoded.
+        from adapters.xml_reader import READER_VERSION, read_celer_xml as xml_reader
+        usecols = CELER_MAPPING.get_required_source_columns()
+        df = get_parse_cache().get_or_parse(
+            file_path,
+            f'celer_xml/{READER_VERSION}',
+            lambda: parse_date_columns(xml_reader(
+                file_path,
+                header_row=CELER_MAPPING.header_row,
+                mode='streaming',
+                usecols=usecols,
+                category_columns=CELER_MAPPING.categorical_columns,
+                progress=progress
+            )),
+            options={
+                'header_row': CELER_MAPPING.header_row,
+                'usecols': usecols,
+                'category_columns': CELER_MAPPING.categorical_columns,
+                'date_columns': CELER_MAPPING.date_columns
+            },
+            use_cache=use_cache
+        )
+        if progress is not None:
+            # A cache hit reads nothing, report the file as done
+            size = Path(file_path).stat().st_size
+            progress(size, size)
         logger.info(f"[PROGRAM 2 - XML] Successfully read {len(df)} rows, {len(df.columns)} columns")
         
         return df
@@ -132,51 +274,287 @@ def read_celer_xml(file_path: Path) -> pd.DataFrame:
         raise FileProcessingError(error_msg)
 
 
-def write_output_file(df: pd.DataFrame, file_path: Path) -> None:
+def iter_celer_xml(
+    file_path: Path,
+    chunk_rows: int,
+    progress: Optional[ProgressCallback] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    PROGRAM 2: Stream Celer XML format in chunks of chunk_rows rows.
+    
+    Args:
+        file_path: Path to Celer XML file
+        chunk_rows: Maximum number of data rows per DataFrame
+        progress: Progress callback (done, total) in bytes of the file read (optional)
+        
+    Yields:
+        DataFrames with Celer data, all with the same headers
+        
+    Raises:
+        FileProcessingError: If file cannot be read
+    """
+    try:
+        logger.info(f"[PROGRAM 2 - XML] Streaming file in chunks of {chunk_rows} rows: {file_path}")
+        
+        from adapters.xml_reader import iter_celer_xml as xml_chunk_reader
+        total_rows = 0
+        for chunk in xml_chunk_reader(
+            file_path,
+            chunk_rows,
+            header_row=CELER_MAPPING.header_row,
+            usecols=CELER_MAPPING.get_required_source_columns(),
+            category_columns=CELER_MAPPING.categorical_columns,
+            progress=progress
+        ):
+            total_rows += len(chunk)
+            yield parse_date_columns(chunk)
+        
+        logger.info(f"[PROGRAM 2 - XML] Successfully streamed {total_rows} rows")
+        
+    except FileNotFoundError:
+        error_msg = f"[PROGRAM 2 - XML] File not found: {file_path}"
+        logger.error(error_msg)
+        raise FileProcessingError(error_msg)
+    except Exception as e:
+        error_msg = f"[PROGRAM 2 - XML] Error reading file: {str(e)}"
+        logger.error(error_msg)
+        raise FileProcessingError(error_msg)
+
+
+def read_celer_delta(
+    file_path: Path,
+    name: Optional[str] = None,
+    use_cache: bool = True,
+    update: bool = True
+) -> CelerDelta:
+    """
+    Read a Celer export (XLSX or XML) and compare it with the previous export.
+    
+    Only the added and changed rows (CelerDelta.delta) need to go through
+    the transformation and the conciliation again.
+    
+    Args:
+        file_path: Path to Celer export
+        name: Portfolio name the fingerprints are stored under (default: file stem)
+        use_cache: Reuse a previous parse of the same content (default: True)
+        update: Store this export's fingerprints for the next run (default: True)
+        
+    Returns:
+        CelerDelta with added, changed and removed rows
+        
+    Raises:
+        FileProcessingError: If file cannot be read
+    """
+    file_path = Path(file_path)
+    if file_path.suffix.lower() == '.xml':
+        source_df = read_celer_xml(file_path, use_cache=use_cache)
+    else:
+        source_df = read_celer_xlsx(file_path, use_cache=use_cache)
+    
+    return DeltaDetector().detect(source_df, name or file_path.stem, update=update)
+
+
+def transform_celer_delta(
+    source_df: pd.DataFrame,
+    name: str,
+    transformer: ColumnTransformer,
+    detector: Optional[DeltaDetector] = None
+) -> pd.DataFrame:
+    """
+    Transform a Celer export, running the column transformer only on the rows that changed.
+    
+    Rows identical to the previous export of the same portfolio are taken
+    from the output stored by the previous run (see DeltaDetector.reuse_output);
+    the transformation is row by row, so the result is the same as
+    transformer.transform(source_df). Without a usable stored output (first
+    export, older output version) every row is transformed. The fingerprints
+    and output of this export are stored for the next one.
+    
+    Args:
+        source_df: DataFrame from Celer export
+        name: Portfolio name the delta state is stored under
+        transformer: Column transformer
+        detector: Delta detector (default: DeltaDetector())
+        
+    Returns:
+        Transformed DataFrame
+    """
+    detector = detector or DeltaDetector()
+    delta = detector.detect(source_df, name, update=False)
+    reused = detector.reuse_output(delta, source_df, detector.load_output(name))
+    if reused is None:
+        transformed_df = transformer.transform(source_df)
+    else:
+        logger.info(f"Reusing {len(reused)} unchanged rows, transforming {len(delta.delta)} rows")
+        transformed_df = pd.concat([reused, transformer.transform(delta.delta)]).reindex(source_df.index)
+        # Categories are rebuilt from the rows of this export only
+        for column in transformer.categorical_output_columns:
+            transformed_df[column] = transformed_df[column].astype(object)
+        transformer.apply_categorical_dtypes(transformed_df)
+    
+    detector.save_fingerprints(name, delta.fingerprints)
+    detector.save_output(name, transformed_df, delta.fingerprints)
+    return transformed_df
+
+
+# Rows written per step, between two progress reports
+_WRITE_CHUNK_ROWS = 10000
+
+# Column width bounds (characters) of the output sheet
+_MAX_COLUMN_WIDTH = 50
+_COLUMN_PADDING = 2
+# Empty cells have always been measured as the text "None"
+_EMPTY_CELL_LENGTH = len(str(None))
+
+
+def column_widths(df: pd.DataFrame) -> List[int]:
+    """
+    Width of each output column: the longest header or value, padded and capped.
+    
+    Lengths are taken per column with vectorized string operations; empty
+    cells count as 4 characters, the length of "None", as they always have.
+    
+    Args:
+        df: DataFrame to be written
+        
+    Returns:
+        One width per column, in column order
+    """
+    widths = []
+    for column in df.columns:
+        values = df[column].dropna()
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Only the categories in use, each measured once
+            values = pd.Series(values.cat.remove_unused_categories().cat.categories)
+        elif pd.api.types.is_datetime64_any_dtype(values.dtype):
+            # Measured as written, with the time part
+            values = values.astype(object)
+        max_length = len(str(column))
+        if len(values) < len(df):
+            max_length = max(max_length, _EMPTY_CELL_LENGTH)
+        if len(values):
+            max_length = max(max_length, int(values.astype(str).str.len().max()))
+        widths.append(min(max_length + _COLUMN_PADDING, _MAX_COLUMN_WIDTH))
+    return widths
+
+
+def _cell_columns(df: pd.DataFrame) -> List[list]:
+    """Column values ready for openpyxl, with empty cells as None"""
+    return [
+        df[column].astype(object).where(df[column].notna(), None).tolist()
+        for column in df.columns
+    ]
+
+
+def write_output_file(
+    df: pd.DataFrame,
+    file_path: Path,
+    progress: Optional[ProgressCallback] = None
+) -> None:
     """
     Write transformed DataFrame to Excel file.
     
+    The sheet is streamed in openpyxl write-only mode, so memory does not
+    grow with the number of cells; column widths are computed from the
+    DataFrame before the first row is written.
+    
     Args:
         df: Transformed DataFrame
         file_path: Output file path
+        progress: Progress callback (done, total) in rows written (optional)
     """
-    try:
-        logger.info(f"Writing output file: {file_path}")
+    chunks = (df.iloc[start:start + _WRITE_CHUNK_ROWS] for start in range(0, len(df), _WRITE_CHUNK_ROWS))
+    _write_workbook(chunks, list(df.columns), column_widths(df), len(df), file_path, progress)
+
+
+def write_output_chunks(
+    chunks: Iterable[pd.DataFrame],
+    columns: List[str],
+    file_path: Path,
+    progress: Optional[ProgressCallback] = None
+) -> int:
+    """
+    Write the output workbook from a stream of transformed DataFrames.
+    
+    Column widths must be set before the first row of a write-only sheet,
+    so each chunk is measured and spooled to a temporary file as it
+    arrives, then read back and appended one chunk at a time: only one
+    chunk is held in memory.
+    
+    Args:
+        chunks: Transformed DataFrames, all with the given columns
+        columns: Output column names (header row, also for an empty stream)
+        file_path: Output file path
+        progress: Progress callback (done, total) in rows written (optional)
         
-        # Write to Excel with formatting
-        with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='Cartera_Transformada')
-            
-            # Get worksheet for formatting
-            worksheet = writer.sheets['Cartera_Transformada']
-            
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
-            
-            # Format header row
-            from openpyxl.styles import Font, PatternFill, Alignment
-            
-            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            header_font = Font(bold=True, color="FFFFFF")
-            
-            for cell in worksheet[1]:
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = Alignment(horizontal="center", vertical="center")
+    Returns:
+        Number of data rows written
+    """
+    widths = column_widths(pd.DataFrame(columns=columns))
+    total_rows = 0
+    chunk_count = 0
+    with tempfile.TemporaryFile() as spool:
+        for chunk in chunks:
+            widths = [max(width, chunk_width) for width, chunk_width in zip(widths, column_widths(chunk))]
+            pickle.dump(chunk, spool, protocol=pickle.HIGHEST_PROTOCOL)
+            total_rows += len(chunk)
+            chunk_count += 1
+        
+        spool.seek(0)
+        spooled = (pickle.load(spool) for _ in range(chunk_count))
+        _write_workbook(spooled, columns, widths, total_rows, file_path, progress)
+    return total_rows
+
+
+def _write_workbook(
+    chunks: Iterable[pd.DataFrame],
+    columns: List[str],
+    widths: List[int],
+    total_rows: int,
+    file_path: Path,
+    progress: Optional[ProgressCallback] = None
+) -> None:
+    """Write the header and the rows of each chunk to a write-only workbook"""
+    try:
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font, PatternFill, Alignment
+        from openpyxl.utils import get_column_letter
         
-        logger.info(f"Successfully wrote {len(df)} rows to {file_path}")
+        logger.info(f"Writing output file: {file_path}")
+        reporter = ProgressReporter(progress, total_rows)
+        
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet('Cartera_Transformada')
+        
+        # Auto-adjust column widths (must be set before any row is written)
+        for index, width in enumerate(widths, start=1):
+            worksheet.column_dimensions[get_column_letter(index)].width = width
+        
+        # Format header row
+        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        header_font = Font(bold=True, color="FFFFFF")
+        header_alignment = Alignment(horizontal="center", vertical="center")
+        header = []
+        for column in columns:
+            cell = WriteOnlyCell(worksheet, value=column)
+            cell.fill = header_fill
+            cell.font = header_font
+            cell.alignment = header_alignment
+            header.append(cell)
+        worksheet.append(header)
+        
+        # Data rows, chunk by chunk to report progress
+        rows_written = 0
+        for chunk in chunks:
+            reporter.update(rows_written)
+            for row in zip(*_cell_columns(chunk)):
+                worksheet.append(row)
+            rows_written += len(chunk)
+        
+        workbook.save(file_path)
+        reporter.finish()
+        logger.info(f"Successfully wrote {rows_written} rows to {file_path}")
         
     except Exception as e:
         error_msg = f"Error writing output file {file_path}: {str(e)}"
@@ -184,9 +562,66 @@ def write_output_file(df: pd.DataFrame, file_path: Path) -> None:
         raise FileProcessingError(error_msg)
 
 
+# Columnar copies of the output workbook (see write_sidecar_file)
+SIDECAR_FORMATS = ('parquet', 'feather')
+
+
+def write_sidecar_file(df: pd.DataFrame, output_file: Path, sidecar_format: str) -> Optional[Path]:
+    """
+    Write a columnar copy of the transformed DataFrame next to the output workbook.
+    
+    The sidecar has the workbook's name with a .parquet or .feather suffix
+    and keeps the exact columns and dtypes (categories, dates, text
+    policies with leading zeros). The conciliator reads it instead of the
+    workbook when it is at least as recent, skipping an Excel round trip.
+    
+    The sidecar is optional: when it cannot be written (pyarrow missing,
+    columns pyarrow cannot convert) the workbook is still the output, so a
+    warning is logged and the conciliator keeps reading the workbook.
+    
+    Args:
+        df: Transformed DataFrame
+        output_file: Output workbook path
+        sidecar_format: 'parquet' or 'feather' (see SIDECAR_FORMATS)
+        
+    Returns:
+        Path to the sidecar, or None if it was not written
+    """
+    sidecar_file = Path(output_file).with_suffix(f'.{sidecar_format}')
+    tmp_file = sidecar_file.with_name(f"{sidecar_file.name}.tmp")
+    try:
+        # Written after the workbook, so its modification time is not older
+        if sidecar_format == 'parquet':
+            df.to_parquet(tmp_file, index=False)
+        else:
+            df.reset_index(drop=True).to_feather(tmp_file)
+        os.replace(tmp_file, sidecar_file)
+        logger.info(f"Wrote {sidecar_format} sidecar: {sidecar_file}")
+        return sidecar_file
+        
+    except ImportError:
+        logger.warning(f"pyarrow is not installed, {sidecar_format} sidecar not written")
+        return None
+    except Exception as e:
+        tmp_file.unlink(missing_ok=True)
+        logger.warning(f"{sidecar_format} sidecar not written, the workbook is still valid: {str(e)}")
+        return None
+
+
+# Overall progress (percent) at the end of the read and transform stages
+# of a transformation; writing the output takes the rest
+_READ_STAGE_END = 70
+_TRANSFORM_STAGE_END = 75
+
+
 def transform_xlsx_format(
     input_file: Path,
-    output_file: Optional[Path] = None
+    output_file: Optional[Path] = None,
+    use_cache: bool = True,
+    progress: Optional[ProgressCallback] = None,
+    sidecar: Optional[str] = None,
+    on_transformed: Optional[Callable[[pd.DataFrame, Path], None]] = None,
+    delta: bool = False
 ) -> Path:
     """
     PROGRAM 1: Transform XLSX format files.
@@ -194,10 +629,23 @@ def transform_xlsx_format(
     Args:
         input_file: Path to input XLSX file
         output_file: Path to output file (optional)
+        use_cache: Reuse a previous parse of the same input (default: True)
+        progress: Progress callback (done, 100) over read, transform and write (optional)
+        sidecar: Also write a 'parquet' or 'feather' copy of the output next
+            to it, for the conciliator (optional, see write_sidecar_file)
+        on_transformed: Called with the transformed DataFrame and the output
+            path before the workbook is written, so the result can be used
+            in memory while it is saved (optional)
+        delta: Transform only the rows that changed since the previous
+            export with the same file name; the output is unchanged
+            (default: False, see transform_celer_delta)
         
     Returns:
         Path to the generated output file
     """
+    if sidecar is not None and sidecar not in SIDECAR_FORMATS:
+        raise ValueError(f"Unknown sidecar format '{sidecar}'. Expected one of {SIDECAR_FORMATS}")
+    
     try:
         # Setup
         setup_directories()
@@ -213,18 +661,34 @@ def transform_xlsx_format(
         logger.info(f"Input file: {input_file}")
         logger.info(f"Output file: {output_file}")
         
+        # Reject files that are not Celer exports before the full read
+        check_source_headers(input_file, "PROGRAM 1 - XLSX")
+        
         # Read XLSX file
-        source_df = read_celer_xlsx(input_file)
+        source_df = read_celer_xlsx(
+            input_file, use_cache=use_cache, progress=progress_stage(progress, 0, _READ_STAGE_END)
+        )
         
         # Initialize transformer
         transformer = ColumnTransformer()
         
         # Perform transformation
         logger.info("[PROGRAM 1 - XLSX] Starting column transformation...")
-        transformed_df = transformer.transform(source_df)
+        if delta:
+            transformed_df = transform_celer_delta(source_df, Path(input_file).stem, transformer)
+        else:
+            transformed_df = transformer.transform(source_df)
+        if progress is not None:
+            progress(_TRANSFORM_STAGE_END, 100)
+        if on_transformed is not None:
+            on_transformed(transformed_df, output_file)
         
         # Write output file
-        write_output_file(transformed_df, output_file)
+        write_output_file(
+            transformed_df, output_file, progress=progress_stage(progress, _TRANSFORM_STAGE_END, 100)
+        )
+        if sidecar is not None:
+            write_sidecar_file(transformed_df, output_file, sidecar)
         
         # Summary
         logger.info("="*80)
@@ -244,7 +708,13 @@ def transform_xlsx_format(
 
 def transform_xml_format(
     input_file: Path,
-    output_file: Optional[Path] = None
+    output_file: Optional[Path] = None,
+    chunk_rows: Optional[int] = None,
+    use_cache: bool = True,
+    progress: Optional[ProgressCallback] = None,
+    sidecar: Optional[str] = None,
+    on_transformed: Optional[Callable[[pd.DataFrame, Path], None]] = None,
+    delta: bool = False
 ) -> Path:
     """
     PROGRAM 2: Transform XML format files.
@@ -252,10 +722,30 @@ def transform_xml_format(
     Args:
         input_file: Path to input XML file
         output_file: Path to output file (optional)
+        chunk_rows: Stream the export through the transformer and into the
+            workbook in chunks of this many rows instead of loading the whole
+            portfolio (optional, not combined with sidecar, on_transformed or
+            delta, which need the whole DataFrame)
+        use_cache: Reuse a previous parse of the same input (default: True,
+            not used when streaming in chunks)
+        progress: Progress callback (done, 100) over read, transform and write (optional)
+        sidecar: Also write a 'parquet' or 'feather' copy of the output next
+            to it, for the conciliator (optional, see write_sidecar_file)
+        on_transformed: Called with the transformed DataFrame and the output
+            path before the workbook is written, so the result can be used
+            in memory while it is saved (optional)
+        delta: Transform only the rows that changed since the previous
+            export with the same file name; the output is unchanged
+            (default: False, see transform_celer_delta)
         
     Returns:
         Path to the generated output file
     """
+    if sidecar is not None and sidecar not in SIDECAR_FORMATS:
+        raise ValueError(f"Unknown sidecar format '{sidecar}'. Expected one of {SIDECAR_FORMATS}")
+    if chunk_rows and (sidecar is not None or on_transformed is not None or delta):
+        raise ValueError("sidecar, on_transformed and delta need the whole DataFrame, they cannot be used with chunk_rows")
+    
     try:
         # Setup
         setup_directories()
@@ -271,26 +761,56 @@ def transform_xml_format(
         logger.info(f"Input file: {input_file}")
         logger.info(f"Output file: {output_file}")
         
-        # Read XML file
-        source_df = read_celer_xml(input_file)
+        # Reject files that are not Celer exports before the full read
+        check_source_headers(input_file, "PROGRAM 2 - XML")
         
         # Initialize transformer
         transformer = ColumnTransformer()
-        
-        # Perform transformation
-        logger.info("[PROGRAM 2 - XML] Starting column transformation...")
-        transformed_df = transformer.transform(source_df)
-        
-        # Write output file
-        write_output_file(transformed_df, output_file)
+        read_progress = progress_stage(progress, 0, _READ_STAGE_END)
+        
+        if chunk_rows:
+            # Read, transform and write chunk by chunk: only one chunk of the
+            # 23 output columns is held in memory at a time
+            logger.info("[PROGRAM 2 - XML] Starting chunked column transformation...")
+            output_columns = [CELER_MAPPING.get_output_headers()[column] for column in OutputColumn]
+            input_rows = output_rows = write_output_chunks(
+                transformer.transform_chunks(iter_celer_xml(input_file, chunk_rows, read_progress)),
+                output_columns,
+                output_file,
+                progress=progress_stage(progress, _TRANSFORM_STAGE_END, 100)
+            )
+        else:
+            # Read XML file
+            source_df = read_celer_xml(input_file, use_cache=use_cache, progress=read_progress)
+            input_rows = len(source_df)
+            
+            # Perform transformation
+            logger.info("[PROGRAM 2 - XML] Starting column transformation...")
+            if delta:
+                transformed_df = transform_celer_delta(source_df, Path(input_file).stem, transformer)
+            else:
+                transformed_df = transformer.transform(source_df)
+            output_columns = list(transformed_df.columns)
+            output_rows = len(transformed_df)
+            if progress is not None:
+                progress(_TRANSFORM_STAGE_END, 100)
+            if on_transformed is not None:
+                on_transformed(transformed_df, output_file)
+            
+            # Write output file
+            write_output_file(
+                transformed_df, output_file, progress=progress_stage(progress, _TRANSFORM_STAGE_END, 100)
+            )
+            if sidecar is not None:
+                write_sidecar_file(transformed_df, output_file, sidecar)
         
         # Summary
         logger.info("="*80)
         logger.info("PROGRAM 2: TRANSFORMATION COMPLETED SUCCESSFULLY")
         logger.info("="*80)
-        logger.info(f"Input rows: {len(source_df)}")
-        logger.info(f"Output rows: {len(transformed_df)}")
-        logger.info(f"Output columns: {len(transformed_df.columns)}")
+        logger.info(f"Input rows: {input_rows}")
+        logger.info(f"Output rows: {output_rows}")
+        logger.info(f"Output columns: {len(output_columns)}")
         logger.info(f"Output file: {output_file.absolute()}")
         
         return output_file